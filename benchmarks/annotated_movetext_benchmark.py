@@ -0,0 +1,69 @@
+# Compares tokenizing plain and annotated ({ [%eval ...] [%clk ...] }) movetexts on a synthetic corpus,
+# and usable games per MB read when evaluated games are skipped or kept.
+# Run from the repository root: python -m benchmarks.annotated_movetext_benchmark
+import random
+import timeit
+
+from benchmarks.movetext_tokenizer_benchmark import generate_corpus
+from chess_io.movetext_tokenizer import tokenize_movetext
+
+# share of games with computer analysis in recent lichess dumps (roughly)
+EVALUATED_GAMES_SHARE = 0.1
+
+
+def annotate_movetext(rng: random.Random, movetext: str) -> str:
+    # "1. e4 e5 2. Nf3" -> "1. e4 { [%eval 0.17] [%clk 0:03:00] } 1... e5 { [%eval 0.2] [%clk 0:03:00] } 2. Nf3 ..."
+    tokens = movetext.split()
+    annotated_tokens = []
+    move_number = ""
+    for token in tokens[:-1]:
+        if token.endswith("."):
+            move_number = token
+            annotated_tokens.append(token)
+            continue
+
+        if annotated_tokens and not annotated_tokens[-1].endswith("."):
+            annotated_tokens.append(f"{move_number[:-1]}...")
+        annotated_tokens.append(token)
+        annotated_tokens.append(
+            f"{{ [%eval {rng.uniform(-3, 3):.2f}] [%clk 0:0{rng.randint(0, 2)}:{rng.randint(10, 59)}] }}"
+        )
+    annotated_tokens.append(tokens[-1])
+    return " ".join(annotated_tokens) + "\n"
+
+
+def run_benchmark() -> None:
+    rng = random.Random(0)
+    for plies, games_count in [(40, 20000), (120, 5000), (400, 1000)]:
+        plain_corpus = generate_corpus(games_count, plies)
+        annotated_corpus = [annotate_movetext(rng, movetext) for movetext in plain_corpus]
+        for plain_movetext, annotated_movetext in zip(plain_corpus, annotated_corpus):
+            if tokenize_movetext(plain_movetext) != tokenize_movetext(annotated_movetext):
+                raise AssertionError(f"Annotations change moves of: {annotated_movetext}")
+
+        plain_time = min(timeit.repeat(lambda: [tokenize_movetext(m) for m in plain_corpus], number=1, repeat=3))
+        annotated_time = min(
+            timeit.repeat(lambda: [tokenize_movetext(m) for m in annotated_corpus], number=1, repeat=3)
+        )
+        print(
+            f"up to {plies:3} plies, {games_count:5} games: "
+            f"plain {plain_time / games_count * 1e6:.1f}us/game, "
+            f"annotated {annotated_time / games_count * 1e6:.1f}us/game"
+        )
+
+    # mixed corpus: usable games per MB of movetext read
+    plain_corpus = generate_corpus(20000, 120)
+    mixed_corpus = [
+        annotate_movetext(rng, movetext) if rng.random() < EVALUATED_GAMES_SHARE else movetext
+        for movetext in plain_corpus
+    ]
+    megabytes_read = sum(len(movetext) for movetext in mixed_corpus) / 2**20
+    kept_when_skipping = sum(1 for movetext in mixed_corpus if movetext.find("eval") == -1)
+    print(
+        f"{EVALUATED_GAMES_SHARE:.0%} evaluated games: skipping {kept_when_skipping / megabytes_read:.0f} games/MB, "
+        f"keeping {len(mixed_corpus) / megabytes_read:.0f} games/MB"
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,70 @@
+# Compares the movetext tokenizer with the previous PGNReader movetext loop on a synthetic corpus.
+# Run from the repository root: python -m benchmarks.movetext_tokenizer_benchmark
+import random
+import timeit
+
+from chess_io.movetext_tokenizer import GAME_RESULTS, tokenize_movetext
+
+SYNTHETIC_MOVES = ["e4", "d5", "exd5", "Qxd5", "Nc3", "Qa5", "d4", "Nf6", "Nf3", "c6", "Bc4", "Bf5", "O-O", "e6"]
+
+
+def legacy_tokenize_movetext(line: str) -> tuple[list[str], list[str]]:
+    # movetext loop used by PGNReader.load_pngs_from_file before the tokenizer was introduced
+    possible_outcomes = ["1-0", "1/2-1/2", "0-1"]
+    w: list[str] = []
+    b: list[str] = []
+    while True:
+        space = line.find(" ")
+        if space == -1:
+            if line[:-1] in possible_outcomes and line[:-1] != b[-1] and line[:-1] != w[-1]:
+                if len(b) < len(w):
+                    b.append(line[:-1])
+                else:
+                    w.append(line[:-1])
+            break
+
+        line = line[space + 1 :]
+        space = line.find(" ")
+        w.append(line[:space])
+
+        line = line[space + 1 :]
+        space = line.find(" ")
+        b.append(line[:space])
+
+        line = line[space + 1 :]
+
+    return w, b
+
+
+def generate_movetext(rng: random.Random, plies: int) -> str:
+    tokens = []
+    for ply in range(plies):
+        if ply % 2 == 0:
+            tokens.append(f"{ply // 2 + 1}.")
+        tokens.append(rng.choice(SYNTHETIC_MOVES))
+    tokens.append(rng.choice(GAME_RESULTS))
+    return " ".join(tokens) + "\n"
+
+
+def generate_corpus(games_count: int, plies: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [generate_movetext(rng, rng.randint(plies // 2, plies)) for _ in range(games_count)]
+
+
+def run_benchmark() -> None:
+    for plies, games_count in [(40, 20000), (120, 5000), (400, 1000), (1200, 200)]:
+        corpus = generate_corpus(games_count, plies)
+        for movetext in corpus:
+            if legacy_tokenize_movetext(movetext) != tokenize_movetext(movetext):
+                raise AssertionError(f"Tokenizers disagree on: {movetext}")
+
+        legacy_time = min(timeit.repeat(lambda: [legacy_tokenize_movetext(m) for m in corpus], number=1, repeat=3))
+        new_time = min(timeit.repeat(lambda: [tokenize_movetext(m) for m in corpus], number=1, repeat=3))
+        print(
+            f"up to {plies:4} plies, {games_count:5} games: legacy {legacy_time:.3f}s, "
+            f"tokenizer {new_time:.3f}s, speedup x{legacy_time / new_time:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,237 @@
+from array import array
+from collections.abc import Sequence
+from multiprocessing import shared_memory
+from typing import Callable, Iterable, NamedTuple, Optional, Union, overload
+
+import numpy as np
+
+from chess_io.pgn_reader import PGNGame
+
+MAX_MOVES_VOCABULARY_SIZE = np.iinfo(np.uint16).max + 1
+
+
+class SharedGameStoreHandle(NamedTuple):
+    # only names of shared memory blocks and small vocabularies are sent to other processes
+    moves_memory_name: str
+    games_offsets_memory_name: str
+    openings_ids_memory_name: str
+    games_count: int
+    plies_count: int
+    moves_vocabulary: list[str]
+    openings_vocabulary: list[str]
+
+
+class GamesColumn(Sequence):
+    # Read-only list-like view over one column of the store, entries are decoded on access.
+    # The last decoded entry is kept: the visualizer reads the same game move after move.
+    def __init__(self, games_count: int, get_entry: Callable[[int], Union[str, list[str]]]) -> None:
+        self.__games_count = games_count
+        self.__get_entry = get_entry
+        self.__last_entry_idx: Optional[int] = None
+        self.__last_entry: Union[str, list[str]] = ""
+
+    def __len__(self) -> int:
+        return self.__games_count
+
+    @overload
+    def __getitem__(self, idx: int) -> Union[str, list[str]]:
+        ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[Union[str, list[str]]]:
+        ...
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[str, list[str], list[Union[str, list[str]]]]:
+        if isinstance(idx, slice):
+            return [self.__get_entry(i) for i in range(*idx.indices(self.__games_count))]
+
+        if idx < 0:
+            idx += self.__games_count
+        if not 0 <= idx < self.__games_count:
+            raise IndexError("Game index out of range")
+
+        if idx != self.__last_entry_idx:
+            self.__last_entry = self.__get_entry(idx)
+            self.__last_entry_idx = idx
+        return self.__last_entry
+
+
+class ColumnarGameStore:
+    # Games kept as columns instead of list[list[str]]:
+    # every ply (white and black moves interleaved, game result included) is an uint16 id of interned SAN,
+    # plies of game N are moves[games_offsets[N]:games_offsets[N + 1]], openings are int32 ids.
+    def __init__(self) -> None:
+        self.__moves_vocabulary: list[str] = []
+        self.__moves_ids: dict[str, int] = {}
+        self.__openings_vocabulary: list[str] = []
+        self.__openings_ids_by_name: dict[str, int] = {}
+
+        self.__moves = array("H")
+        self.__games_offsets = array("q", [0])
+        self.__openings_ids = array("i")
+        self.__shared_memory_blocks: list[shared_memory.SharedMemory] = []
+        self.__shared_columns: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.__get_columns()[2])
+
+    @property
+    def moves_vocabulary(self) -> list[str]:
+        return self.__moves_vocabulary
+
+    @property
+    def openings_vocabulary(self) -> list[str]:
+        return self.__openings_vocabulary
+
+    @property
+    def moves(self) -> np.ndarray:
+        return self.__get_columns()[0]
+
+    @property
+    def games_offsets(self) -> np.ndarray:
+        return self.__get_columns()[1]
+
+    @property
+    def openings_ids(self) -> np.ndarray:
+        return self.__get_columns()[2]
+
+    @property
+    def openings_names(self) -> GamesColumn:
+        return GamesColumn(len(self), self.get_opening_name)
+
+    @property
+    def white_moves(self) -> GamesColumn:
+        return GamesColumn(len(self), lambda idx: self.get_plies(idx)[0::2])
+
+    @property
+    def black_moves(self) -> GamesColumn:
+        return GamesColumn(len(self), lambda idx: self.get_plies(idx)[1::2])
+
+    def add_game(self, opening_name: str, white_moves: list[str], black_moves: list[str]) -> None:
+        if self.__shared_columns is not None:
+            raise RuntimeError("Store attached to shared memory is read-only")
+        if not 0 <= len(white_moves) - len(black_moves) <= 1:
+            raise ValueError(f"White and black moves don't alternate: {white_moves}, {black_moves}")
+
+        for ply_idx in range(len(white_moves) + len(black_moves)):
+            move = white_moves[ply_idx // 2] if ply_idx % 2 == 0 else black_moves[ply_idx // 2]
+            self.__moves.append(self.__get_move_id(move))
+
+        self.__games_offsets.append(len(self.__moves))
+        self.__openings_ids.append(self.__get_opening_id(opening_name))
+
+    def add_games(self, games: Iterable[PGNGame]) -> None:
+        for game in games:
+            self.add_game(*game)
+
+    def get_opening_name(self, game_idx: int) -> str:
+        return self.__openings_vocabulary[self.__get_columns()[2][game_idx]]
+
+    def get_plies(self, game_idx: int) -> list[str]:
+        moves, games_offsets, _ = self.__get_columns()
+        plies = moves[games_offsets[game_idx] : games_offsets[game_idx + 1]].tolist()
+        return [self.__moves_vocabulary[move_id] for move_id in plies]
+
+    def get_game(self, game_idx: int) -> PGNGame:
+        plies = self.get_plies(game_idx)
+        return PGNGame(self.get_opening_name(game_idx), plies[0::2], plies[1::2])
+
+    def get_openings_names_and_moves(self) -> tuple[GamesColumn, GamesColumn, GamesColumn]:
+        # drop-in replacement of PGNReader.get_openings_names_and_moves lists,
+        # e.g. for ChessVisualizer.set_visualization_games_database or opening_encoder
+        return self.openings_names, self.white_moves, self.black_moves
+
+    @staticmethod
+    def from_openings_names_and_moves(
+        openings_names: Sequence[str], white_moves: Sequence[list[str]], black_moves: Sequence[list[str]]
+    ) -> "ColumnarGameStore":
+        store = ColumnarGameStore()
+        for idx in range(len(openings_names)):
+            store.add_game(openings_names[idx], white_moves[idx], black_moves[idx])
+        return store
+
+    @staticmethod
+    def from_encoded_openings_names_and_moves(
+        openings_names_and_moves_encoded: Iterable[tuple[str, list[str], list[str]]]
+    ) -> "ColumnarGameStore":
+        store = ColumnarGameStore()
+        for opening_name, white_moves, black_moves in openings_names_and_moves_encoded:
+            store.add_game(opening_name, white_moves, black_moves)
+        return store
+
+    def to_shared_memory(self) -> SharedGameStoreHandle:
+        # Columns are copied once into shared memory blocks, the handle can be sent to worker processes,
+        # which attach to the same memory with from_shared_memory. Blocks live until release_shared_memory.
+        moves, games_offsets, openings_ids = self.__get_columns()
+        names = []
+        for column in (moves, games_offsets, openings_ids):
+            block = shared_memory.SharedMemory(create=True, size=max(column.nbytes, 1))
+            np.ndarray(column.shape, dtype=column.dtype, buffer=block.buf)[:] = column
+            self.__shared_memory_blocks.append(block)
+            names.append(block.name)
+
+        return SharedGameStoreHandle(
+            names[0],
+            names[1],
+            names[2],
+            len(openings_ids),
+            len(moves),
+            self.__moves_vocabulary,
+            self.__openings_vocabulary,
+        )
+
+    @staticmethod
+    def from_shared_memory(handle: SharedGameStoreHandle) -> "ColumnarGameStore":
+        store = ColumnarGameStore()
+        store.__moves_vocabulary = list(handle.moves_vocabulary)
+        store.__openings_vocabulary = list(handle.openings_vocabulary)
+
+        columns = []
+        for name, count, dtype in [
+            (handle.moves_memory_name, handle.plies_count, np.uint16),
+            (handle.games_offsets_memory_name, handle.games_count + 1, np.int64),
+            (handle.openings_ids_memory_name, handle.games_count, np.int32),
+        ]:
+            block = shared_memory.SharedMemory(name=name)
+            store.__shared_memory_blocks.append(block)
+            columns.append(np.ndarray((count,), dtype=dtype, buffer=block.buf))
+
+        store.__shared_columns = (columns[0], columns[1], columns[2])
+        return store
+
+    def release_shared_memory(self, unlink: bool = False) -> None:
+        # owner of the blocks (the store which created them) should unlink them
+        self.__shared_columns = None
+        for block in self.__shared_memory_blocks:
+            block.close()
+            if unlink:
+                block.unlink()
+        self.__shared_memory_blocks = []
+
+    def __get_columns(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self.__shared_columns is not None:
+            return self.__shared_columns
+
+        return (
+            np.frombuffer(self.__moves, dtype=np.uint16),
+            np.frombuffer(self.__games_offsets, dtype=np.int64),
+            np.frombuffer(self.__openings_ids, dtype=np.int32),
+        )
+
+    def __get_move_id(self, move: str) -> int:
+        move_id = self.__moves_ids.get(move)
+        if move_id is None:
+            move_id = len(self.__moves_vocabulary)
+            if move_id >= MAX_MOVES_VOCABULARY_SIZE:
+                raise OverflowError(f"More than {MAX_MOVES_VOCABULARY_SIZE} unique moves notations")
+            self.__moves_ids[move] = move_id
+            self.__moves_vocabulary.append(move)
+        return move_id
+
+    def __get_opening_id(self, opening_name: str) -> int:
+        opening_id = self.__openings_ids_by_name.get(opening_name)
+        if opening_id is None:
+            opening_id = len(self.__openings_vocabulary)
+            self.__openings_ids_by_name[opening_name] = opening_id
+            self.__openings_vocabulary.append(opening_name)
+        return opening_id
@@ -0,0 +1,139 @@
+import lzma
+import struct
+import zlib
+from array import array
+from typing import BinaryIO, Callable
+
+import numpy as np
+
+DEFAULT_BLOCK_SIZE = 256 * 1024
+MAX_CACHED_BLOCKS = 4
+
+# compression name -> (id stored in files, compress, decompress)
+BLOCK_COMPRESSIONS: dict[str, tuple[int, Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "zlib": (1, zlib.compress, zlib.decompress),
+    "lzma": (2, lzma.compress, lzma.decompress),
+}
+COMPRESSED_BLOCKS_HEADER = struct.Struct("<IIQQ")  # compression id, block size, blocks index position, blocks count
+BLOCKS_INDEX_DTYPE = np.dtype("<u8")
+
+
+def check_compression(compression: str) -> None:
+    # owners of files check it before opening (truncating) the file
+    if compression not in BLOCK_COMPRESSIONS:
+        raise ValueError(f"Unknown compression: {compression}, available: {list(BLOCK_COMPRESSIONS)}")
+
+
+def get_compression_functions(compression_id: int) -> tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    for known_compression_id, compress, decompress in BLOCK_COMPRESSIONS.values():
+        if known_compression_id == compression_id:
+            return compress, decompress
+    raise ValueError(f"Unknown compression id: {compression_id}")
+
+
+class CompressedBlocksWriter:
+    # Stream of bytes split into blocks of block_size uncompressed bytes, every block is compressed separately.
+    # The owner of the file writes its own magic and header first, then the blocks writer reserves its header
+    # at the current position of the file, right before the first block. Blocks index (compressed blocks offsets)
+    # is written after the blocks on close, which completes the reserved header with the index position.
+    def __init__(self, f: BinaryIO, compression: str, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+        check_compression(compression)
+
+        self.__file = f
+        self.__compression_id, self.__compress, _ = BLOCK_COMPRESSIONS[compression]
+        self.__block_size = block_size
+        self.__header_position = f.tell()
+        self.__file.write(COMPRESSED_BLOCKS_HEADER.pack(0, 0, 0, 0))
+        self.__buffer = bytearray()
+        self.__blocks_offsets = array("Q")
+
+    def tell(self) -> int:
+        # position in the uncompressed stream
+        return len(self.__blocks_offsets) * self.__block_size + len(self.__buffer)
+
+    def write(self, data: bytes) -> None:
+        self.__buffer += data
+        while len(self.__buffer) >= self.__block_size:
+            self.__write_block(bytes(self.__buffer[: self.__block_size]))
+            del self.__buffer[: self.__block_size]
+
+    def close(self) -> None:
+        # file stays open and positioned after the blocks index
+        if self.__buffer:
+            self.__write_block(bytes(self.__buffer))
+            self.__buffer = bytearray()
+
+        blocks_index_position = self.__file.tell()
+        self.__blocks_offsets.append(blocks_index_position)  # end of the last block
+        self.__file.write(np.frombuffer(self.__blocks_offsets, dtype=np.uint64).astype(BLOCKS_INDEX_DTYPE).tobytes())
+        end_position = self.__file.tell()
+
+        self.__file.seek(self.__header_position)
+        self.__file.write(
+            COMPRESSED_BLOCKS_HEADER.pack(
+                self.__compression_id, self.__block_size, blocks_index_position, len(self.__blocks_offsets) - 1
+            )
+        )
+        self.__file.seek(end_position)
+
+    def __write_block(self, block: bytes) -> None:
+        self.__blocks_offsets.append(self.__file.tell())
+        self.__file.write(self.__compress(block))
+
+
+class CompressedBlocksReader:
+    # Random access to the uncompressed stream, only blocks covering the read range are decompressed.
+    def __init__(self, filepath: str, header_position: int) -> None:
+        self.__file = open(filepath, "rb")
+        self.__file.seek(header_position)
+        compression_id, self.__block_size, blocks_index_position, blocks_count = COMPRESSED_BLOCKS_HEADER.unpack(
+            self.__file.read(COMPRESSED_BLOCKS_HEADER.size)
+        )
+        _, self.__decompress = get_compression_functions(compression_id)
+
+        self.__file.seek(blocks_index_position)
+        self.__blocks_offsets = np.frombuffer(
+            self.__file.read((blocks_count + 1) * BLOCKS_INDEX_DTYPE.itemsize), dtype=BLOCKS_INDEX_DTYPE
+        ).tolist()
+        self.__cached_blocks: dict[int, bytes] = {}
+        self.__decompressed_blocks_count = 0
+
+    @property
+    def decompressed_blocks_count(self) -> int:
+        return self.__decompressed_blocks_count
+
+    def get_end_position(self) -> int:
+        # position in the file right after the blocks index
+        return self.__blocks_offsets[-1] + len(self.__blocks_offsets) * BLOCKS_INDEX_DTYPE.itemsize
+
+    def read(self, position: int, length: int) -> bytes:
+        if length <= 0:
+            return b""
+
+        first_block_idx = position // self.__block_size
+        last_block_idx = (position + length - 1) // self.__block_size
+        if last_block_idx < len(self.__blocks_offsets) - 1:
+            data = b"".join(self.__get_block(block_idx) for block_idx in range(first_block_idx, last_block_idx + 1))
+            start = position - first_block_idx * self.__block_size
+            if len(data) >= start + length:
+                return data[start : start + length]
+        raise ValueError(f"Read of {length} bytes at {position} is beyond the end of the stream")
+
+    def close(self) -> None:
+        self.__file.close()
+        self.__cached_blocks = {}
+
+    def __get_block(self, block_idx: int) -> bytes:
+        block = self.__cached_blocks.get(block_idx)
+        if block is None:
+            self.__file.seek(self.__blocks_offsets[block_idx])
+            compressed_block = self.__file.read(
+                self.__blocks_offsets[block_idx + 1] - self.__blocks_offsets[block_idx]
+            )
+            block = self.__decompress(compressed_block)
+            self.__decompressed_blocks_count += 1
+
+            if len(self.__cached_blocks) >= MAX_CACHED_BLOCKS:
+                del self.__cached_blocks[next(iter(self.__cached_blocks))]
+            self.__cached_blocks[block_idx] = block
+        return block
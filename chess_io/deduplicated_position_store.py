@@ -0,0 +1,154 @@
+from typing import Iterable
+
+import numpy as np
+
+from chess_io.position_dataset import (
+    BOARD_SIZE,
+    LABELS_IDS_DTYPE,
+    SQUARES_DTYPE,
+    PositionDataset,
+    decode_position,
+    encode_positions,
+)
+
+SQUARES_COUNT = BOARD_SIZE * BOARD_SIZE
+POSITIONS_IDS_DTYPE = np.dtype("<i4")
+COUNTS_DTYPE = np.dtype("<i8")
+
+
+class DeduplicatedPositionStore:
+    # Every unique position is stored once, keyed by its 64 squares codes (hashed by the dict),
+    # with a sparse per-opening count vector: labels_counts[position id] = {label id: occurrences}.
+    # Training can use one weighted sample per (position, label) pair instead of every occurrence.
+    def __init__(self) -> None:
+        self.__positions_ids: dict[bytes, int] = {}
+        self.__squares = bytearray()
+        self.__labels_vocabulary: list[str] = []
+        self.__labels_ids_by_name: dict[str, int] = {}
+        self.__labels_counts: list[dict[int, int]] = []
+        self.__occurrences_count = 0
+
+    def __len__(self) -> int:
+        return len(self.__positions_ids)
+
+    @property
+    def occurrences_count(self) -> int:
+        return self.__occurrences_count
+
+    @property
+    def labels_vocabulary(self) -> list[str]:
+        return self.__labels_vocabulary
+
+    def add_position(self, label: str, position: list[list[str]], count: int = 1) -> None:
+        self.__add_encoded_position(self.__get_label_id(label), encode_positions([position]).tobytes(), count)
+
+    def add_database(self, database: Iterable[tuple[str, list[list[str]]]]) -> None:
+        # format of PositionWriter.database and PositionReader.read_from_file
+        self.add_dataset(PositionDataset.from_database(list(database)))
+
+    def add_dataset(self, dataset: PositionDataset) -> None:
+        labels_ids = [self.__get_label_id(label) for label in dataset.labels_vocabulary]
+        squares = np.ascontiguousarray(dataset.squares, dtype=SQUARES_DTYPE).reshape(-1, SQUARES_COUNT)
+        for position_squares, label_id in zip(squares, dataset.labels_ids.tolist()):
+            self.__add_encoded_position(labels_ids[label_id], position_squares.tobytes(), 1)
+
+    def get_squares(self) -> np.ndarray:
+        return np.frombuffer(bytes(self.__squares), dtype=SQUARES_DTYPE).reshape(-1, BOARD_SIZE, BOARD_SIZE)
+
+    def get_position(self, position_id: int) -> list[list[str]]:
+        # only the squares of the position are copied
+        position_id = self.__check_position_id(position_id)
+        position_squares = self.__squares[position_id * SQUARES_COUNT : (position_id + 1) * SQUARES_COUNT]
+        return decode_position(np.frombuffer(position_squares, dtype=SQUARES_DTYPE).reshape(BOARD_SIZE, BOARD_SIZE))
+
+    def get_labels_counts(self, position_id: int) -> dict[str, int]:
+        return {
+            self.__labels_vocabulary[label_id]: count
+            for label_id, count in self.__labels_counts[self.__check_position_id(position_id)].items()
+        }
+
+    def get_counts(self) -> np.ndarray:
+        # dense (positions, labels) matrix of occurrences
+        positions_ids, labels_ids, counts = self.__get_counts_columns()
+        dense_counts = np.zeros((len(self), len(self.__labels_vocabulary)), dtype=COUNTS_DTYPE)
+        dense_counts[positions_ids, labels_ids] = counts
+        return dense_counts
+
+    def get_weighted_samples(self) -> tuple[PositionDataset, np.ndarray]:
+        # one sample per (position, label) pair, weighted by the number of its occurrences,
+        # weighted loss over samples equals the loss over all stored occurrences
+        positions_ids, labels_ids, counts = self.__get_counts_columns()
+        dataset = PositionDataset(self.get_squares()[positions_ids], labels_ids, list(self.__labels_vocabulary))
+        return dataset, counts.astype(np.float32)
+
+    def save_to_file(self, filepath: str) -> None:
+        positions_ids, labels_ids, counts = self.__get_counts_columns()
+        with open(filepath, "wb") as f:
+            np.savez(
+                f,
+                squares=self.get_squares(),
+                positions_ids=positions_ids,
+                labels_ids=labels_ids,
+                counts=counts,
+                labels_vocabulary=np.array(self.__labels_vocabulary, dtype=str),
+            )
+
+    @staticmethod
+    def load_from_file(filepath: str) -> "DeduplicatedPositionStore":
+        store = DeduplicatedPositionStore()
+        with np.load(filepath, allow_pickle=False) as data:
+            for label in data["labels_vocabulary"].tolist():
+                store.__get_label_id(label)
+            for position_squares in data["squares"].reshape(-1, SQUARES_COUNT):
+                store.__get_position_id(position_squares.tobytes())
+            for position_id, label_id, count in zip(
+                data["positions_ids"].tolist(), data["labels_ids"].tolist(), data["counts"].tolist()
+            ):
+                store.__labels_counts[position_id][label_id] = count
+                store.__occurrences_count += count
+        return store
+
+    def __add_encoded_position(self, label_id: int, position_squares: bytes, count: int) -> None:
+        labels_counts = self.__labels_counts[self.__get_position_id(position_squares)]
+        labels_counts[label_id] = labels_counts.get(label_id, 0) + count
+        self.__occurrences_count += count
+
+    def __get_position_id(self, position_squares: bytes) -> int:
+        position_id = self.__positions_ids.get(position_squares)
+        if position_id is None:
+            position_id = len(self.__positions_ids)
+            self.__positions_ids[position_squares] = position_id
+            self.__squares += position_squares
+            self.__labels_counts.append({})
+        return position_id
+
+    def __check_position_id(self, position_id: int) -> int:
+        if position_id < 0:
+            position_id += len(self)
+        if not 0 <= position_id < len(self):
+            raise IndexError("Position id out of range")
+        return position_id
+
+    def __get_label_id(self, label: str) -> int:
+        label_id = self.__labels_ids_by_name.get(label)
+        if label_id is None:
+            label_id = len(self.__labels_vocabulary)
+            self.__labels_ids_by_name[label] = label_id
+            self.__labels_vocabulary.append(label)
+        return label_id
+
+    def __get_counts_columns(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # (position id, label id) pairs in order of positions, then labels
+        positions_ids: list[int] = []
+        labels_ids: list[int] = []
+        counts: list[int] = []
+        for position_id, labels_counts in enumerate(self.__labels_counts):
+            for label_id in sorted(labels_counts):
+                positions_ids.append(position_id)
+                labels_ids.append(label_id)
+                counts.append(labels_counts[label_id])
+        return (
+            np.array(positions_ids, dtype=POSITIONS_IDS_DTYPE),
+            np.array(labels_ids, dtype=LABELS_IDS_DTYPE),
+            np.array(counts, dtype=COUNTS_DTYPE),
+        )
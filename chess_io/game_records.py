@@ -0,0 +1,191 @@
+import struct
+from array import array
+from types import TracebackType
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+import numpy as np
+
+from chess_io.columnar_game_store import GamesColumn
+from chess_io.compressed_blocks import (
+    DEFAULT_BLOCK_SIZE,
+    CompressedBlocksReader,
+    CompressedBlocksWriter,
+    check_compression,
+)
+from chess_io.pgn_reader import PGNGame
+
+GAME_RECORDS_FILE_MAGIC = b"GAMEREC1"
+GAME_RECORDS_COMPRESSED_FILE_MAGIC = b"GAMERECZ"  # records stream split into compressed blocks
+GAME_RECORDS_FILE_HEADER = struct.Struct("<QQ")  # games count, offsets index position (0 until the file is closed)
+RECORD_LENGTH = struct.Struct("<I")
+OFFSETS_DTYPE = np.dtype("<u8")
+
+
+def is_game_records_file(filepath: str) -> bool:
+    with open(filepath, "rb") as f:
+        return f.read(len(GAME_RECORDS_FILE_MAGIC)) in (GAME_RECORDS_FILE_MAGIC, GAME_RECORDS_COMPRESSED_FILE_MAGIC)
+
+
+def encode_game_record(opening_name: str, white_moves: list[str], black_moves: list[str]) -> bytes:
+    # SAN moves have no whitespaces: "opening name\nwhite moves\nblack moves"
+    return f"{opening_name}\n{' '.join(white_moves)}\n{' '.join(black_moves)}".encode("utf-8")
+
+
+def decode_game_record(record: bytes) -> PGNGame:
+    opening_name, white_moves, black_moves = record.decode("utf-8").split("\n")
+    return PGNGame(opening_name, white_moves.split(), black_moves.split())
+
+
+class GameRecordsWriter:
+    # File of length-prefixed game records, written one game at a time (nothing is accumulated).
+    # On close, offsets of the records are appended and the header is completed.
+    # With compression ("zlib" or "lzma"), records are written to compressed blocks and offsets point
+    # to the uncompressed records stream.
+    def __init__(self, filepath: str, compression: Optional[str] = None, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+        if compression:
+            check_compression(compression)
+        self.__file = open(filepath, "wb")
+        self.__file.write(GAME_RECORDS_COMPRESSED_FILE_MAGIC if compression else GAME_RECORDS_FILE_MAGIC)
+        self.__file.write(GAME_RECORDS_FILE_HEADER.pack(0, 0))
+        self.__blocks_writer = CompressedBlocksWriter(self.__file, compression, block_size) if compression else None
+        self.__offsets = array("Q")
+
+    def __enter__(self) -> "GameRecordsWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def write_game(self, opening_name: str, white_moves: list[str], black_moves: list[str]) -> None:
+        record = encode_game_record(opening_name, white_moves, black_moves)
+        if self.__blocks_writer is not None:
+            self.__offsets.append(self.__blocks_writer.tell())
+            self.__blocks_writer.write(RECORD_LENGTH.pack(len(record)) + record)
+        else:
+            self.__offsets.append(self.__file.tell())
+            self.__file.write(RECORD_LENGTH.pack(len(record)))
+            self.__file.write(record)
+
+    def write_games(self, games: Iterable[tuple[str, list[str], list[str]]]) -> None:
+        for opening_name, white_moves, black_moves in games:
+            self.write_game(opening_name, white_moves, black_moves)
+
+    def close(self) -> None:
+        if self.__file.closed:
+            return
+
+        if self.__blocks_writer is not None:
+            self.__blocks_writer.close()
+        offsets_index_position = self.__file.tell()
+        self.__file.write(np.frombuffer(self.__offsets, dtype=np.uint64).astype(OFFSETS_DTYPE).tobytes())
+        self.__file.seek(len(GAME_RECORDS_FILE_MAGIC))
+        self.__file.write(GAME_RECORDS_FILE_HEADER.pack(len(self.__offsets), offsets_index_position))
+        self.__file.close()
+
+
+class GameRecordsReader:
+    # Games of a records file are decoded only when accessed:
+    # iter_games streams the records from the start, get_game seeks to the record using the offsets index.
+    # Columns of get_openings_names_and_moves are lazy sequences for the visualizer and rollout.
+    def __init__(self, filepath: str) -> None:
+        self.__filepath = filepath
+        with open(filepath, "rb") as f:
+            magic = f.read(len(GAME_RECORDS_FILE_MAGIC))
+            if magic not in (GAME_RECORDS_FILE_MAGIC, GAME_RECORDS_COMPRESSED_FILE_MAGIC):
+                raise ValueError(f"Not a game records file: {filepath}")
+            games_count, offsets_index_position = GAME_RECORDS_FILE_HEADER.unpack(
+                f.read(GAME_RECORDS_FILE_HEADER.size)
+            )
+
+        if not offsets_index_position:
+            raise ValueError(f"Game records file was not closed by its writer: {filepath}")
+
+        self.__blocks_reader = (
+            CompressedBlocksReader(filepath, len(magic) + GAME_RECORDS_FILE_HEADER.size)
+            if magic == GAME_RECORDS_COMPRESSED_FILE_MAGIC
+            else None
+        )
+
+        self.__offsets_index_position = offsets_index_position
+        self.__offsets = (
+            np.memmap(filepath, dtype=OFFSETS_DTYPE, mode="r", offset=offsets_index_position, shape=(games_count,))
+            if games_count
+            else np.zeros(0, dtype=OFFSETS_DTYPE)
+        )
+        self.__file: Optional[BinaryIO] = None
+        # the visualizer reads the same game move after move
+        self.__last_game_idx: Optional[int] = None
+        self.__last_game: Optional[PGNGame] = None
+
+    def __len__(self) -> int:
+        return len(self.__offsets)
+
+    def __enter__(self) -> "GameRecordsReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def iter_games(self) -> Iterator[PGNGame]:
+        if self.__blocks_reader is not None:
+            # blocks are decompressed one after another, the last ones are cached by the blocks reader
+            for game_idx in range(len(self)):
+                yield self.__read_game(game_idx)
+            return
+
+        with open(self.__filepath, "rb") as f:
+            f.seek(len(GAME_RECORDS_FILE_MAGIC) + GAME_RECORDS_FILE_HEADER.size)
+            while f.tell() < self.__offsets_index_position:
+                (record_length,) = RECORD_LENGTH.unpack(f.read(RECORD_LENGTH.size))
+                yield decode_game_record(f.read(record_length))
+
+    def get_game(self, game_idx: int) -> PGNGame:
+        if game_idx < 0:
+            game_idx += len(self)
+        if not 0 <= game_idx < len(self):
+            raise IndexError("Game index out of range")
+
+        if game_idx != self.__last_game_idx or self.__last_game is None:
+            self.__last_game = self.__read_game(game_idx)
+            self.__last_game_idx = game_idx
+
+        return self.__last_game
+
+    def __read_game(self, game_idx: int) -> PGNGame:
+        offset = int(self.__offsets[game_idx])
+        (record_length,) = RECORD_LENGTH.unpack(self.__read(offset, RECORD_LENGTH.size))
+        return decode_game_record(self.__read(offset + RECORD_LENGTH.size, record_length))
+
+    def __read(self, position: int, length: int) -> bytes:
+        if self.__blocks_reader is not None:
+            return self.__blocks_reader.read(position, length)
+
+        if self.__file is None:
+            self.__file = open(self.__filepath, "rb")
+        self.__file.seek(position)
+        return self.__file.read(length)
+
+    def get_openings_names_and_moves(self) -> tuple[GamesColumn, GamesColumn, GamesColumn]:
+        # drop-in replacement of opening_encoder.get_decoded_openings_names_and_moves lists
+        return (
+            GamesColumn(len(self), lambda idx: self.get_game(idx).opening_name),
+            GamesColumn(len(self), lambda idx: self.get_game(idx).white_moves),
+            GamesColumn(len(self), lambda idx: self.get_game(idx).black_moves),
+        )
+
+    def close(self) -> None:
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+        if self.__blocks_reader is not None:
+            self.__blocks_reader.close()
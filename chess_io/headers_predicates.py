@@ -0,0 +1,82 @@
+import operator
+from typing import Any, Callable, Optional, Union
+
+HeaderValue = Union[str, int, float]
+
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda header_value, values: header_value in values,
+    "not in": lambda header_value, values: header_value not in values,
+    "contains": lambda header_value, value: value in header_value,
+}
+
+# lichess speed categories, based on the estimated game duration: base + 40 * increment (in seconds)
+SPEED_HEADER = "Speed"
+SPEEDS_LIMITS = [(29, "ultraBullet"), (179, "bullet"), (479, "blitz"), (1499, "rapid")]
+
+
+def get_speed(time_control: str) -> Optional[str]:
+    # e.g. "300+3" -> "blitz", "-" (correspondence) -> None
+    base, _, increment = time_control.partition("+")
+    if not base.isdigit() or not increment.isdigit():
+        return None
+
+    estimated_duration = int(base) + 40 * int(increment)
+    for limit, speed in SPEEDS_LIMITS:
+        if estimated_duration <= limit:
+            return speed
+    return "classical"
+
+
+class HeaderPredicate:
+    # Declarative condition over a PGN header, e.g. HeaderPredicate("WhiteElo", ">=", 1800).
+    # Numeric values compare headers as numbers, games with missing or unknown ("?") values are rejected.
+    # "Speed" is derived from "TimeControl": ultraBullet, bullet, blitz, rapid or classical.
+    def __init__(self, header: str, operator_name: str, value: Union[HeaderValue, list[HeaderValue]]) -> None:
+        if operator_name not in OPERATORS:
+            raise ValueError(f"Unknown operator: {operator_name}, available: {list(OPERATORS)}")
+
+        self.header = header
+        self.operator_name = operator_name
+        self.value = value
+        compared_values = value if isinstance(value, list) else [value]
+        self.__is_numeric = all(isinstance(v, (int, float)) for v in compared_values)
+
+    def __repr__(self) -> str:
+        return f"HeaderPredicate({self.header!r}, {self.operator_name!r}, {self.value!r})"
+
+    def is_satisfied(self, headers: dict[str, str]) -> bool:
+        if self.header == SPEED_HEADER:
+            header_value: Optional[HeaderValue] = get_speed(headers.get("TimeControl", ""))
+        else:
+            header_value = headers.get(self.header)
+
+        if header_value is None:
+            return False
+
+        if self.__is_numeric:
+            try:
+                header_value = float(header_value)
+            except ValueError:
+                return False
+
+        return OPERATORS[self.operator_name](header_value, self.value)
+
+
+def min_elo(elo: int) -> list[HeaderPredicate]:
+    return [HeaderPredicate("WhiteElo", ">=", elo), HeaderPredicate("BlackElo", ">=", elo)]
+
+
+def played_between(first_date: str, last_date: str) -> list[HeaderPredicate]:
+    # dates in PGN format: "2017.01.31"
+    return [HeaderPredicate("UTCDate", ">=", first_date), HeaderPredicate("UTCDate", "<=", last_date)]
+
+
+def parse_header_line(line: str) -> tuple[str, str]:
+    # '[WhiteElo "1711"]' -> ("WhiteElo", "1711")
+    return line[1 : line.find(" ")], line[line.find('"') + 1 : line.rfind('"')]
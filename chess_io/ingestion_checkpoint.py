@@ -0,0 +1,88 @@
+import json
+import os
+import pickle
+from typing import Any, Iterator
+
+GAMES_FILE_EXTENSION = ".games"
+
+
+class IngestionCheckpoint:
+    # Durable progress of a long PGN ingestion:
+    # - games file: pickled chunks of already parsed games, appended and fsynced on every checkpoint,
+    # - checkpoint file: offset in the PGN where parsing resumes and the valid size of the games file,
+    #   replaced atomically, so it always describes completely written chunks.
+    def __init__(self, checkpoint_filepath: str, description: dict[str, Any]) -> None:
+        self.__checkpoint_filepath = checkpoint_filepath
+        self.__games_filepath = checkpoint_filepath + GAMES_FILE_EXTENSION
+        self.__description = description  # what is being ingested, checkpoint of other ingestion is not used
+        self.__offset = 0
+        self.__games_count = 0
+        self.__games_file_size = 0
+
+    @property
+    def offset(self) -> int:
+        return self.__offset
+
+    @property
+    def games_count(self) -> int:
+        return self.__games_count
+
+    def load(self) -> bool:
+        if not os.path.exists(self.__checkpoint_filepath):
+            return False
+
+        with open(self.__checkpoint_filepath) as f:
+            state = json.load(f)
+
+        if state["description"] != self.__description:
+            raise ValueError(
+                f"Checkpoint {self.__checkpoint_filepath} was made for different ingestion: {state['description']}"
+            )
+
+        self.__offset = state["offset"]
+        self.__games_count = state["games_count"]
+        self.__games_file_size = state["games_file_size"]
+
+        # chunk written after the last checkpoint (interrupted run) is dropped
+        with open(self.__games_filepath, "ab") as f:
+            f.truncate(self.__games_file_size)
+        return True
+
+    def iter_saved_games_chunks(self) -> Iterator[list]:
+        if not os.path.exists(self.__games_filepath):
+            return
+
+        with open(self.__games_filepath, "rb") as f:
+            while f.tell() < self.__games_file_size:
+                yield pickle.load(f)
+
+    def save(self, games_chunk: list, offset: int) -> None:
+        with open(self.__games_filepath, "ab") as f:
+            f.truncate(self.__games_file_size)
+            pickle.dump(games_chunk, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+            games_file_size = f.tell()
+
+        games_count = self.__games_count + len(games_chunk)
+        state = {
+            "description": self.__description,
+            "offset": offset,
+            "games_count": games_count,
+            "games_file_size": games_file_size,
+        }
+        temporary_filepath = self.__checkpoint_filepath + ".tmp"
+        with open(temporary_filepath, "w") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_filepath, self.__checkpoint_filepath)
+
+        self.__offset = offset
+        self.__games_count = games_count
+        self.__games_file_size = games_file_size
+
+    def remove(self) -> None:
+        for filepath in (self.__checkpoint_filepath, self.__games_filepath):
+            if os.path.exists(filepath):
+                os.remove(filepath)
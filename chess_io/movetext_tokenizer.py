@@ -0,0 +1,58 @@
+import re
+
+GAME_RESULTS = ("1-0", "1/2-1/2", "0-1")
+
+# {comments}, ;comments till the end of line and $NAGs
+_ANNOTATIONS_PATTERN = re.compile(r"\{[^}]*\}?|;[^\n]*|\$\d+")
+# innermost (variation), nested ones are removed from the inside out
+_VARIATION_PATTERN = re.compile(r"\([^()]*\)")
+# SAN moves start with a letter, unlike move numbers ("12.", "12...") and results,
+# move can be glued to its number ("1.e4") and followed by glyphs ("e4!?")
+_MOVE_PATTERN = re.compile(r"(?<![^\s.])[A-Za-z][^\s!?{}();$]*")
+
+
+def strip_annotations(movetext: str) -> str:
+    if "{" in movetext or ";" in movetext or "$" in movetext:
+        movetext = _ANNOTATIONS_PATTERN.sub(" ", movetext)
+
+    while "(" in movetext:
+        movetext, substitutions_count = _VARIATION_PATTERN.subn(" ", movetext)
+        if substitutions_count == 0:
+            # unbalanced variation, dropping everything after it
+            movetext = movetext[: movetext.find("(")]
+
+    return movetext
+
+
+def has_moves(movetext: str) -> bool:
+    # cheaper than tokenizing, annotations are stripped only when they precede the first move
+    match = _MOVE_PATTERN.search(movetext)
+    if match is not None and not _has_annotations(movetext[: match.start()]):
+        return True
+    if not _has_annotations(movetext):
+        return False
+    return _MOVE_PATTERN.search(strip_annotations(movetext)) is not None
+
+
+def _has_annotations(movetext: str) -> bool:
+    return "{" in movetext or ";" in movetext or "$" in movetext or "(" in movetext
+
+
+def tokenize_movetext(movetext: str) -> tuple[list[str], list[str]]:
+    # Single pass over the movetext (which can span many lines), returns white and black moves.
+    # Game result is appended to the side which would make the next move, as the visualizer expects it.
+    movetext = strip_annotations(movetext)
+    moves = _MOVE_PATTERN.findall(movetext)
+
+    white_moves = moves[0::2]
+    black_moves = moves[1::2]
+
+    last_tokens = movetext.rsplit(None, 1)
+    result = last_tokens[-1] if last_tokens else ""
+    if result in GAME_RESULTS:
+        if len(black_moves) < len(white_moves):
+            black_moves.append(result)
+        else:
+            white_moves.append(result)
+
+    return white_moves, black_moves
@@ -0,0 +1,92 @@
+from typing import Optional
+
+MAX_CACHED_OPENINGS_NAMES = 100000
+
+
+class OpeningsNamesFilter:
+    # Filter compiled once for all "[Opening" headers of the file:
+    # exact mode is a hash set lookup, substring mode is an Aho-Corasick automaton
+    # returning the first (in the filter list order) filter which is a substring of the opening name.
+    def __init__(self, openings_names: list[str], is_substring: bool) -> None:
+        self.__openings_names = list(openings_names)
+        self.__is_substring = is_substring
+        self.__exact_openings_names = frozenset(openings_names)
+
+        # automaton states: transitions, fail links and the first matched filter index (if any)
+        self.__transitions: list[dict[str, int]] = [{}]
+        self.__fail_links: list[int] = [0]
+        self.__first_match: list[Optional[int]] = [None]
+        # openings names repeat a lot, there are just a few thousand of unique ones in a lichess dump
+        self.__cache: dict[str, tuple[bool, str]] = {}
+
+        if is_substring:
+            self.__build_automaton()
+
+    def __bool__(self) -> bool:
+        return bool(self.__openings_names)
+
+    def match(self, opening: str) -> tuple[bool, str]:
+        if not self.__is_substring:
+            return opening in self.__exact_openings_names, ""
+
+        result = self.__cache.get(opening)
+        if result is None:
+            filter_idx = self.__find_first_filter_idx(opening)
+            result = (False, "") if filter_idx is None else (True, self.__openings_names[filter_idx])
+
+            if len(self.__cache) >= MAX_CACHED_OPENINGS_NAMES:
+                self.__cache.clear()
+            self.__cache[opening] = result
+
+        return result
+
+    def __build_automaton(self) -> None:
+        for filter_idx, opening_filter in enumerate(self.__openings_names):
+            state = 0
+            for character in opening_filter:
+                next_state = self.__transitions[state].get(character)
+                if next_state is None:
+                    next_state = len(self.__transitions)
+                    self.__transitions[state][character] = next_state
+                    self.__transitions.append({})
+                    self.__fail_links.append(0)
+                    self.__first_match.append(None)
+                state = next_state
+            self.__first_match[state] = self.__get_first(self.__first_match[state], filter_idx)
+
+        # breadth-first, so fail link targets (shorter suffixes) are complete before they are used
+        queue = list(self.__transitions[0].values())
+        for state in queue:
+            for character, next_state in self.__transitions[state].items():
+                fail_state = self.__fail_links[state]
+                while character not in self.__transitions[fail_state] and fail_state != 0:
+                    fail_state = self.__fail_links[fail_state]
+                fail_state = self.__transitions[fail_state].get(character, 0)
+
+                self.__fail_links[next_state] = fail_state
+                self.__first_match[next_state] = self.__get_first(
+                    self.__first_match[next_state], self.__first_match[fail_state]
+                )
+                queue.append(next_state)
+
+    def __find_first_filter_idx(self, opening: str) -> Optional[int]:
+        first_match = self.__first_match[0]  # empty filter matches everything
+        state = 0
+        for character in opening:
+            while character not in self.__transitions[state] and state != 0:
+                state = self.__fail_links[state]
+            state = self.__transitions[state].get(character, 0)
+
+            first_match = self.__get_first(first_match, self.__first_match[state])
+            if first_match == 0:
+                break
+
+        return first_match
+
+    @staticmethod
+    def __get_first(first: Optional[int], second: Optional[int]) -> Optional[int]:
+        if first is None:
+            return second
+        if second is None:
+            return first
+        return min(first, second)
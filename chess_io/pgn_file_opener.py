@@ -0,0 +1,64 @@
+import bz2
+import gzip
+import io
+import lzma
+from typing import BinaryIO, Callable, TextIO
+
+try:
+    import zstandard
+except ImportError:  # optional, only needed for .zst lichess dumps
+    zstandard = None  # type: ignore[assignment]
+
+READ_BUFFER_SIZE = 4 * 1024 * 1024
+PGN_ENCODING = "utf-8"
+
+
+def _open_zstd(filepath: str) -> io.BufferedIOBase:
+    if zstandard is None:
+        raise ModuleNotFoundError(f"zstandard module is required to read {filepath}, pip install zstandard")
+
+    decompressor = zstandard.ZstdDecompressor()
+    reader = decompressor.stream_reader(open(filepath, "rb"), read_size=READ_BUFFER_SIZE, closefd=True)
+    return reader  # type: ignore[return-value]
+
+
+COMPRESSED_FILE_OPENERS: dict[str, Callable[[str], io.BufferedIOBase]] = {
+    ".bz2": lambda filepath: bz2.BZ2File(filepath, "rb"),
+    ".gz": lambda filepath: gzip.GzipFile(filepath, "rb"),
+    ".xz": lambda filepath: lzma.LZMAFile(filepath, "rb"),
+    ".lzma": lambda filepath: lzma.LZMAFile(filepath, "rb"),
+    ".zst": _open_zstd,
+}
+
+
+def is_compressed(filepath: str) -> bool:
+    return any(filepath.endswith(extension) for extension in COMPRESSED_FILE_OPENERS)
+
+
+def open_pgn_file_binary(filepath: str) -> BinaryIO:
+    # decompression happens while reading, nothing is written to the disk
+    for extension, opener in COMPRESSED_FILE_OPENERS.items():
+        if filepath.endswith(extension):
+            return io.BufferedReader(opener(filepath), buffer_size=READ_BUFFER_SIZE)  # type: ignore[arg-type]
+
+    return open(filepath, "rb", buffering=READ_BUFFER_SIZE)
+
+
+def open_pgn_file(filepath: str) -> TextIO:
+    if not is_compressed(filepath):
+        return open(filepath, encoding=PGN_ENCODING, buffering=READ_BUFFER_SIZE)
+
+    return io.TextIOWrapper(open_pgn_file_binary(filepath), encoding=PGN_ENCODING)
+
+
+def skip_to_offset(f: BinaryIO, offset: int) -> None:
+    # compressed streams are decompressed up to the offset
+    if f.seekable():
+        f.seek(offset)
+        return
+
+    while offset > 0:
+        skipped = len(f.read(min(offset, READ_BUFFER_SIZE)))
+        if skipped == 0:
+            raise EOFError(f"Offset {offset} bytes after the end of the file")
+        offset -= skipped
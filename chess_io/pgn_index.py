@@ -0,0 +1,202 @@
+import logging
+import os
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterator, Optional
+
+from chess_io.pgn_file_opener import is_compressed
+from chess_io.pgn_reader import GAME_START_MARK, PGNGame, PGNReader
+
+INDEX_FILE_EXTENSION = ".idx"
+INDEX_FILE_MAGIC = b"PGNIDX2\n"
+# games count, openings names block size, size and modification time (ns) of the indexed PGN file
+INDEX_FILE_HEADER = struct.Struct("<QQQQ")
+OPENING_MARK = b'[Opening "'
+
+
+class PGNIndex:
+    # Sidecar index of a PGN file: byte offset, length and opening of every game.
+    # Game N (or all games of an opening) is read by seeking instead of reading the file from the start.
+    def __init__(self, pgn_filepath: str) -> None:
+        if is_compressed(pgn_filepath):
+            raise ValueError(f"Compressed file can't be indexed, decompress it first: {pgn_filepath}")
+
+        self.__pgn_filepath = pgn_filepath
+        self.__offsets = array("Q")
+        self.__lengths = array("I")
+        self.__openings_ids = array("I")
+        self.__openings_names: list[str] = []
+        self.__openings_ids_by_name: dict[str, int] = {}
+        self.__games_indices_by_opening_id: Optional[dict[int, list[int]]] = None
+        # fingerprint of the PGN file when it was indexed, index of a changed file is stale
+        self.__pgn_file_size = 0
+        self.__pgn_file_mtime_ns = 0
+        self.__reset()
+
+        logging.basicConfig(level=logging.INFO)
+        self.__logger = logging.getLogger(__name__)
+
+    def __len__(self) -> int:
+        return len(self.__offsets)
+
+    @property
+    def pgn_filepath(self) -> str:
+        return self.__pgn_filepath
+
+    @property
+    def openings_names(self) -> list[str]:
+        return self.__openings_names
+
+    def get_default_index_filepath(self) -> str:
+        return self.__pgn_filepath + INDEX_FILE_EXTENSION
+
+    def build(self) -> None:
+        self.__logger.info(f"Building index of file: {self.__pgn_filepath}")
+        self.__reset()
+        self.__pgn_file_size, self.__pgn_file_mtime_ns = self.__get_pgn_file_fingerprint()
+
+        game_start = None
+        opening_id = 0
+        position = 0
+        with open(self.__pgn_filepath, "rb") as f:
+            for line in f:
+                if line.startswith(GAME_START_MARK):
+                    if game_start is not None:
+                        self.__add_game(game_start, position - game_start, opening_id)
+                    game_start = position
+                    opening_id = 0
+                elif line.startswith(OPENING_MARK):
+                    opening_id = self.__get_opening_id(line[len(OPENING_MARK) :].rstrip()[:-2].decode("utf-8"))
+                position += len(line)
+
+        if game_start is not None:
+            self.__add_game(game_start, position - game_start, opening_id)
+
+        self.__logger.info(f"Indexed {len(self)} games of {len(self.__openings_names)} openings")
+
+    def load_or_build(self, index_filepath: Optional[str] = None) -> None:
+        # missing, stale (PGN file changed after indexing) or unreadable index is rebuilt
+        try:
+            self.load_from_file(index_filepath)
+        except FileNotFoundError:
+            self.build()
+            self.save_to_file(index_filepath)
+        except ValueError as e:
+            self.__logger.info(f"Rebuilding index: {e}")
+            self.build()
+            self.save_to_file(index_filepath)
+
+    def save_to_file(self, index_filepath: Optional[str] = None) -> None:
+        openings_names_block = "\n".join(self.__openings_names).encode("utf-8")
+        with open(index_filepath or self.get_default_index_filepath(), "wb") as f:
+            f.write(INDEX_FILE_MAGIC)
+            f.write(
+                INDEX_FILE_HEADER.pack(
+                    len(self), len(openings_names_block), self.__pgn_file_size, self.__pgn_file_mtime_ns
+                )
+            )
+            f.write(openings_names_block)
+            for column in (self.__offsets, self.__lengths, self.__openings_ids):
+                self.__write_little_endian(f, column)
+
+    def load_from_file(self, index_filepath: Optional[str] = None) -> None:
+        index_filepath = index_filepath or self.get_default_index_filepath()
+        with open(index_filepath, "rb") as f:
+            if f.read(len(INDEX_FILE_MAGIC)) != INDEX_FILE_MAGIC:
+                raise ValueError(f"Not a PGN index file: {index_filepath}")
+
+            games_count, openings_names_block_size, pgn_file_size, pgn_file_mtime_ns = INDEX_FILE_HEADER.unpack(
+                f.read(INDEX_FILE_HEADER.size)
+            )
+            if (pgn_file_size, pgn_file_mtime_ns) != self.__get_pgn_file_fingerprint():
+                raise ValueError(f"PGN file changed after it was indexed: {self.__pgn_filepath}")
+
+            self.__reset()
+            self.__pgn_file_size, self.__pgn_file_mtime_ns = pgn_file_size, pgn_file_mtime_ns
+            openings_names_block = f.read(openings_names_block_size).decode("utf-8")
+            for opening_name in openings_names_block.split("\n")[1:]:
+                self.__get_opening_id(opening_name)
+
+            for column in (self.__offsets, self.__lengths, self.__openings_ids):
+                self.__read_little_endian(f, column, games_count)
+
+    def get_game_text(self, game_idx: int) -> str:
+        with open(self.__pgn_filepath, "rb") as f:
+            f.seek(self.__offsets[game_idx])
+            return f.read(self.__lengths[game_idx]).decode("utf-8")
+
+    def get_game(self, game_idx: int, pgn_reader: Optional[PGNReader] = None) -> Optional[PGNGame]:
+        # None is returned for the games skipped by the reader (e.g. filtered out ones)
+        pgn_reader = pgn_reader or PGNReader()
+        lines = PGNIndex.__split_game_lines(self.get_game_text(game_idx))
+        return next(pgn_reader.iter_games_from_lines(lines), None)
+
+    def get_opening_name(self, game_idx: int) -> str:
+        return self.__openings_names[self.__openings_ids[game_idx]]
+
+    def get_games_indices_by_opening(self, opening_name: str) -> list[int]:
+        if opening_name not in self.__openings_ids_by_name:
+            return []
+
+        if self.__games_indices_by_opening_id is None:
+            self.__games_indices_by_opening_id = {}
+            for game_idx, opening_id in enumerate(self.__openings_ids):
+                self.__games_indices_by_opening_id.setdefault(opening_id, []).append(game_idx)
+
+        return self.__games_indices_by_opening_id.get(self.__openings_ids_by_name[opening_name], [])
+
+    def iter_games(self, games_indices: list[int], pgn_reader: Optional[PGNReader] = None) -> Iterator[PGNGame]:
+        pgn_reader = pgn_reader or PGNReader()
+        with open(self.__pgn_filepath, "rb") as f:
+            for game_idx in games_indices:
+                f.seek(self.__offsets[game_idx])
+                lines = PGNIndex.__split_game_lines(f.read(self.__lengths[game_idx]).decode("utf-8"))
+                yield from pgn_reader.iter_games_from_lines(lines)
+
+    def iter_games_by_opening(self, opening_name: str, pgn_reader: Optional[PGNReader] = None) -> Iterator[PGNGame]:
+        yield from self.iter_games(self.get_games_indices_by_opening(opening_name), pgn_reader)
+
+    @staticmethod
+    def __split_game_lines(game_text: str) -> list[str]:
+        # "\n" line endings, as TrackedLines gives them to the reader
+        return game_text.replace("\r\n", "\n").splitlines(keepends=True)
+
+    def __reset(self) -> None:
+        self.__offsets = array("Q")
+        self.__lengths = array("I")
+        self.__openings_ids = array("I")
+        self.__openings_names = []
+        self.__openings_ids_by_name = {}
+        self.__games_indices_by_opening_id = None
+        self.__get_opening_id("")  # games without opening header
+
+    def __get_pgn_file_fingerprint(self) -> tuple[int, int]:
+        stat = os.stat(self.__pgn_filepath)
+        return stat.st_size, stat.st_mtime_ns
+
+    def __add_game(self, offset: int, length: int, opening_id: int) -> None:
+        self.__offsets.append(offset)
+        self.__lengths.append(length)
+        self.__openings_ids.append(opening_id)
+
+    def __get_opening_id(self, opening_name: str) -> int:
+        opening_id = self.__openings_ids_by_name.get(opening_name)
+        if opening_id is None:
+            opening_id = len(self.__openings_names)
+            self.__openings_ids_by_name[opening_name] = opening_id
+            self.__openings_names.append(opening_name)
+        return opening_id
+
+    @staticmethod
+    def __write_little_endian(f: BinaryIO, column: array) -> None:
+        if sys.byteorder != "little":
+            column = array(column.typecode, column)
+            column.byteswap()
+        column.tofile(f)  # type: ignore[arg-type]
+
+    @staticmethod
+    def __read_little_endian(f: BinaryIO, column: array, count: int) -> None:
+        column.fromfile(f, count)  # type: ignore[arg-type]
+        if sys.byteorder != "little":
+            column.byteswap()
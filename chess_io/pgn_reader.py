@@ -1,5 +1,64 @@
 import logging
+import os
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Collection, Iterable, Iterator, NamedTuple, Optional
+
+from chess_io.headers_predicates import HeaderPredicate, parse_header_line
+from chess_io.ingestion_checkpoint import IngestionCheckpoint
+from chess_io.movetext_tokenizer import has_moves, tokenize_movetext
+from chess_io.openings_names_filter import OpeningsNamesFilter
+from chess_io.pgn_file_opener import (
+    is_compressed,
+    open_pgn_file,
+    open_pgn_file_binary,
+    skip_to_offset,
+)
+
+GAME_START_MARK = b"[Event"
+
+
+class PGNGame(NamedTuple):
+    opening_name: str
+    white_moves: list[str]
+    black_moves: list[str]
+
+
+class PGNLoadingSettings(NamedTuple):
+    openings_names_loading_filter: list[str]
+    is_opening_name_a_substring: bool
+    headers_predicates: list[HeaderPredicate]
+    is_skipping_evaluated_games: bool = False
+
+
+class TrackedLines:
+    # Decoded lines of binary (possibly decompressed) PGN stream, with the byte offset of what was read so far,
+    # reading stops at the line starting at or after the end offset (if given)
+    def __init__(self, f: BinaryIO, position: int = 0, end: Optional[int] = None) -> None:
+        self.__f = f
+        self.__position = position
+        self.__end = end
+        self.__last_line_start = position
+        self.__is_last_line_a_header = False
+
+    def __iter__(self) -> Iterator[str]:
+        for raw_line in self.__f:
+            if self.__end is not None and self.__position >= self.__end:
+                return
+
+            self.__last_line_start = self.__position
+            self.__position += len(raw_line)
+            self.__is_last_line_a_header = raw_line.startswith(b"[")
+
+            line = raw_line.decode("utf-8")
+            if line.endswith("\r\n"):
+                line = line[:-2] + "\n"
+            yield line
+
+    def get_resume_offset(self) -> int:
+        # Valid right after a game was yielded by the reader: the game ended either with an empty line
+        # (parsing resumes after it) or with the header of the next game (which has to be read again)
+        return self.__last_line_start if self.__is_last_line_a_header else self.__position
 
 
 class PGNReader:
@@ -7,6 +66,9 @@ class PGNReader:
         self.__openings_names: list[str] = []
         self.__openings_names_loading_filter: list[str] = []
         self.__is_opening_name_a_substring = False
+        self.__openings_names_filter = OpeningsNamesFilter([], False)
+        self.__headers_predicates: list[HeaderPredicate] = []
+        self.__is_skipping_evaluated_games = False
         self.__white_moves: list[list[str]] = []
         self.__black_moves: list[list[str]] = []
 
@@ -45,32 +107,77 @@ class PGNReader:
 
     def set_openings_names_loading_filter(self, filter_openings_names: list[str]) -> None:
         self.__openings_names_loading_filter = filter_openings_names
+        self.__openings_names_filter = OpeningsNamesFilter(filter_openings_names, self.__is_opening_name_a_substring)
 
     def set_is_opening_name_a_substring(self, value: bool) -> None:
         self.__is_opening_name_a_substring = value
+        self.__openings_names_filter = OpeningsNamesFilter(self.__openings_names_loading_filter, value)
 
-    def __is_opening_in_filter_and_get_it(self, opening: str) -> tuple[bool, str]:
-        if self.__is_opening_name_a_substring:
-            for opening_filter in self.__openings_names_loading_filter:
-                if opening_filter in opening:
-                    return True, opening_filter
-            return False, ""
-        else:
-            return opening in self.__openings_names_loading_filter, ""
+    def set_is_skipping_evaluated_games(self, value: bool) -> None:
+        # annotations ({ [%eval 0.17] [%clk 0:00:30] }) are stripped by the tokenizer, so such games are
+        # loaded by default, skipping them is only cheaper when they are not needed at all
+        self.__is_skipping_evaluated_games = value
 
-    def load_pngs_from_file(self, filepath: str) -> None:
-        self.__logger.info(f"Starting loading data from file: {filepath}")
+    def set_headers_predicates(self, headers_predicates: list[HeaderPredicate]) -> None:
+        # evaluated right after game headers are read, rejected games' movetext is never tokenized
+        self.__headers_predicates = headers_predicates
 
-        # self.__openings_names = []
-        # self.__black_moves = []
-        # self.__white_moves = []
-        possible_outcomes = ["1-0", "1/2-1/2", "0-1"]
+    def __is_opening_in_filter_and_get_it(self, opening: str) -> tuple[bool, str]:
+        return self.__openings_names_filter.match(opening)
+
+    def iter_games(
+        self, filepath: str, selected_openings_names: Optional[Collection[str]] = None
+    ) -> Iterator[PGNGame]:
+        # games are yielded one by one, so the caller decides what (if anything) is kept in memory
+        # compressed files (.bz2, .gz, .xz, .zst) are decompressed on the fly
+        with open_pgn_file(filepath) as f:
+            yield from self.iter_games_from_lines(f, selected_openings_names)
+
+    def iter_games_from_lines(
+        self, lines: Iterable[str], selected_openings_names: Optional[Collection[str]] = None
+    ) -> Iterator[PGNGame]:
+        # selected_openings_names (after applying loading filter) are checked before reading the movetext
+        for opening, movetext in self.__iter_openings_and_movetexts(lines, selected_openings_names):
+            w, b = tokenize_movetext(movetext)
+            yield PGNGame(opening, w, b)
+
+    def count_openings_in_file(self, filepath: str) -> Counter:
+        # header-only scan, movetext is never tokenized, only games which would be loaded are counted
+        with open_pgn_file(filepath) as f:
+            return Counter(opening for opening, _ in self.__iter_openings_and_movetexts(f))
+
+    def __iter_openings_and_movetexts(
+        self, lines: Iterable[str], selected_openings_names: Optional[Collection[str]] = None
+    ) -> Iterator[tuple[str, str]]:
+        opening = ""
         added_opening = False
-
-        with open(filepath) as f:
-            for line in f:
-                if line.startswith("[Opening") and "?" not in line:
+        movetext_lines: list[str] = []
+        headers: dict[str, str] = {}
+        are_headers_checked = True
+
+        for line in lines:
+            # wrapped movetext line can start with "[%clk ...", only next game's header ends the movetext
+            if line.startswith("[") and (not movetext_lines or line.startswith("[Event")):
+                if movetext_lines:
+                    # movetext not terminated with an empty line
+                    movetext = "".join(movetext_lines)
+                    movetext_lines = []
+                    if not self.__is_movetext_skipped(movetext):
+                        yield opening, movetext
+
+                if self.__headers_predicates:
+                    # headers are only gathered when there is something to check
+                    if line.startswith("[Event"):
+                        headers = {}
+                    header, value = parse_header_line(line)
+                    headers[header] = value
+                    are_headers_checked = False
+
+                if line.startswith("[Event"):
+                    added_opening = False
+                elif line.startswith("[Opening") and "?" not in line:
                     opening = line[len('[Opening "') : -3]
+                    added_opening = False
 
                     is_in_filter, filtered_opening_name = self.__is_opening_in_filter_and_get_it(opening)
                     if is_in_filter:
@@ -80,41 +187,207 @@ class PGNReader:
                     if not self.__openings_names_loading_filter or (
                         self.__openings_names_loading_filter and is_in_filter
                     ):
-                        self.__openings_names.append(opening)
-                        added_opening = True
+                        added_opening = selected_openings_names is None or opening in selected_openings_names
+
+            elif not added_opening:
+                continue
+
+            elif not are_headers_checked:
+                are_headers_checked = True
+                added_opening = self.__are_headers_predicates_satisfied(headers)
+                if added_opening and line.strip():
+                    movetext_lines.append(line)
+
+            elif line.strip():
+                movetext_lines.append(line)
+
+            elif movetext_lines:
+                added_opening = False
+                movetext = "".join(movetext_lines)
+                movetext_lines = []
+                if not self.__is_movetext_skipped(movetext):
+                    yield opening, movetext
+
+        if movetext_lines:
+            movetext = "".join(movetext_lines)
+            if not self.__is_movetext_skipped(movetext):
+                yield opening, movetext
+
+    def __are_headers_predicates_satisfied(self, headers: dict[str, str]) -> bool:
+        for predicate in self.__headers_predicates:
+            if not predicate.is_satisfied(headers):
+                return False
+        return True
+
+    def __is_movetext_skipped(self, movetext: str) -> bool:
+        # the only skip rule of movetexts, shared by loading and counting games
+        if self.__is_skipping_evaluated_games and movetext.find("eval") != -1:
+            return True
+
+        # game without any move played (only a result or annotations)
+        return not has_moves(movetext)
+
+    def iter_games_in_byte_range(self, filepath: str, start: int, end: Optional[int]) -> Iterator[PGNGame]:
+        # start and end are expected to be aligned to the beginning of "[Event" lines,
+        # compressed files can't be split, so the whole file is read when end is not given
+        if end is None:
+            yield from self.iter_games(filepath)
+            return
 
-                elif line.startswith("1. ") and added_opening:
-                    added_opening = False
-                    if line.find("eval") != -1:
-                        # Database is large enough.
-                        # I don't need to bother reading evaluated games.
-                        self.__openings_names.pop()
-                        continue
-
-                    w: list[str] = []
-                    b: list[str] = []
-                    while True:
-                        space = line.find(" ")
-                        if space == -1:
-                            if line[:-1] in possible_outcomes and line[:-1] != b[-1] and line[:-1] != w[-1]:
-                                if len(b) < len(w):
-                                    b.append(line[:-1])
-                                else:
-                                    w.append(line[:-1])
-                            break
-
-                        line = line[space + 1 :]
-                        space = line.find(" ")
-                        w.append(line[:space])
-
-                        line = line[space + 1 :]
-                        space = line.find(" ")
-                        b.append(line[:space])
-
-                        line = line[space + 1 :]
-
-                    self.__black_moves.append(b)
-                    self.__white_moves.append(w)
+        yield from self.iter_games_from_lines(self.__iter_lines_in_byte_range(filepath, start, end))
+
+    @staticmethod
+    def __iter_lines_in_byte_range(filepath: str, start: int, end: int) -> Iterator[str]:
+        with open(filepath, "rb") as f:
+            f.seek(start)
+            yield from TrackedLines(f, start, end)
+
+    @staticmethod
+    def split_file_into_byte_ranges(filepath: str, ranges_count: int) -> list[tuple[int, int]]:
+        file_size = os.path.getsize(filepath)
+        boundaries = [0]
+
+        with open(filepath, "rb") as f:
+            for idx in range(1, max(ranges_count, 1)):
+                approximate_boundary = max(file_size * idx // ranges_count, boundaries[-1])
+                f.seek(approximate_boundary)
+                if approximate_boundary != 0:
+                    f.readline()  # finishing line that was cut in half
+
+                boundary = file_size
+                while True:
+                    line_start = f.tell()
+                    line = f.readline()
+                    if not line:
+                        break
+                    if line.startswith(GAME_START_MARK):
+                        boundary = line_start
+                        break
+
+                if boundary > boundaries[-1]:
+                    boundaries.append(boundary)
+
+        if boundaries[-1] != file_size:
+            boundaries.append(file_size)
+
+        return [(boundaries[idx], boundaries[idx + 1]) for idx in range(len(boundaries) - 1)]
+
+    def get_loading_settings(self) -> PGNLoadingSettings:
+        return PGNLoadingSettings(
+            self.__openings_names_loading_filter,
+            self.__is_opening_name_a_substring,
+            self.__headers_predicates,
+            self.__is_skipping_evaluated_games,
+        )
+
+    def set_loading_settings(self, settings: PGNLoadingSettings) -> None:
+        self.set_openings_names_loading_filter(settings.openings_names_loading_filter)
+        self.set_is_opening_name_a_substring(settings.is_opening_name_a_substring)
+        self.set_headers_predicates(settings.headers_predicates)
+        self.set_is_skipping_evaluated_games(settings.is_skipping_evaluated_games)
+
+    def load_pngs_from_file_parallel(self, filepath: str, processes: Optional[int] = None) -> None:
+        self.load_pngs_from_files_parallel([filepath], processes)
+
+    def load_pngs_from_files_parallel(self, filepaths: list[str], processes: Optional[int] = None) -> None:
+        processes = processes or os.cpu_count() or 1
+        self.__logger.info(f"Starting loading data from files: {filepaths} using {processes} processes")
+
+        # every plain file is split into the same amount of shards, so many monthly dumps keep all processes busy
+        shards: list[tuple[str, int, Optional[int], PGNLoadingSettings]] = []
+        for filepath in filepaths:
+            if is_compressed(filepath):
+                # compressed stream can't be seeked into, whole file goes to a single process
+                shards.append((filepath, 0, None, self.get_loading_settings()))
+                continue
+
+            for start, end in self.split_file_into_byte_ranges(filepath, processes):
+                shards.append((filepath, start, end, self.get_loading_settings()))
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            # map keeps the order of shards, so games are merged in the original order
+            for openings_names, white_moves, black_moves in executor.map(_load_games_in_byte_range, shards):
+                self.__openings_names.extend(openings_names)
+                self.__white_moves.extend(white_moves)
+                self.__black_moves.extend(black_moves)
+
+        self.__logger.info(
+            f"Loaded data from files: {filepaths} - ({len(self.__openings_names)}, {len(self.__white_moves)}"
+            f", {len(self.__black_moves)}) entries "
+        )
+
+    def load_games(self, games: Iterable[PGNGame]) -> None:
+        for game in games:
+            self.__openings_names.append(game.opening_name)
+            self.__white_moves.append(game.white_moves)
+            self.__black_moves.append(game.black_moves)
+
+    def load_pngs_from_file(self, filepath: str) -> None:
+        self.__logger.info(f"Starting loading data from file: {filepath}")
+
+        self.load_games(self.iter_games(filepath))
+
+        self.__logger.info(
+            f"Loaded data from file: {filepath} - ({len(self.__openings_names)}, {len(self.__white_moves)}"
+            f", {len(self.__black_moves)}) entries "
+        )
+
+    def load_pngs_from_file_resumable(
+        self, filepath: str, checkpoint_filepath: str, checkpoint_every_n_games: int = 100000
+    ) -> None:
+        # Parsed games and the file offset are persisted every n games, rerun after a failure resumes
+        # from the last checkpoint, loaded games are the same as after uninterrupted load_pngs_from_file.
+        checkpoint = IngestionCheckpoint(
+            checkpoint_filepath,
+            {
+                "filepath": os.path.abspath(filepath),
+                "file_size": os.path.getsize(filepath),
+                "loading_settings": repr(self.get_loading_settings()),
+            },
+        )
+        if checkpoint.load():
+            self.__logger.info(
+                f"Resuming loading data from file: {filepath} at byte {checkpoint.offset}"
+                f" with {checkpoint.games_count} games already loaded"
+            )
+            for saved_games_chunk in checkpoint.iter_saved_games_chunks():
+                self.load_games(saved_games_chunk)
+        else:
+            self.__logger.info(f"Starting loading data from file: {filepath}")
+
+        with open_pgn_file_binary(filepath) as f:
+            skip_to_offset(f, checkpoint.offset)
+            lines = TrackedLines(f, checkpoint.offset)
+
+            games_chunk: list[PGNGame] = []
+            for game in self.iter_games_from_lines(lines):
+                games_chunk.append(game)
+                if len(games_chunk) >= checkpoint_every_n_games:
+                    checkpoint.save(games_chunk, lines.get_resume_offset())
+                    self.load_games(games_chunk)
+                    games_chunk = []
+
+        self.load_games(games_chunk)
+        checkpoint.remove()
+
+        self.__logger.info(
+            f"Loaded data from file: {filepath} - ({len(self.__openings_names)}, {len(self.__white_moves)}"
+            f", {len(self.__black_moves)}) entries "
+        )
+
+    def load_pngs_from_file_with_top_n_openings(self, filepath: str, n: int) -> None:
+        # Same result as load_pngs_from_file followed by filter_games_by_top_n_openings,
+        # but only games of the top n openings are ever tokenized and stored.
+        if n < 1:
+            self.__logger.warning(f"Games were not filtered, wrong arg value: {n}")
+            self.load_pngs_from_file(filepath)
+            return
+
+        self.__logger.info(f"Counting openings in file: {filepath}")
+        top_n_openings = {opening_name for opening_name, _ in self.count_openings_in_file(filepath).most_common(n)}
+        self.__logger.info(f"Starting loading data from file: {filepath} using top {n} openings: {top_n_openings}")
+
+        self.load_games(self.iter_games(filepath, top_n_openings))
 
         self.__logger.info(
             f"Loaded data from file: {filepath} - ({len(self.__openings_names)}, {len(self.__white_moves)}"
@@ -153,3 +426,20 @@ class PGNReader:
             top_n_openings.append(opening_name)
 
         self.filter_games_by_openings_names_after_loading(top_n_openings)
+
+
+def _load_games_in_byte_range(
+    shard: tuple[str, int, Optional[int], PGNLoadingSettings]
+) -> tuple[list[str], list[list[str]], list[list[str]]]:
+    # executed in worker process, reader is rebuilt there with the same loading settings
+    filepath, start, end, loading_settings = shard
+    reader = PGNReader()
+    reader.set_loading_settings(loading_settings)
+
+    openings_names, white_moves, black_moves = [], [], []
+    for game in reader.iter_games_in_byte_range(filepath, start, end):
+        openings_names.append(game.opening_name)
+        white_moves.append(game.white_moves)
+        black_moves.append(game.black_moves)
+
+    return openings_names, white_moves, black_moves
@@ -0,0 +1,221 @@
+import hashlib
+import pickle
+import re
+import struct
+from itertools import chain
+from typing import BinaryIO, Iterable, Optional, Union
+
+import numpy as np
+
+from chess_io.compressed_blocks import (
+    DEFAULT_BLOCK_SIZE,
+    CompressedBlocksReader,
+    CompressedBlocksWriter,
+    check_compression,
+)
+
+DATASET_FILE_EXTENSION = ".npos"
+POSITIONS_FILE_MAGIC = b"CHESSPOS1\n"
+POSITIONS_COMPRESSED_FILE_MAGIC = b"CHESSPOSZ\n"
+POSITIONS_FILE_HEADER = struct.Struct("<QQ")  # positions count, labels vocabulary block size
+DATA_ALIGNMENT = 8
+BOARD_SIZE = 8
+
+# square code is the index of square character: empty square and pieces (as in Piece.character_dict)
+SQUARES_CHARACTERS = " ♜♝♞♛♚♟♖♗♘♕♔♙"
+# characters which look like codes are translated to "\x7f", so every unknown character is outside of codes
+_SQUARES_CODES_TRANSLATION = str.maketrans(
+    {chr(code): "\x7f" for code in range(len(SQUARES_CHARACTERS))}
+    | {character: chr(code) for code, character in enumerate(SQUARES_CHARACTERS)}
+)
+_UNKNOWN_SQUARES_CODE_PATTERN = re.compile(f"[^\\x00-\\x{len(SQUARES_CHARACTERS) - 1:02x}]")
+_SQUARES_CHARACTERS_ARRAY = np.array(list(SQUARES_CHARACTERS))
+
+SQUARES_DTYPE = np.dtype(np.uint8)
+LABELS_IDS_DTYPE = np.dtype("<i4")
+
+
+def is_position_dataset_file(filepath: str) -> bool:
+    with open(filepath, "rb") as f:
+        return f.read(len(POSITIONS_FILE_MAGIC)) in (POSITIONS_FILE_MAGIC, POSITIONS_COMPRESSED_FILE_MAGIC)
+
+
+def get_labels_vocabulary_hash(labels_vocabulary: list[str]) -> str:
+    # identifies labels ids of datasets, shards and models: the same labels in the same order
+    return hashlib.sha256("\n".join(labels_vocabulary).encode("utf-8")).hexdigest()
+
+
+def encode_positions(positions: Iterable[list[list[str]]]) -> np.ndarray:
+    # [8x8 characters] -> (positions, 8, 8) uint8 squares codes, all positions are translated at once
+    squares_text = "".join(chain.from_iterable(chain.from_iterable(positions)))
+    squares_codes_text = squares_text.translate(_SQUARES_CODES_TRANSLATION)
+    if _UNKNOWN_SQUARES_CODE_PATTERN.search(squares_codes_text):
+        unknown_characters = sorted(set(squares_text) - set(SQUARES_CHARACTERS))
+        raise ValueError(f"Unknown squares characters: {unknown_characters}")
+
+    squares = np.frombuffer(squares_codes_text.encode("latin-1"), dtype=SQUARES_DTYPE)
+    if len(squares) % (BOARD_SIZE * BOARD_SIZE):
+        raise ValueError(f"Positions must be {BOARD_SIZE}x{BOARD_SIZE} boards")
+
+    return squares.reshape(-1, BOARD_SIZE, BOARD_SIZE)
+
+
+def decode_position(squares: np.ndarray) -> list[list[str]]:
+    return _SQUARES_CHARACTERS_ARRAY[squares].tolist()
+
+
+class PositionDataset:
+    # Positions database as columns: (positions, 8, 8) uint8 squares codes and int32 ids of labels (openings names).
+    # File layout: magic, header, labels vocabulary ("\n" separated), padding, squares, labels ids.
+    # Loaded file is memory-mapped, slicing squares or labels ids doesn't copy nor read the whole file.
+    def __init__(self, squares: np.ndarray, labels_ids: np.ndarray, labels_vocabulary: list[str]) -> None:
+        if len(squares) != len(labels_ids):
+            raise ValueError(f"Different number of positions ({len(squares)}) and labels ({len(labels_ids)})")
+
+        self.__squares = squares
+        self.__labels_ids = labels_ids
+        self.__labels_vocabulary = labels_vocabulary
+
+    def __len__(self) -> int:
+        return len(self.__labels_ids)
+
+    @property
+    def squares(self) -> np.ndarray:
+        return self.__squares
+
+    @property
+    def labels_ids(self) -> np.ndarray:
+        return self.__labels_ids
+
+    @property
+    def labels_vocabulary(self) -> list[str]:
+        return self.__labels_vocabulary
+
+    def get_label(self, idx: int) -> str:
+        return self.__labels_vocabulary[self.__labels_ids[idx]]
+
+    def get_position(self, idx: int) -> list[list[str]]:
+        return decode_position(self.__squares[idx])
+
+    def to_database(self) -> list[tuple[str, list[list[str]]]]:
+        # format of PositionWriter.database
+        labels = [self.__labels_vocabulary[label_id] for label_id in self.__labels_ids.tolist()]
+        return list(zip(labels, _SQUARES_CHARACTERS_ARRAY[self.__squares].tolist()))
+
+    @staticmethod
+    def from_database(database: list[tuple[str, list[list[str]]]]) -> "PositionDataset":
+        labels_vocabulary: list[str] = []
+        labels_ids_by_name: dict[str, int] = {}
+        labels_ids = np.empty(len(database), dtype=LABELS_IDS_DTYPE)
+        for idx, (label, _) in enumerate(database):
+            label_id = labels_ids_by_name.get(label)
+            if label_id is None:
+                label_id = len(labels_vocabulary)
+                labels_ids_by_name[label] = label_id
+                labels_vocabulary.append(label)
+            labels_ids[idx] = label_id
+
+        squares = encode_positions(position for _, position in database)
+        return PositionDataset(squares, labels_ids, labels_vocabulary)
+
+    def save_to_file(
+        self, filepath: str, compression: Optional[str] = None, block_size: int = DEFAULT_BLOCK_SIZE
+    ) -> None:
+        # with compression ("zlib" or "lzma") squares and labels ids are written to compressed blocks,
+        # such file is not memory-mapped, but a slice of it decompresses only the blocks it needs
+        if compression:
+            check_compression(compression)
+        labels_vocabulary_block = "\n".join(self.__labels_vocabulary).encode("utf-8")
+        header_size = len(POSITIONS_FILE_MAGIC) + POSITIONS_FILE_HEADER.size + len(labels_vocabulary_block)
+        with open(filepath, "wb") as f:
+            f.write(POSITIONS_COMPRESSED_FILE_MAGIC if compression else POSITIONS_FILE_MAGIC)
+            f.write(POSITIONS_FILE_HEADER.pack(len(self), len(labels_vocabulary_block)))
+            f.write(labels_vocabulary_block)
+            f.write(b"\0" * (-header_size % DATA_ALIGNMENT))
+
+            data_file: Union[BinaryIO, CompressedBlocksWriter] = f
+            if compression:
+                data_file = CompressedBlocksWriter(f, compression, block_size)
+            data_file.write(np.ascontiguousarray(self.__squares, dtype=SQUARES_DTYPE).tobytes())
+            data_file.write(np.ascontiguousarray(self.__labels_ids, dtype=LABELS_IDS_DTYPE).tobytes())
+            if isinstance(data_file, CompressedBlocksWriter):
+                data_file.close()
+
+    @staticmethod
+    def load_from_file(filepath: str) -> "PositionDataset":
+        magic, positions_count, labels_vocabulary, data_offset = PositionDataset.__read_header(filepath)
+        if magic == POSITIONS_COMPRESSED_FILE_MAGIC:
+            return PositionDataset.load_slice_from_file(filepath, 0, positions_count)
+
+        labels_ids_offset = data_offset + positions_count * SQUARES_DTYPE.itemsize * BOARD_SIZE * BOARD_SIZE
+        squares = PositionDataset.__map_array(
+            filepath, SQUARES_DTYPE, data_offset, (positions_count, BOARD_SIZE, BOARD_SIZE)
+        )
+        labels_ids = PositionDataset.__map_array(filepath, LABELS_IDS_DTYPE, labels_ids_offset, (positions_count,))
+        return PositionDataset(squares, labels_ids, labels_vocabulary)
+
+    @staticmethod
+    def load_slice_from_file(filepath: str, start: int, stop: int) -> "PositionDataset":
+        # positions [start:stop], only this part of the file is read (or decompressed)
+        magic, positions_count, labels_vocabulary, data_offset = PositionDataset.__read_header(filepath)
+        start, stop, _ = slice(start, stop).indices(positions_count)
+        stop = max(start, stop)
+        if magic == POSITIONS_FILE_MAGIC:
+            dataset = PositionDataset.load_from_file(filepath)
+            return PositionDataset(dataset.squares[start:stop], dataset.labels_ids[start:stop], labels_vocabulary)
+
+        squares_size = SQUARES_DTYPE.itemsize * BOARD_SIZE * BOARD_SIZE
+        labels_ids_offset = positions_count * squares_size
+        blocks_reader = CompressedBlocksReader(filepath, data_offset)
+        try:
+            squares_bytes = blocks_reader.read(start * squares_size, (stop - start) * squares_size)
+            labels_ids_bytes = blocks_reader.read(
+                labels_ids_offset + start * LABELS_IDS_DTYPE.itemsize, (stop - start) * LABELS_IDS_DTYPE.itemsize
+            )
+        finally:
+            blocks_reader.close()
+
+        squares = np.frombuffer(squares_bytes, dtype=SQUARES_DTYPE).reshape(-1, BOARD_SIZE, BOARD_SIZE)
+        return PositionDataset(squares, np.frombuffer(labels_ids_bytes, dtype=LABELS_IDS_DTYPE), labels_vocabulary)
+
+    @staticmethod
+    def __read_header(filepath: str) -> tuple[bytes, int, list[str], int]:
+        # magic, positions count, labels vocabulary and (aligned) position of the data
+        with open(filepath, "rb") as f:
+            magic = f.read(len(POSITIONS_FILE_MAGIC))
+            if magic not in (POSITIONS_FILE_MAGIC, POSITIONS_COMPRESSED_FILE_MAGIC):
+                raise ValueError(f"Not a positions dataset file: {filepath}")
+
+            positions_count, labels_vocabulary_block_size = POSITIONS_FILE_HEADER.unpack(
+                f.read(POSITIONS_FILE_HEADER.size)
+            )
+            labels_vocabulary_block = f.read(labels_vocabulary_block_size).decode("utf-8")
+
+        labels_vocabulary = labels_vocabulary_block.split("\n") if labels_vocabulary_block_size else []
+        header_size = len(POSITIONS_FILE_MAGIC) + POSITIONS_FILE_HEADER.size + labels_vocabulary_block_size
+        return magic, positions_count, labels_vocabulary, header_size + (-header_size % DATA_ALIGNMENT)
+
+    @staticmethod
+    def __map_array(filepath: str, dtype: np.dtype, offset: int, shape: tuple[int, ...]) -> np.ndarray:
+        if not shape[0]:
+            return np.empty(shape, dtype=dtype)  # empty file region can't be mapped
+        return np.memmap(filepath, dtype=dtype, mode="r", offset=offset, shape=shape)
+
+
+def load_pickled_database(filepath: str) -> list[tuple[str, list[list[str]]]]:
+    # file written by PositionWriter: one pickled list, or consecutive chunks of an appending writer
+    database = []
+    with open(filepath, "rb") as f:
+        while True:
+            try:
+                database.extend(pickle.load(f))
+            except EOFError:
+                return database
+
+
+def convert_pickle_file_to_dataset_file(pickle_filepath: str, dataset_filepath: Optional[str] = None) -> str:
+    # positions file written by PositionWriter.save_to_file -> binary dataset file (default: "<pickle file>.npos")
+    database = load_pickled_database(pickle_filepath)
+    dataset_filepath = dataset_filepath or pickle_filepath + DATASET_FILE_EXTENSION
+    PositionDataset.from_database(database).save_to_file(dataset_filepath)
+    return dataset_filepath
@@ -1,6 +1,11 @@
-import pickle
 from typing import Any
 
+from chess_io.position_dataset import (
+    PositionDataset,
+    is_position_dataset_file,
+    load_pickled_database,
+)
+
 
 class PositionReader:
     def __init__(self, filepath: str) -> None:
@@ -9,7 +14,16 @@ class PositionReader:
         self.__BOARD_SIZE = 8
 
     def read_from_file(self) -> Any:
-        with open(f"{self.__filepath}", "rb") as file:
-            self.__database = pickle.load(file)
+        if is_position_dataset_file(self.__filepath):
+            self.__database = PositionDataset.load_from_file(self.__filepath).to_database()
+            return self.__database
 
+        self.__database = load_pickled_database(self.__filepath)
         return self.__database
+
+    def read_dataset_from_file(self) -> PositionDataset:
+        # binary dataset file is memory-mapped, pickled positions are loaded and encoded
+        if is_position_dataset_file(self.__filepath):
+            return PositionDataset.load_from_file(self.__filepath)
+
+        return PositionDataset.from_database(load_pickled_database(self.__filepath))
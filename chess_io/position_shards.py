@@ -0,0 +1,162 @@
+import json
+import logging
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+import numpy as np
+
+from chess_io.position_dataset import (
+    LABELS_IDS_DTYPE,
+    PositionDataset,
+    get_labels_vocabulary_hash,
+)
+from chess_io.position_reader import PositionReader
+
+MANIFEST_FILE_EXTENSION = ".manifest.json"
+MANIFEST_VERSION = 1
+
+
+class PositionShard(NamedTuple):
+    filepath: str  # relative to the manifest directory
+    positions_count: int
+    labels_histogram: dict[str, int]
+    labels_vocabulary_hash: str
+
+
+class PositionShardsManifest:
+    # Description of a positions dataset split into many files (e.g. one per rollout run):
+    # positions counts, labels histograms and labels vocabularies hashes of the shards, stored as json.
+    # Totals are known without opening any shard, shards with the same vocabulary hash share labels ids.
+    def __init__(self, manifest_filepath: str) -> None:
+        self.__manifest_filepath = manifest_filepath
+        self.__shards: list[PositionShard] = []
+
+        logging.basicConfig(level=logging.INFO)
+        self.__logger = logging.getLogger(__name__)
+
+    def __len__(self) -> int:
+        return len(self.__shards)
+
+    @property
+    def manifest_filepath(self) -> str:
+        return self.__manifest_filepath
+
+    @property
+    def shards(self) -> list[PositionShard]:
+        return self.__shards
+
+    @property
+    def positions_count(self) -> int:
+        return sum(shard.positions_count for shard in self.__shards)
+
+    @property
+    def labels_histogram(self) -> Counter:
+        histogram: Counter = Counter()
+        for shard in self.__shards:
+            histogram.update(shard.labels_histogram)
+        return histogram
+
+    def is_labels_vocabulary_shared(self) -> bool:
+        return len({shard.labels_vocabulary_hash for shard in self.__shards}) <= 1
+
+    def get_shard_filepath(self, shard: PositionShard) -> str:
+        return os.path.join(os.path.dirname(self.__manifest_filepath), shard.filepath)
+
+    def add_shard(self, shard_filepath: str) -> PositionShard:
+        # shard is a positions file: binary dataset (only labels ids are read) or pickled positions
+        dataset = PositionReader(shard_filepath).read_dataset_from_file()
+        labels_counts = np.bincount(dataset.labels_ids, minlength=len(dataset.labels_vocabulary)).tolist()
+
+        shard = PositionShard(
+            os.path.relpath(shard_filepath, os.path.dirname(os.path.abspath(self.__manifest_filepath))),
+            len(dataset),
+            {label: count for label, count in zip(dataset.labels_vocabulary, labels_counts) if count},
+            get_labels_vocabulary_hash(dataset.labels_vocabulary),
+        )
+        self.__shards.append(shard)
+        self.__logger.info(f"Added shard {shard_filepath} with {shard.positions_count} positions")
+        return shard
+
+    def save_to_file(self) -> None:
+        state = {"version": MANIFEST_VERSION, "shards": [shard._asdict() for shard in self.__shards]}
+        with open(self.__manifest_filepath, "w") as f:
+            json.dump(state, f, indent=1)
+
+    def load_from_file(self) -> None:
+        with open(self.__manifest_filepath) as f:
+            state: dict[str, Any] = json.load(f)
+
+        if state.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported manifest version: {state.get('version')}")
+        self.__shards = [PositionShard(**shard) for shard in state["shards"]]
+
+
+class ShardedPositionReader:
+    # Reads positions of all shards of a manifest, in the manifest order.
+    # Shards are opened lazily, one by one or by a pool of threads
+    # (binary shards are memory-mapped, so most of the reading happens outside of the GIL).
+    def __init__(self, manifest_filepath: str) -> None:
+        self.__manifest = PositionShardsManifest(manifest_filepath)
+        self.__manifest.load_from_file()
+
+    def __len__(self) -> int:
+        return self.__manifest.positions_count
+
+    @property
+    def manifest(self) -> PositionShardsManifest:
+        return self.__manifest
+
+    def read_shard(self, shard_idx: int) -> PositionDataset:
+        shard_filepath = self.__manifest.get_shard_filepath(self.__manifest.shards[shard_idx])
+        return PositionReader(shard_filepath).read_dataset_from_file()
+
+    def iter_datasets(self, threads: Optional[int] = None) -> Iterator[PositionDataset]:
+        # threads=None reads shards sequentially, only when the next one is needed
+        yield from self.__iter_shards(self.read_shard, threads)
+
+    def __iter_shards(
+        self, read_shard: Callable[[int], PositionDataset], threads: Optional[int]
+    ) -> Iterator[PositionDataset]:
+        shards_indices = range(len(self.__manifest))
+        if threads is None:
+            yield from map(read_shard, shards_indices)
+            return
+
+        with ThreadPoolExecutor(threads) as executor:
+            yield from executor.map(read_shard, shards_indices)
+
+    def __load_shard(self, shard_idx: int) -> PositionDataset:
+        # memory-mapped columns are copied by the reading thread
+        dataset = self.read_shard(shard_idx)
+        return PositionDataset(np.array(dataset.squares), np.array(dataset.labels_ids), dataset.labels_vocabulary)
+
+    def read_dataset(self, threads: Optional[int] = None) -> PositionDataset:
+        # shards are merged into one in-memory dataset, labels ids are remapped to the common vocabulary
+        labels_vocabulary: list[str] = []
+        labels_ids_by_name: dict[str, int] = {}
+        squares = []
+        labels_ids = []
+        for dataset in self.__iter_shards(self.__load_shard, threads):
+            for label in dataset.labels_vocabulary:
+                if label not in labels_ids_by_name:
+                    labels_ids_by_name[label] = len(labels_vocabulary)
+                    labels_vocabulary.append(label)
+
+            labels_ids_mapping = np.array(
+                [labels_ids_by_name[label] for label in dataset.labels_vocabulary], dtype=LABELS_IDS_DTYPE
+            )
+            squares.append(dataset.squares)
+            labels_ids.append(labels_ids_mapping[dataset.labels_ids])
+
+        if not squares:
+            return PositionDataset.from_database([])
+        return PositionDataset(np.concatenate(squares), np.concatenate(labels_ids), labels_vocabulary)
+
+    def read_from_file(self, threads: Optional[int] = None) -> list[tuple[str, list[list[str]]]]:
+        # same format as PositionReader.read_from_file
+        database = []
+        for dataset in self.iter_datasets(threads):
+            database.extend(dataset.to_database())
+        return database
@@ -5,11 +5,20 @@ from chess_logic_and_presentation.pieces.piece import Piece
 
 
 class PositionWriter:
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, is_appending: bool = False):
         self.__database: list[tuple[str, list[list[str]]]] = []
         self.__BOARD_SIZE = 8
         self.__required_game_percentage_to_save = 0.5
         self.__filepath = filepath
+        # appending writer pickles only new positions as the next chunk of the file and forgets them,
+        # instead of pickling the whole database again on every save
+        self.__is_appending = is_appending
+        self.__is_file_created = False
+        self.__saved_positions_count = 0
+
+    @property
+    def saved_positions_count(self) -> int:
+        return self.__saved_positions_count
 
     @property
     def database(self) -> list[tuple[str, list[list[str]]]]:
@@ -58,5 +67,18 @@ class PositionWriter:
                     board[column][row] = ord(piece.character_representation)
 
     def save_to_file(self) -> None:
-        with open(f"{self.__filepath}", "wb") as file:
+        if not self.__is_appending:
+            with open(f"{self.__filepath}", "wb") as file:
+                pickle.dump(self.__database, file)
+            self.__saved_positions_count = len(self.__database)
+            return
+
+        if not self.__database and self.__is_file_created:
+            return
+
+        # file of the previous run is replaced, as in the non-appending mode
+        with open(f"{self.__filepath}", "ab" if self.__is_file_created else "wb") as file:
             pickle.dump(self.__database, file)
+        self.__is_file_created = True
+        self.__saved_positions_count += len(self.__database)
+        self.__database = []
@@ -0,0 +1,115 @@
+import json
+import pickle
+from collections.abc import Iterable, Sequence
+from typing import Union
+
+import numpy as np
+
+from chess_io.position_dataset import (
+    LABELS_IDS_DTYPE,
+    PositionDataset,
+    get_labels_vocabulary_hash,
+)
+
+LABEL_VOCABULARY_VERSION = 1
+
+
+class LabelVocabulary:
+    # Labels (openings names) <-> ids, ids are the indices of labels, as the model outputs are.
+    # Saved vocabulary keeps ids of a trained model, the hash is the same as the one of positions shards manifests.
+    def __init__(self, labels: Iterable[str] = ()) -> None:
+        self.__labels: list[str] = []
+        self.__ids_by_label: dict[str, int] = {}
+        for label in labels:
+            self.add(label)
+
+    def __len__(self) -> int:
+        return len(self.__labels)
+
+    def __contains__(self, label: object) -> bool:
+        return label in self.__ids_by_label
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, LabelVocabulary) and self.__labels == other.labels
+
+    @property
+    def labels(self) -> list[str]:
+        return self.__labels
+
+    def get_hash(self) -> str:
+        return get_labels_vocabulary_hash(self.__labels)
+
+    def add(self, label: str) -> int:
+        label_id = self.__ids_by_label.get(label)
+        if label_id is None:
+            label_id = len(self.__labels)
+            self.__ids_by_label[label] = label_id
+            self.__labels.append(label)
+        return label_id
+
+    def encode(self, label: str) -> int:
+        try:
+            return self.__ids_by_label[label]
+        except KeyError:
+            raise ValueError(f"Label not in vocabulary: {label}") from None
+
+    def decode(self, label_id: int) -> str:
+        return self.__labels[label_id]
+
+    def encode_many(self, labels: Union[Sequence[str], np.ndarray]) -> np.ndarray:
+        if not len(labels):
+            return np.empty(0, dtype=LABELS_IDS_DTYPE)
+
+        if isinstance(labels, np.ndarray):
+            labels = labels.tolist()  # iterating np.str_ scalars is several times slower
+        try:
+            return np.fromiter(
+                (self.__ids_by_label[label] for label in labels), dtype=LABELS_IDS_DTYPE, count=len(labels)
+            )
+        except KeyError as e:
+            raise ValueError(f"Label not in vocabulary: {e.args[0]}") from None
+
+    def decode_many(self, labels_ids: Union[Sequence[int], np.ndarray]) -> list[str]:
+        return [self.__labels[label_id] for label_id in np.asarray(labels_ids).tolist()]
+
+    def encode_dataset_labels(self, dataset: PositionDataset) -> np.ndarray:
+        # dataset labels ids (indices of its own vocabulary) -> ids of this vocabulary
+        return self.encode_many(dataset.labels_vocabulary)[dataset.labels_ids]
+
+    def to_encoded_pairs(self) -> list[tuple[str, int]]:
+        # format of opening_encoder.get_label_encoded_unique_openings_names
+        return [(label, label_id) for label_id, label in enumerate(self.__labels)]
+
+    @staticmethod
+    def from_labels(labels: Iterable[str]) -> "LabelVocabulary":
+        # unique labels sorted, so the same labels in any order give the same ids
+        return LabelVocabulary(sorted(set(labels)))
+
+    @staticmethod
+    def from_encoded_pairs(encoded_pairs: Iterable[tuple[str, int]]) -> "LabelVocabulary":
+        sorted_pairs = sorted(encoded_pairs, key=lambda pair: pair[1])
+        if [label_id for _, label_id in sorted_pairs] != list(range(len(sorted_pairs))):
+            raise ValueError("Labels ids must be consecutive numbers starting at 0")
+        return LabelVocabulary(label for label, _ in sorted_pairs)
+
+    def save_to_file(self, filepath: str) -> None:
+        state = {"version": LABEL_VOCABULARY_VERSION, "hash": self.get_hash(), "labels": self.__labels}
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, indent=1)
+
+    @staticmethod
+    def load_from_file(filepath: str) -> "LabelVocabulary":
+        # also reads pickled encoded pairs, saved by the previous versions of the CLI
+        with open(filepath, "rb") as f:
+            data = f.read()
+        if data.startswith(pickle.PROTO):
+            return LabelVocabulary.from_encoded_pairs(pickle.loads(data))
+
+        state = json.loads(data.decode("utf-8"))
+        if state.get("version") != LABEL_VOCABULARY_VERSION:
+            raise ValueError(f"Unsupported label vocabulary version: {state.get('version')}")
+
+        vocabulary = LabelVocabulary(state["labels"])
+        if vocabulary.get_hash() != state["hash"]:
+            raise ValueError(f"Label vocabulary file is corrupted: {filepath}")
+        return vocabulary
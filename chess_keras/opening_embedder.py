@@ -7,6 +7,7 @@ from keras.layers import Concatenate, Dense, Dropout, Embedding, Flatten, Input
 from keras.models import Model, Sequential
 from keras.optimizers import Adam
 
+from chess_keras.label_vocabulary import LabelVocabulary
 from chess_keras.one_hot_chess_position_encoding_mixin import (
     OneHotEncodingChessPositionMixin,
 )
@@ -23,7 +24,7 @@ class OpeningEmbedder(SplitDataTrainTestMixin, OneHotEncodingChessPositionMixin)
         self.__positions: list[list[int]] = []
         self.__positions_train: list[list[int]] = []
         self.__positions_test: list[list[int]] = []
-        self.__unique_openings_names: list = []
+        self.__labels_vocabulary = LabelVocabulary()
         self.__model: Optional[Model] = None
 
         self.__load_database(data)
@@ -35,7 +36,7 @@ class OpeningEmbedder(SplitDataTrainTestMixin, OneHotEncodingChessPositionMixin)
             return 3
 
         # Proposed by fast.ai, proper way, made to reuse:
-        return min(50, int(len(self.__unique_openings_names) + 1 / 2))
+        return min(50, int(len(self.__labels_vocabulary) + 1 / 2))
 
     def __load_database(self, data: list[tuple[str, list[list[str]]]]) -> None:
         positions_not_encoded = []
@@ -44,14 +45,10 @@ class OpeningEmbedder(SplitDataTrainTestMixin, OneHotEncodingChessPositionMixin)
             self.__openings_names.append(opening_name)
             positions_not_encoded.append(position)
 
-            if opening_name not in self.__unique_openings_names:
-                self.__unique_openings_names.append(opening_name)
-
         # the result is: chess board positions and index of played opening
-        # position - index (from lookup = self.__unique_openings_names)
-        self.__unique_openings_names.sort()
-        for opening in self.__openings_names:
-            self.__openings_indices.append(self.__unique_openings_names.index(opening))
+        # position - index (from lookup = sorted unique openings names)
+        self.__labels_vocabulary = LabelVocabulary.from_labels(self.__openings_names)
+        self.__openings_indices = self.__labels_vocabulary.encode_many(self.__openings_names).tolist()
 
         # encoding positions to one-hot (8x8->8x8x6x2)
         # and flattening it (8x8x6x2->768)
@@ -73,7 +70,7 @@ class OpeningEmbedder(SplitDataTrainTestMixin, OneHotEncodingChessPositionMixin)
 
     def __build_model(self) -> Sequential:
         model = Sequential()
-        embedding_layer = Embedding(len(self.__unique_openings_names), self.__embedding_size, input_length=768)
+        embedding_layer = Embedding(len(self.__labels_vocabulary), self.__embedding_size, input_length=768)
         model.add(embedding_layer)
         model.add(Flatten())
         model.add(Dense(256, activation="relu"))
@@ -84,7 +81,7 @@ class OpeningEmbedder(SplitDataTrainTestMixin, OneHotEncodingChessPositionMixin)
         model.add(Dropout(0.3))
         model.add(Dense(16, activation="relu"))
         model.add(Dropout(0.3))
-        model.add(Dense(len(self.__unique_openings_names), activation="softmax"))
+        model.add(Dense(len(self.__labels_vocabulary), activation="softmax"))
         model.compile(
             optimizer=Adam(learning_rate=0.001), loss="sparse_categorical_crossentropy", metrics=["accuracy"]
         )
@@ -117,7 +114,7 @@ class OpeningEmbedder(SplitDataTrainTestMixin, OneHotEncodingChessPositionMixin)
         if self.__model is None:
             raise ValueError("Model not created.")
 
-        return self.__unique_openings_names, self.__model.layers[0].get_weights()[0]
+        return self.__labels_vocabulary.labels, self.__model.layers[0].get_weights()[0]
 
 
 ############################
@@ -1,21 +1,19 @@
 import pickle
 import sys
+from collections.abc import Sequence
 from typing import Any, List, Tuple
 
+from chess_keras.label_vocabulary import LabelVocabulary
 
-def get_label_encoded_unique_openings_names(opening_names: list[str]) -> list[tuple[str, int]]:
-    unique_names = []
-    for name in opening_names:
-        if name not in unique_names:
-            unique_names.append(name)
-    unique_names.sort()
 
-    return [(unique_names[idx], idx) for idx in range(len(unique_names))]
+def get_label_encoded_unique_openings_names(opening_names: Sequence[str]) -> list[tuple[str, int]]:
+    return LabelVocabulary.from_labels(opening_names).to_encoded_pairs()
 
 
 def get_encoded_openings_names_and_moves(
-    openings_names: list[str], white_moves: list[list[str]], black_moves: list[list[str]]
+    openings_names: Sequence[str], white_moves: Sequence[list[str]], black_moves: Sequence[list[str]]
 ) -> list[tuple[str, list[str], list[str]]]:
+    # also accepts ColumnarGameStore.get_openings_names_and_moves() columns
     return [(openings_names[idx], white_moves[idx], black_moves[idx]) for idx in range(len(openings_names))]
 
 
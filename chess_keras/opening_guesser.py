@@ -1,5 +1,6 @@
 import logging
 from itertools import chain
+from typing import Optional, Union
 
 import numpy as np
 import tensorflow as tf
@@ -19,6 +20,7 @@ from keras.optimizers import Adam
 from scipy.sparse import issparse  # fix for hanging model training
 from typing_extensions import Any
 
+from chess_keras.label_vocabulary import LabelVocabulary
 from chess_keras.one_hot_chess_position_encoding_mixin import (
     OneHotEncodingChessPositionMixin,
 )
@@ -30,8 +32,7 @@ class Guesser(SplitDataTrainTestMixin, OneHotEncodingChessPositionMixin):
     def __init__(self) -> None:
         super().__init__()
         self.__model: Sequential = Sequential()
-        self.__unique_opening_names: list = []
-        self.__unique_opening_names_encoded: list = []
+        self.__labels_vocabulary = LabelVocabulary()
         self.__y_test_encoded: list = []
         self.__y_train_encoded: list = []
         self.__y_test: list = []
@@ -39,6 +40,8 @@ class Guesser(SplitDataTrainTestMixin, OneHotEncodingChessPositionMixin):
         self.__y_train: list = []
         self.__x_train: list = []
         self.__train_data_len: int = 0
+        self.__weights_train: Optional[np.ndarray] = None
+        self.__weights_test: Optional[np.ndarray] = None
         self.__BOARD_SIZE = 8
 
         logging.basicConfig(level=logging.INFO)
@@ -54,33 +57,35 @@ class Guesser(SplitDataTrainTestMixin, OneHotEncodingChessPositionMixin):
         self.__logger.info("Visible devices:", tf.config.get_visible_devices())
 
     def set_database_for_model(
-        self, database: list[tuple[str, list[list[str]]]], unique_openings_encoded: list[tuple[str, int]]
+        self,
+        database: list[tuple[str, list[list[str]]]],
+        unique_openings_encoded: Union[list[tuple[str, int]], LabelVocabulary],
     ) -> None:
-        self.__unique_opening_names, self.__unique_opening_names_encoded = self.__extract_opening_names_and_encoded(
-            unique_openings_encoded
-        )
+        self.set_answers_for_model_output(unique_openings_encoded)
         self.__train_data_len, self.__x_train, self.__y_train, self.__x_test, self.__y_test = self.__prepare_database(
             database
         )
         self.__y_train_encoded, self.__y_test_encoded = self.__encode_answers()
+        self.__weights_train, self.__weights_test = None, None
 
-    def set_answers_for_model_output(self, unique_openings_encoded: list[tuple[str, int]]) -> None:
-        self.__unique_opening_names, self.__unique_opening_names_encoded = self.__extract_opening_names_and_encoded(
-            unique_openings_encoded
-        )
-
-    def __extract_opening_names_and_encoded(
-        self, unique_opening_names_and_encoded: list[tuple[str, int]]
-    ) -> tuple[list, list]:
-        names_list = []
-        encoded_list = []
-
-        for tup in unique_opening_names_and_encoded:
-            name, encode = tup
-            names_list.append(name)
-            encoded_list.append(encode)
+    def set_weighted_database_for_model(
+        self,
+        database: list[tuple[str, list[list[str]]]],
+        weights: np.ndarray,
+        unique_openings_encoded: Union[list[tuple[str, int]], LabelVocabulary],
+    ) -> None:
+        # e.g. DeduplicatedPositionStore.get_weighted_samples: every position once, weighted by its occurrences
+        self.set_database_for_model(database, unique_openings_encoded)
+        self.__weights_train, self.__weights_test = self.split_weights_to_train_and_test(weights, len(database))
 
-        return names_list, encoded_list
+    def set_answers_for_model_output(
+        self, unique_openings_encoded: Union[list[tuple[str, int]], LabelVocabulary]
+    ) -> None:
+        # model output idx is the label id
+        if isinstance(unique_openings_encoded, LabelVocabulary):
+            self.__labels_vocabulary = unique_openings_encoded
+        else:
+            self.__labels_vocabulary = LabelVocabulary.from_encoded_pairs(unique_openings_encoded)
 
     def create_model(self) -> None:
         self.__model = self.__build_model()
@@ -109,18 +114,10 @@ class Guesser(SplitDataTrainTestMixin, OneHotEncodingChessPositionMixin):
 
         return opening_names, positions
 
-    def __encode_to_answers_indices(self, answers_opening_name: list) -> list[list]:
-        encoded = []
-        for opening_name in answers_opening_name:
-            idx = self.__unique_opening_names.index(opening_name)
-            encode = self.__unique_opening_names_encoded[idx]
-            encoded.append(encode)
-        return encoded
-
     def __encode_answers(self) -> tuple[list, list]:
-        y_train_encoded = self.__encode_to_answers_indices(self.__y_train)
-        y_test_encoded = self.__encode_to_answers_indices(self.__y_test)
-        return list(y_train_encoded), list(y_test_encoded)
+        y_train_encoded = self.__labels_vocabulary.encode_many(self.__y_train)
+        y_test_encoded = self.__labels_vocabulary.encode_many(self.__y_test)
+        return y_train_encoded.tolist(), y_test_encoded.tolist()
 
     @staticmethod
     def __residual_block(x: Any, kernel_size: int) -> Any:
@@ -145,7 +142,7 @@ class Guesser(SplitDataTrainTestMixin, OneHotEncodingChessPositionMixin):
         x = Dense(64, activation="relu")(x)
         x = BatchNormalization()(x)
         x = Dense(16, activation="relu")(x)
-        outputs = Dense(len(self.__unique_opening_names_encoded), activation="softmax")(x)
+        outputs = Dense(len(self.__labels_vocabulary), activation="softmax")(x)
 
         model = Model(inputs=inputs, outputs=outputs)
         model.compile(
@@ -166,14 +163,29 @@ class Guesser(SplitDataTrainTestMixin, OneHotEncodingChessPositionMixin):
                 batch_size=batch_size,
                 epochs=epochs,
                 verbose=1,
-                validation_data=(self.__x_test, self.__y_test_encoded),
+                validation_data=self.__get_validation_data(),
                 callbacks=callbacks_list,
+                sample_weight=self.__weights_train,
             )
         else:
-            self.__model.fit(self.__x_train, self.__y_train_encoded, batch_size=batch_size, epochs=epochs, verbose=1)
+            self.__model.fit(
+                self.__x_train,
+                self.__y_train_encoded,
+                batch_size=batch_size,
+                epochs=epochs,
+                verbose=1,
+                sample_weight=self.__weights_train,
+            )
+
+    def __get_validation_data(self) -> tuple:
+        if self.__weights_test is None:
+            return self.__x_test, self.__y_test_encoded
+        return self.__x_test, self.__y_test_encoded, self.__weights_test
 
     def evaluate(self) -> None:
-        loss, accuracy = self.__model.evaluate(self.__x_test, self.__y_test_encoded, verbose=0)
+        loss, accuracy = self.__model.evaluate(
+            self.__x_test, self.__y_test_encoded, sample_weight=self.__weights_test, verbose=0
+        )
         self.__logger.info(f"Test loss: {loss:.4f}, Test accuracy: {accuracy:.4f}")
 
     def predict_given(self, x: list) -> None:
@@ -181,7 +193,7 @@ class Guesser(SplitDataTrainTestMixin, OneHotEncodingChessPositionMixin):
         flattened = list(chain.from_iterable(chain.from_iterable(chain.from_iterable(encoded))))
         prediction = self.__model.predict(np.reshape(flattened, (1, 768)))
         idx = np.argmax(prediction)
-        self.__logger.info(f"{self.__unique_opening_names[idx]}")
+        self.__logger.info(f"{self.__labels_vocabulary.decode(int(idx))}")
 
     def save_model(self, path: str) -> None:
         self.__model.save(path)
@@ -6,10 +6,10 @@ from typing_extensions import Any
 class SplitDataTrainTestMixin:
     def __init__(self) -> None:
         self.split_value = 0.2  # <0;1>
+        self.__last_split_indices = (0, 0)
 
     def split_to_train_and_test(self, x: list, y: list, length: int) -> tuple[list, list, list, list]:
-        split_idx_left = int(np.random.uniform(0, 1 - self.split_value) * length)
-        split_idx_right = split_idx_left + int(self.split_value * length)
+        split_idx_left, split_idx_right = self.__get_split_indices(length)
 
         x_train = np.concatenate((x[:split_idx_left], x[split_idx_right:])).tolist()
         y_train = np.concatenate((y[:split_idx_left], y[split_idx_right:])).tolist()
@@ -18,3 +18,19 @@ class SplitDataTrainTestMixin:
         y_test = np.array(y[split_idx_left:split_idx_right]).tolist()
 
         return x_train, y_train, x_test, y_test
+
+    def split_weights_to_train_and_test(self, weights: np.ndarray, length: int) -> tuple[np.ndarray, np.ndarray]:
+        # same split as the last split_to_train_and_test call
+        split_idx_left, split_idx_right = self.__last_split_indices
+        if len(weights) != length:
+            raise ValueError(f"Expected {length} weights, got {len(weights)}")
+
+        weights_train = np.concatenate((weights[:split_idx_left], weights[split_idx_right:]))
+        weights_test = np.array(weights[split_idx_left:split_idx_right])
+        return weights_train, weights_test
+
+    def __get_split_indices(self, length: int) -> tuple[int, int]:
+        split_idx_left = int(np.random.uniform(0, 1 - self.split_value) * length)
+        split_idx_right = split_idx_left + int(self.split_value * length)
+        self.__last_split_indices = (split_idx_left, split_idx_right)
+        return split_idx_left, split_idx_right
@@ -0,0 +1,65 @@
+import os
+from math import ceil
+
+import pygame
+from pygame import Surface
+
+from chess_logic_and_presentation.pieces.piece import Piece
+from root_dir_mixin import ROOT_DIR
+
+IMAGES_DIRECTORY = os.path.join(ROOT_DIR, "static", "128px")
+SQUARE_BLACK_FILENAME = "square gray dark _png_shadow_128px.png"
+SQUARE_WHITE_FILENAME = "square gray light _png_shadow_128px.png"
+PIECES_IMAGES_FILENAMES = {
+    "ROOK_BLACK": "b_rook_png_shadow_128px.png",
+    "BISHOP_BLACK": "b_bishop_png_shadow_128px.png",
+    "KNIGHT_BLACK": "b_knight_png_shadow_128px.png",
+    "QUEEN_BLACK": "b_queen_png_shadow_128px.png",
+    "KING_BLACK": "b_king_png_shadow_128px.png",
+    "PAWN_BLACK": "b_pawn_png_shadow_128px.png",
+    "ROOK_WHITE": "w_rook_png_shadow_128px.png",
+    "BISHOP_WHITE": "w_bishop_png_shadow_128px.png",
+    "KNIGHT_WHITE": "w_knight_png_shadow_128px.png",
+    "QUEEN_WHITE": "w_queen_png_shadow_128px.png",
+    "KING_WHITE": "w_king_png_shadow_128px.png",
+    "PAWN_WHITE": "w_pawn_png_shadow_128px.png",
+}
+
+
+class BoardImages:
+    # Rendering assets of the visualizer: images are loaded once, pieces images are shared by all pieces
+    # of the same name. Scaled images are always made from the loaded ones, so resizing doesn't degrade them.
+    def __init__(self) -> None:
+        self.__square_black_original = BoardImages.__load_image(SQUARE_BLACK_FILENAME)
+        self.__square_white_original = BoardImages.__load_image(SQUARE_WHITE_FILENAME)
+        self.__pieces_originals = {
+            piece_name: BoardImages.__load_image(filename) for piece_name, filename in PIECES_IMAGES_FILENAMES.items()
+        }
+
+        self.__square_black_image = self.__square_black_original
+        self.__square_white_image = self.__square_white_original
+        self.__pieces_images = dict(self.__pieces_originals)
+
+    @property
+    def square_black_image(self) -> Surface:
+        return self.__square_black_image
+
+    @property
+    def square_white_image(self) -> Surface:
+        return self.__square_white_image
+
+    def get_piece_image(self, piece: Piece) -> Surface:
+        return self.__pieces_images[piece.piece_name]
+
+    def resize(self, width: int, height: int, tiles_in_row: int) -> None:
+        tile_size = (ceil(width / tiles_in_row), ceil(height / tiles_in_row))
+        self.__square_black_image = pygame.transform.scale(self.__square_black_original, tile_size)
+        self.__square_white_image = pygame.transform.scale(self.__square_white_original, tile_size)
+        self.__pieces_images = {
+            piece_name: pygame.transform.smoothscale(image, tile_size)
+            for piece_name, image in self.__pieces_originals.items()
+        }
+
+    @staticmethod
+    def __load_image(filename: str) -> Surface:
+        return pygame.image.load(os.path.join(IMAGES_DIRECTORY, filename))
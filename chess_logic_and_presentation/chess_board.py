@@ -1,31 +1,72 @@
 import logging
-import os
-from itertools import zip_longest
 from string import ascii_lowercase
-from typing import Optional, Tuple
-
-import pygame
-from pygame import Surface
+from typing import NamedTuple, Optional, Tuple
 
 from chess_logic_and_presentation.pieces.bishop import Bishop
 from chess_logic_and_presentation.pieces.king import King
 from chess_logic_and_presentation.pieces.knight import Knight
 from chess_logic_and_presentation.pieces.pawn import Pawn
+from chess_logic_and_presentation.pieces.piece import Piece
 from chess_logic_and_presentation.pieces.queen import Queen
 from chess_logic_and_presentation.pieces.rook import Rook
-from root_dir_mixin import ROOT_DIR
+from chess_logic_and_presentation.square_tables import (
+    BISHOP_DIRECTIONS,
+    BOARD_SIZE,
+    QUEEN_DIRECTIONS,
+    RAYS,
+    SQUARES_COUNT,
+    get_square_index,
+    get_square_notation,
+)
+from chess_logic_and_presentation.zobrist_keys import (
+    ALL_CASTLING_RIGHTS,
+    BLACK_MOVING_KEY,
+    CASTLING_RIGHTS_KEPT,
+    CASTLING_RIGHTS_KEYS,
+    ENPASSANT_COLUMNS_KEYS,
+    PIECES_SQUARES_KEYS,
+)
 
-SQUARE_BLACK_FILENAME = "square gray dark _png_shadow_128px.png"
-SQUARE_WHITE_FILENAME = "square gray light _png_shadow_128px.png"
 GAME_ANY_ENDING_NOTATION = ["1-0", "1/2-1/2", "0-1"]
 
+# changes of squares made by a move: (change, piece, square index before the move)
+PIECE_MOVED, PIECE_REMOVED, PIECE_ADDED = range(3)
+SquareChange = tuple[int, Piece, int]
+
+
+class MoveUndo(NamedTuple):
+    # state before the move and the changes of squares it made, undone in reverse order
+    is_white_moving: bool
+    where_enpassant_possible: Optional[int]
+    last_move_from_to: Optional[tuple[int, int]]
+    castling_rights: int
+    zobrist_key: int
+    square_changes: list[SquareChange]
+
+
+class BoardSnapshot(NamedTuple):
+    # pieces (in pieces lists order) with their squares, restored by the board which made the snapshot
+    pieces: tuple[tuple[Piece, int], ...]
+    is_white_moving: bool
+    where_enpassant_possible: Optional[int]
+    last_move_from_to: Optional[tuple[int, int]]
+    castling_rights: int
+    zobrist_key: int
+    undo_stack: tuple[MoveUndo, ...]
+
 
 class Board:
+    # chess logic only (no pygame), rendering assets are owned by the visualizer
     TILES_IN_ROW = 8
 
     def __init__(self) -> None:
-        self.__where_enpassant_possible: Optional[str] = None
-        self.__last_move_from_to: Optional[tuple[str, str]] = None
+        # squares indices, notation is made only by the last_move_from_to property
+        self.__where_enpassant_possible: Optional[int] = None
+        self.__last_move_from_to: Optional[tuple[int, int]] = None
+        # zobrist_keys.CASTLING_* bits, lost when a king or a rook leaves its square (or a rook is taken)
+        self.__castling_rights = ALL_CASTLING_RIGHTS
+        # updated by every change of squares and of the state above, see __compute_zobrist_key
+        self.__zobrist_key = 0
 
         self.__is_white_moving = True
         self.__pawns_white: list[Pawn] = []
@@ -42,33 +83,24 @@ class Board:
         self.__king_black: list[King] = []
         self.__pieces_white: list[list] = []
         self.__pieces_black: list[list] = []
+        # mailbox: piece standing on every square (get_square_index), kept in sync with the pieces lists
+        self.__squares: list[Optional[Piece]] = []
+        self.__pieces_arrs_by_name: dict[str, list] = {}
+        # is_white -> {pinned piece square index: direction from the king}, cleared on every change of squares
+        self.__pinned_pieces_cache: dict[bool, dict[int, tuple[int, int]]] = {}
+        self.__undo_stack: list[MoveUndo] = []
+        self.__square_changes: list[SquareChange] = []
         self.__create_pieces()
-        self.__square_black_image: Optional[Surface] = None
-        self.__square_white_image: Optional[Surface] = None
-        self.__load_board_tiles_images()
 
         logging.basicConfig(level=logging.INFO)
         self.__logger = logging.getLogger(__name__)
 
-    @property
-    def square_white_image(self) -> Optional[Surface]:
-        return self.__square_white_image
-
-    @square_white_image.setter
-    def square_white_image(self, value: Surface) -> None:
-        self.__square_white_image = value
-
-    @property
-    def square_black_image(self) -> Optional[Surface]:
-        return self.__square_black_image
-
-    @square_black_image.setter
-    def square_black_image(self, value: Surface) -> None:
-        self.__square_black_image = value
-
     @property
     def last_move_from_to(self) -> Optional[Tuple[str, str]]:
-        return self.__last_move_from_to
+        if self.__last_move_from_to is None:
+            return None
+        move_from, move_to = self.__last_move_from_to
+        return get_square_notation(move_from), get_square_notation(move_to)
 
     @property
     def is_white_moving(self) -> bool:
@@ -130,9 +162,45 @@ class Board:
     def pieces_black(self) -> list[list]:
         return self.__pieces_black
 
-    def __load_board_tiles_images(self) -> None:
-        self.__square_black_image = pygame.image.load(os.path.join(ROOT_DIR, "static", "128px", SQUARE_BLACK_FILENAME))
-        self.__square_white_image = pygame.image.load(os.path.join(ROOT_DIR, "static", "128px", SQUARE_WHITE_FILENAME))
+    @property
+    def squares(self) -> list[Optional[Piece]]:
+        return self.__squares
+
+    def get_piece_at(self, notation: str) -> Optional[Piece]:
+        return self.__squares[get_square_index(notation)]
+
+    def get_king(self, is_white: bool) -> King:
+        return self.__king_white[0] if is_white else self.__king_black[0]
+
+    def get_pinned_pieces(self, is_white: bool) -> dict[int, tuple[int, int]]:
+        # pieces of the side pinned to their king: square index -> direction from the king to the piece
+        pinned_pieces = self.__pinned_pieces_cache.get(is_white)
+        if pinned_pieces is None:
+            pinned_pieces = self.__find_pinned_pieces(is_white)
+            self.__pinned_pieces_cache[is_white] = pinned_pieces
+        return pinned_pieces
+
+    def __find_pinned_pieces(self, is_white: bool) -> dict[int, tuple[int, int]]:
+        # along every ray from the king: allied piece first, then an enemy able to slide in this direction
+        pinned_pieces: dict[int, tuple[int, int]] = {}
+        king_square_index = self.get_king(is_white).square_index
+        for direction in QUEEN_DIRECTIONS:
+            pinned_square_index = None
+            for square_index in RAYS[king_square_index][direction]:
+                piece = self.__squares[square_index]
+                if piece is None:
+                    continue
+                if pinned_square_index is None:
+                    if piece.is_white != is_white:
+                        break
+                    pinned_square_index = square_index
+                    continue
+
+                pinning_piece_type = Bishop if direction in BISHOP_DIRECTIONS else Rook
+                if piece.is_white != is_white and isinstance(piece, (Queen, pinning_piece_type)):
+                    pinned_pieces[pinned_square_index] = direction
+                break
+        return pinned_pieces
 
     def __create_pieces(self) -> None:
         self.__last_move_from_to = None
@@ -167,52 +235,164 @@ class Board:
             self.__king_black,
         ]
 
+        self.__squares = [None] * SQUARES_COUNT
+        self.__pinned_pieces_cache = {}
+        self.__pieces_arrs_by_name = {}
+        for pieces_arr in self.__pieces_white + self.__pieces_black:
+            self.__pieces_arrs_by_name[pieces_arr[0].piece_name] = pieces_arr
+            for piece in pieces_arr:
+                self.__squares[piece.square_index] = piece
+
+        self.__castling_rights = ALL_CASTLING_RIGHTS
+        self.__zobrist_key = self.__compute_zobrist_key()
+
     def reset_game(self) -> None:
         self.__is_white_moving = True
+        self.__where_enpassant_possible = None
+        self.__undo_stack = []
         self.__create_pieces()
 
+    @property
+    def zobrist_key(self) -> int:
+        # 64-bit key of the position (pieces, side to move, castling rights, en passant), same in every process
+        return self.__zobrist_key
+
+    def __compute_zobrist_key(self) -> int:
+        # from scratch, make_move updates the key incrementally
+        zobrist_key = CASTLING_RIGHTS_KEYS[self.__castling_rights] ^ self.__get_enpassant_key()
+        if not self.__is_white_moving:
+            zobrist_key ^= BLACK_MOVING_KEY
+        for piece in self.__squares:
+            if piece is not None:
+                zobrist_key ^= PIECES_SQUARES_KEYS[piece.piece_name][piece.square_index]
+        return zobrist_key
+
+    def __get_enpassant_key(self) -> int:
+        # en passant square counts only if a pawn of the side to move stands next to the pawn which can be taken
+        if self.__where_enpassant_possible is None:
+            return 0
+
+        column = self.__where_enpassant_possible % BOARD_SIZE
+        pawn_square_index = self.__where_enpassant_possible + (-BOARD_SIZE if self.__is_white_moving else BOARD_SIZE)
+        for side_column in (column - 1, column + 1):
+            if 0 <= side_column < BOARD_SIZE:
+                piece = self.__squares[pawn_square_index - column + side_column]
+                if isinstance(piece, Pawn) and piece.is_white == self.__is_white_moving:
+                    return ENPASSANT_COLUMNS_KEYS[column]
+        return 0
+
+    @property
+    def made_moves_count(self) -> int:
+        # moves which can be undone
+        return len(self.__undo_stack)
+
+    def snapshot(self) -> BoardSnapshot:
+        return BoardSnapshot(
+            tuple(
+                (piece, piece.square_index)
+                for pieces_arr in self.__pieces_arrs_by_name.values()
+                for piece in pieces_arr
+            ),
+            self.__is_white_moving,
+            self.__where_enpassant_possible,
+            self.__last_move_from_to,
+            self.__castling_rights,
+            self.__zobrist_key,
+            tuple(self.__undo_stack),
+        )
+
+    def restore(self, snapshot: BoardSnapshot) -> None:
+        # pieces lists are refilled in place, pieces promoted after the snapshot are dropped
+        self.__pinned_pieces_cache = {}
+        for pieces_arr in self.__pieces_arrs_by_name.values():
+            pieces_arr.clear()
+        self.__squares = [None] * SQUARES_COUNT
+        for piece, square_index in snapshot.pieces:
+            piece.square_index = square_index
+            self.__pieces_arrs_by_name[piece.piece_name].append(piece)
+            self.__squares[square_index] = piece
+
+        self.__is_white_moving = snapshot.is_white_moving
+        self.__where_enpassant_possible = snapshot.where_enpassant_possible
+        self.__last_move_from_to = snapshot.last_move_from_to
+        self.__castling_rights = snapshot.castling_rights
+        self.__zobrist_key = snapshot.zobrist_key
+        self.__undo_stack = list(snapshot.undo_stack)
+
+    def undo_move(self) -> None:
+        if not self.__undo_stack:
+            raise ValueError("No move to undo")
+
+        move_undo = self.__undo_stack.pop()
+        self.__pinned_pieces_cache = {}
+        for change, piece, square_index in reversed(move_undo.square_changes):
+            if change == PIECE_MOVED:
+                self.__squares[piece.square_index] = None
+                self.__squares[square_index] = piece
+                piece.square_index = square_index
+            elif change == PIECE_REMOVED:
+                # captured piece could have been moved meanwhile, on a branch dropped by restore
+                piece.square_index = square_index
+                self.__pieces_arrs_by_name[piece.piece_name].append(piece)
+                self.__squares[square_index] = piece
+            else:
+                self.__pieces_arrs_by_name[piece.piece_name].remove(piece)
+                self.__squares[square_index] = None
+
+        self.__is_white_moving = move_undo.is_white_moving
+        self.__where_enpassant_possible = move_undo.where_enpassant_possible
+        self.__last_move_from_to = move_undo.last_move_from_to
+        self.__castling_rights = move_undo.castling_rights
+        self.__zobrist_key = move_undo.zobrist_key
+
     def make_move(self, move: str) -> bool:
+        # changes of squares made by the move are recorded, so it can be undone
+        move_undo = MoveUndo(
+            self.__is_white_moving,
+            self.__where_enpassant_possible,
+            self.__last_move_from_to,
+            self.__castling_rights,
+            self.__zobrist_key,
+            [],
+        )
+        self.__square_changes = move_undo.square_changes
+        # pieces keys are updated by the changes of squares, keys of the state are replaced after the move
+        state_keys = CASTLING_RIGHTS_KEYS[self.__castling_rights] ^ self.__get_enpassant_key()
+        is_new_piece_added = self.__make_move(move)
+        self.__zobrist_key ^= (
+            state_keys ^ CASTLING_RIGHTS_KEYS[self.__castling_rights] ^ self.__get_enpassant_key() ^ BLACK_MOVING_KEY
+        )
+        self.__undo_stack.append(move_undo)
+        return is_new_piece_added
+
+    def __make_move(self, move: str) -> bool:
         is_new_piece_added = False
-        pieces_arr: list = []
         move_from = None
         is_taking = True if "x" in move else False
-        move, move_to, ambiguity_help, promoting_to = self.__parse_move_notation(move)
+        move, move_to_notation, ambiguity_help, promoting_to = self.__parse_move_notation(move)
+        move_to = get_square_index(move_to_notation)
 
         if move[0] in ascii_lowercase:
-            is_new_piece_added, pieces_arr, move_from = self.__handle_pawn_move(
-                is_taking, move_to, ambiguity_help, promoting_to
-            )
+            move_from = self.__handle_pawn_move(is_taking, move_to, ambiguity_help)
+            is_new_piece_added = promoting_to is not None
         else:
             # any other piece
             self.__where_enpassant_possible = None
             if move[0] == "R":
                 # rook
-                pieces_arr = self.__rooks_white if self.__is_white_moving else self.__rooks_black
-                move_from = Rook.find_possible_move(
-                    pieces_arr, move_to, ambiguity_help, self.__pieces_white, self.__pieces_black
-                )
+                move_from = Rook.find_possible_move(move_to, ambiguity_help, self)
             elif move[0] == "N":
                 # kNight
-                pieces_arr = self.__knights_white if self.__is_white_moving else self.__knights_black
-                move_from = Knight.find_possible_move(
-                    pieces_arr, move_to, ambiguity_help, self.__pieces_white, self.__pieces_black
-                )
+                move_from = Knight.find_possible_move(move_to, ambiguity_help, self)
             elif move[0] == "B":
                 # bishop
-                pieces_arr = self.__bishops_white if self.__is_white_moving else self.__bishops_black
-                move_from = Bishop.find_possible_move(
-                    pieces_arr, move_to, ambiguity_help, self.__pieces_white, self.__pieces_black
-                )
+                move_from = Bishop.find_possible_move(move_to, ambiguity_help, self)
             elif move[0] == "Q":
                 # queen
-                pieces_arr = self.__queen_white if self.__is_white_moving else self.__queen_black
-                move_from = Queen.find_possible_move(
-                    pieces_arr, move_to, ambiguity_help, self.__pieces_white, self.__pieces_black
-                )
+                move_from = Queen.find_possible_move(move_to, ambiguity_help, self)
             elif move[0] == "K":
                 # king
-                pieces_arr = self.__king_white if self.__is_white_moving else self.__king_black
-                move_from = King.find_possible_move(pieces_arr, move_to)
+                move_from = King.find_possible_move(move_to, self)
             elif move == "O-O" or move == "O-O-O":
                 self.__handle_castle_move(move)
                 self.__is_white_moving = not self.__is_white_moving
@@ -221,9 +401,11 @@ class Board:
         if move_from is None:
             raise ValueError(f"Illegal move: {move}")
 
-        Board.move_piece_from_to(pieces_arr, move_from, move_to)
         if is_taking:
             self.__delete_opposite_player_piece(move_to)
+        self.__move_piece(move_from, move_to)
+        if promoting_to is not None:
+            self.__promote_pawn(promoting_to, move_to)
         self.__last_move_from_to = (move_from, move_to)
         self.__is_white_moving = not self.__is_white_moving
         return is_new_piece_added
@@ -267,41 +449,29 @@ class Board:
 
         return move, move_to, ambiguity_help, promoting_to
 
-    def __handle_pawn_move(
-        self, is_taking: bool, move_to: str, ambiguity_help: Optional[str], promoting_to: Optional[str]
-    ) -> tuple[bool, list[Pawn], str]:
-        is_new_piece_added = False
-        pieces_arr = self.__pawns_white if self.__is_white_moving else self.__pawns_black
-        move_from = Pawn.find_possible_move(pieces_arr, is_taking, move_to, ambiguity_help, self.__is_white_moving)
+    def __handle_pawn_move(self, is_taking: bool, move_to: int, ambiguity_help: Optional[str]) -> int:
+        move_from = Pawn.find_possible_move(move_to, is_taking, ambiguity_help, self)
 
         if move_from is None:
             self.__logger.error("Pawn has not found inputted move.")
             raise RuntimeError
 
         if is_taking and self.__where_enpassant_possible == move_to:
-            self.__delete_opposite_player_piece(move_to[0] + move_from[1])
+            # taken pawn stands next to the pawn taking en passant, in the column of move_to
+            self.__delete_opposite_player_piece(move_from - move_from % BOARD_SIZE + move_to % BOARD_SIZE)
 
-        if abs(ord(move_from[1]) - ord(move_to[1])) == 2:
-            diff = (ord(move_from[1]) - ord(move_to[1])) // 2
-            self.__where_enpassant_possible = chr(ord(move_from[0])) + chr(ord(move_from[1]) - diff)
+        if abs(move_from - move_to) == 2 * BOARD_SIZE:
+            self.__where_enpassant_possible = (move_from + move_to) // 2
         else:
             self.__where_enpassant_possible = None
 
-        self.__add_promoted_piece(promoting_to, move_to)
-        if promoting_to is not None:
-            self.__is_white_moving = not self.__is_white_moving
-            self.__delete_opposite_player_piece(move_from)
-            self.__is_white_moving = not self.__is_white_moving
-            is_new_piece_added = True
-
-        return is_new_piece_added, pieces_arr, move_from
+        return move_from
 
     def __handle_castle_move(self, move: str) -> None:
         diff_king, diff_rook = 0, 0
 
         # king moves 2 squares towards rook, rook over king
         king = self.__king_white if self.__is_white_moving else self.__king_black
-        rooks = self.__rooks_white if self.__is_white_moving else self.__rooks_black
         if move == "O-O":
             diff_king = +2
             diff_rook = -1
@@ -309,63 +479,67 @@ class Board:
             diff_king = -2
             diff_rook = +1
 
-        rook_pos = None
-        for r in rooks:
-            if r.position_notation[1] != king[0].position_notation[1]:
-                continue
-            if move == "O-O-O" and r.position_notation[0] < king[0].position_notation:
-                rook_pos = r
-                break
-            elif move == "O-O" and r.position_notation[0] > king[0].position_notation:
-                rook_pos = r
-                break
-
-        if rook_pos is None or king is None or rooks is None:
+        # castling rook stands in the corner of the king's row
+        king_square_index = king[0].square_index
+        row_start = king_square_index - king_square_index % BOARD_SIZE
+        rook = self.__squares[row_start + (BOARD_SIZE - 1 if move == "O-O" else 0)]
+        if not isinstance(rook, Rook) or rook.is_white != self.__is_white_moving:
             raise NotImplementedError
 
-        self.__last_move_from_to = (king[0].position_notation, rook_pos.position_notation)
-        king_pos = chr(ord(king[0].position_notation[0]) + diff_king) + chr(ord(king[0].position_notation[1]))
-        new_rook_pos = chr(ord(king_pos[0]) + diff_rook) + chr(ord(king_pos[1]))
-
-        # list(king) -> https://mypy.readthedocs.io/en/stable/common_issues.html#variance
-        Board.move_piece_from_to(list(king), king[0].position_notation, king_pos)
-        Board.move_piece_from_to(list(rooks), rook_pos.position_notation, new_rook_pos)
+        self.__last_move_from_to = (king_square_index, rook.square_index)
+        new_king_square_index = king_square_index + diff_king
+        self.__move_piece(king_square_index, new_king_square_index)
+        self.__move_piece(rook.square_index, new_king_square_index + diff_rook)
 
-    def __add_promoted_piece(self, promoting_to: Optional[str], move_to: str) -> None:
-        if promoting_to is None:
-            return
+    def __promote_pawn(self, promoting_to: str, move_to: int) -> None:
+        # pawn already stands on move_to, it is replaced by the new piece
+        self.__remove_piece(move_to)
 
+        promoted_piece: Piece
         if promoting_to == "Q":
-            if self.__is_white_moving:
-                self.__queen_white.append(Queen(move_to, True))
-            else:
-                self.__queen_black.append(Queen(move_to, False))
+            promoted_piece = Queen(move_to, self.__is_white_moving)
         elif promoting_to == "R":
-            if self.__is_white_moving:
-                self.__rooks_white.append(Rook(move_to, True))
-            else:
-                self.__rooks_black.append(Rook(move_to, False))
+            promoted_piece = Rook(move_to, self.__is_white_moving)
         elif promoting_to == "N":
-            if self.__is_white_moving:
-                self.__knights_white.append(Knight(move_to, True))
-            else:
-                self.__knights_black.append(Knight(move_to, False))
+            promoted_piece = Knight(move_to, self.__is_white_moving)
         elif promoting_to == "B":
-            if self.__is_white_moving:
-                self.__bishops_white.append(Bishop(move_to, True))
-            else:
-                self.__bishops_black.append(Bishop(move_to, False))
-
-    def __delete_opposite_player_piece(self, move_to: str) -> None:
-        pieces_deleted = self.__pieces_white
-        if self.__is_white_moving:
-            pieces_deleted = self.__pieces_black
-
-        for arr in pieces_deleted:
-            for p in arr:
-                if p.position_notation == move_to:
-                    arr.remove(p)
-                    return
+            promoted_piece = Bishop(move_to, self.__is_white_moving)
+        else:
+            raise ValueError(f"Illegal promotion: {promoting_to}")
+
+        self.__pieces_arrs_by_name[promoted_piece.piece_name].append(promoted_piece)
+        self.__squares[move_to] = promoted_piece
+        self.__square_changes.append((PIECE_ADDED, promoted_piece, move_to))
+        self.__zobrist_key ^= PIECES_SQUARES_KEYS[promoted_piece.piece_name][move_to]
+
+    def __delete_opposite_player_piece(self, square_index: int) -> None:
+        piece = self.__squares[square_index]
+        if piece is not None and piece.is_white != self.__is_white_moving:
+            self.__remove_piece(square_index)
+
+    def __remove_piece(self, square_index: int) -> None:
+        self.__pinned_pieces_cache = {}
+        piece = self.__squares[square_index]
+        if piece is not None:
+            self.__pieces_arrs_by_name[piece.piece_name].remove(piece)
+            self.__squares[square_index] = None
+            self.__square_changes.append((PIECE_REMOVED, piece, square_index))
+            self.__zobrist_key ^= PIECES_SQUARES_KEYS[piece.piece_name][square_index]
+            self.__castling_rights &= CASTLING_RIGHTS_KEPT[square_index]
+
+    def __move_piece(self, move_from: int, move_to: int) -> None:
+        self.__pinned_pieces_cache = {}
+        piece = self.__squares[move_from]
+        if piece is None:
+            raise ValueError(f"No piece to move from {get_square_notation(move_from)}")
+
+        piece.square_index = move_to
+        self.__squares[move_from] = None
+        self.__squares[move_to] = piece
+        self.__square_changes.append((PIECE_MOVED, piece, move_from))
+        pieces_squares_keys = PIECES_SQUARES_KEYS[piece.piece_name]
+        self.__zobrist_key ^= pieces_squares_keys[move_from] ^ pieces_squares_keys[move_to]
+        self.__castling_rights &= CASTLING_RIGHTS_KEPT[move_from]
 
     @staticmethod
     def is_notation_in_board(notation: str) -> bool:
@@ -373,77 +547,15 @@ class Board:
         column = notation[0]
         return "a" <= column <= "h" and "1" <= row <= "8"
 
-    @staticmethod
-    def is_any_notation_in_board(notations: list[str]) -> bool:
-        for n in notations:
-            if Board.is_notation_in_board(n):
+    def is_collision_found(self, move_from: str, move_to: str) -> bool:
+        # any piece between the squares of a straight or diagonal move
+        column_step = (ord(move_to[0]) > ord(move_from[0])) - (ord(move_to[0]) < ord(move_from[0]))
+        row_step = (ord(move_to[1]) > ord(move_from[1])) - (ord(move_to[1]) < ord(move_from[1]))
+        square_step = row_step * 8 + column_step
+        square_index = get_square_index(move_from) + square_step
+        to_square_index = get_square_index(move_to)
+        while square_index != to_square_index:
+            if self.__squares[square_index] is not None:
                 return True
+            square_index += square_step
         return False
-
-    @staticmethod
-    def is_collision_found(pieces_arr: list, coordinates: tuple[str, str, str, str], diag_move: bool) -> bool:
-        r_from, c_from, r_to, c_to = coordinates
-        r_first, r_second = ord(r_from), ord(r_to)
-        if r_second < r_first:
-            r_first, r_second = r_second, r_first
-        c_first, c_second = ord(c_from), ord(c_to)
-        if c_second < c_first:
-            c_first, c_second = c_second, c_first
-
-        if pieces_arr is not None:
-            for piece in pieces_arr:
-                row, column = piece.position_notation[1], piece.position_notation[0]
-                if row == r_from and column == c_from:
-                    continue
-
-                if r_first <= ord(row) <= r_second and c_first <= ord(column) <= c_second:
-                    if row == r_to and column == c_to:
-                        continue
-                    if diag_move:
-                        diag_pos = c_from + r_from
-                        diff_c = (
-                            (ord(c_to) - ord(c_from)) // abs(ord(c_to) - ord(c_from))
-                            if ord(c_to) - ord(c_from) != 0
-                            else 0
-                        )
-                        diff_r = (
-                            (ord(r_to) - ord(r_from)) // abs(ord(c_to) - ord(c_from))
-                            if ord(c_to) - ord(c_from) != 0
-                            else 0
-                        )
-
-                        while diag_pos != c_to + r_to:
-                            diag_pos = chr(ord(diag_pos[0]) + diff_c) + chr(ord(diag_pos[1]) + diff_r)
-                            if diag_pos == piece.position_notation:
-                                return True
-                    else:
-                        return True
-
-        return False
-
-    @staticmethod
-    def is_collision_found_with_any_piece_from_given(
-        move_from: str, move_to: str, pieces_white: list[list], pieces_black: list[list]
-    ) -> bool:
-        r_from, c_from = move_from[1], move_from[0]
-        r_to, c_to = move_to[1], move_to[0]
-        diff_row = ord(r_to) - ord(r_from)  # diff>0 => down to up, diff<0 up to down
-        diff_column = ord(c_to) - ord(c_from)  # diff>0 => left to right, diff<0 right to left
-        diag_move = False
-        if abs(diff_row) == abs(diff_column):
-            diag_move = True
-
-        for arr_w, arr_b in zip_longest(pieces_white, pieces_black, fillvalue=None):
-            if arr_w is not None and Board.is_collision_found(arr_w, (r_from, c_from, r_to, c_to), diag_move):
-                return True
-            if arr_b is not None and Board.is_collision_found(arr_b, (r_from, c_from, r_to, c_to), diag_move):
-                return True
-
-        return False
-
-    @staticmethod
-    def move_piece_from_to(pieces_arr: list, move_from: str, move_to: str) -> None:
-        for p in pieces_arr:
-            if p.position_notation == move_from:
-                p.position_notation = move_to
-                return
@@ -1,14 +1,16 @@
 import itertools
 import logging
+from collections.abc import Sequence
 from itertools import zip_longest
-from math import ceil
 from typing import Optional
 
 import numpy as np
 import pygame
+from pygame import Surface
 
 from chess_io import position_writer
 from chess_keras import opening_guesser
+from chess_logic_and_presentation.board_images import BoardImages
 from chess_logic_and_presentation.chess_board import GAME_ANY_ENDING_NOTATION, Board
 from chess_logic_and_presentation.pieces.piece import Piece
 
@@ -24,19 +26,18 @@ class ChessVisualizer:
         self.__game_saving_idx: Optional[int] = None
         self.__guesser: Optional[opening_guesser.Guesser] = None
         self.__position_writer: Optional[position_writer.PositionWriter] = None
-        self.__opening_names: list[str] = []
+        self.__opening_names: Sequence[str] = []
         self.__simulated_game_idx = 0
         self.__simulated_move_idx = 0
         self.__auto_visualization = False
         self.__last_move_mark_alpha = 180
-        self.__white_moves: list[list[str]] = []
-        self.__black_moves: list[list[str]] = []
+        self.__white_moves: Sequence[list[str]] = []
+        self.__black_moves: Sequence[list[str]] = []
         self.__chess_board = Board()
 
-        self.__is_pygame_used = True
-        pygame.init()
-        self.__screen = pygame.display.set_mode((DEFAULT_SCREEN_WIDTH, DEFAULT_SCREEN_HEIGHT), pygame.RESIZABLE)
-        self.__clock = pygame.time.Clock()
+        # pygame window and images are created only by run, simulation without visualization doesn't need SDL
+        self.__screen: Optional[Surface] = None
+        self.__board_images: Optional[BoardImages] = None
         self.is_running = True
         self.__is_saving_positions_to_database = False
         self.__save_every_n_entries: Optional[int] = None
@@ -44,12 +45,13 @@ class ChessVisualizer:
         logging.basicConfig(level=logging.INFO)
         self.__logger = logging.getLogger(__name__)
 
-    def get_visualization_games_database(self) -> tuple[list[str], list[list[str]], list[list[str]]]:
+    def get_visualization_games_database(self) -> tuple[Sequence[str], Sequence[list[str]], Sequence[list[str]]]:
         return self.__opening_names, self.__white_moves, self.__black_moves
 
     def set_visualization_games_database(
-        self, opening_names: list[str], white_moves: list[list[str]], black_moves: list[list[str]]
+        self, opening_names: Sequence[str], white_moves: Sequence[list[str]], black_moves: Sequence[list[str]]
     ) -> None:
+        # any sequences can be used, e.g. lazily decoded columns of ColumnarGameStore
         self.__opening_names = opening_names
         self.__white_moves = white_moves
         self.__black_moves = black_moves
@@ -114,6 +116,10 @@ class ChessVisualizer:
             self.__is_simulating_next_move = False
 
     def run(self) -> None:
+        pygame.init()
+        self.__screen = pygame.display.set_mode((DEFAULT_SCREEN_WIDTH, DEFAULT_SCREEN_HEIGHT), pygame.RESIZABLE)
+        self.__board_images = BoardImages()
+        clock = pygame.time.Clock()
         self.__resize_images()
         while self.is_running:
             self.__handle_events()
@@ -122,14 +128,14 @@ class ChessVisualizer:
             self.__save_results_to_file_every_n()
             self.__refresh_screen()
             self.__handle_render()
-            self.__clock.tick(60)
+            clock.tick(60)
         pygame.quit()
+        self.__screen = None
+        self.__board_images = None
         self.__save_results_to_file()
 
     def run_auto_simulate_no_visualization(self) -> None:
-        pygame.quit()
         self.__auto_visualization = True
-        self.__is_pygame_used = False
         while True:
             self.__handle_move_simulation()
             self.__save_position_to_database_based_on_move_index()
@@ -159,59 +165,38 @@ class ChessVisualizer:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RIGHT:
                     self.__is_simulating_next_move = True
+                if event.key == pygame.K_LEFT:
+                    self.__simulate_previous_move()
                 if event.key == pygame.K_DOWN:
                     self.__auto_visualization = not self.__auto_visualization
                 if event.key == pygame.K_UP:
                     self.__predict_opening()
 
     def __resize_images(self) -> None:
-        if self.__chess_board.square_black_image is None or self.__chess_board.square_white_image is None:
-            self.__logger.error("Square images are not set, cannot resize images")
+        if self.__screen is None or self.__board_images is None:
             return
 
-        if not self.__is_pygame_used:
-            return
-
-        width, height = self.__screen.get_size()
-        tile_width_ratio = ceil(width / self.__chess_board.TILES_IN_ROW)
-        tile_height_ratio = ceil(height / self.__chess_board.TILES_IN_ROW)
-
-        self.__chess_board.square_black_image = pygame.transform.scale(
-            self.__chess_board.square_black_image, (tile_width_ratio, tile_height_ratio)
-        )
-        self.__chess_board.square_white_image = pygame.transform.scale(
-            self.__chess_board.square_white_image, (tile_width_ratio, tile_height_ratio)
-        )
-
-        for arr_w, arr_b in zip_longest(
-            self.__chess_board.pieces_white, self.__chess_board.pieces_black, fillvalue=None
-        ):
-            if arr_w is not None:
-                for piece in arr_w:
-                    piece.image = pygame.transform.smoothscale(piece.image, (tile_width_ratio, tile_height_ratio))
-
-            if arr_b is not None:
-                for piece in arr_b:
-                    piece.image = pygame.transform.smoothscale(piece.image, (tile_width_ratio, tile_height_ratio))
+        self.__board_images.resize(*self.__screen.get_size(), self.__chess_board.TILES_IN_ROW)
 
     def __refresh_screen(self) -> None:
-        self.__screen.fill("yellow")
+        if self.__screen is not None:
+            self.__screen.fill("yellow")
 
     def __handle_board_render(self) -> None:
-        if self.__chess_board.square_black_image is None or self.__chess_board.square_white_image is None:
-            self.__logger.error("Square images are not set, cannot render board")
+        if self.__screen is None or self.__board_images is None:
+            self.__logger.error("Visualization is not running, cannot render board")
             return
 
         width, height = self.__screen.get_size()
         for row in range(1, self.__chess_board.TILES_IN_ROW + 1):
             for column in range(1, self.__chess_board.TILES_IN_ROW + 1):
-                square_img = self.__chess_board.square_white_image
+                square_img = self.__board_images.square_white_image
                 if column % 2 == 0:
                     if row % 2 == 1:
-                        square_img = self.__chess_board.square_black_image
+                        square_img = self.__board_images.square_black_image
                 else:
                     if row % 2 == 0:
-                        square_img = self.__chess_board.square_black_image
+                        square_img = self.__board_images.square_black_image
 
                 # last move mark
                 square_img.set_alpha(255)
@@ -260,6 +245,9 @@ class ChessVisualizer:
         )
 
     def __blit_piece(self, piece: Piece, overall_scale: float, width: int, height: int) -> None:
+        if self.__screen is None or self.__board_images is None:
+            return
+
         idx_h, idx_w = piece.convert_position_notation_to_image_position_indices()
         if idx_w is None or idx_h is None:
             self.__logger.error("Can't blit piece, no position found")
@@ -267,14 +255,18 @@ class ChessVisualizer:
 
         x = idx_w * width / self.__chess_board.TILES_IN_ROW
         y = idx_h * height / self.__chess_board.TILES_IN_ROW
+        piece_image = self.__board_images.get_piece_image(piece)
         img = pygame.transform.smoothscale(
-            piece.image, (piece.image.get_width() * overall_scale, piece.image.get_height() * overall_scale)
+            piece_image, (piece_image.get_width() * overall_scale, piece_image.get_height() * overall_scale)
         )
         margin_x = (width / self.__chess_board.TILES_IN_ROW - img.get_width()) / 2.0
         margin_y = (height / self.__chess_board.TILES_IN_ROW - img.get_height()) / 2.0
         self.__screen.blit(img, (x + margin_x, y + margin_y))
 
     def __render_pieces(self, pieces_zipped: itertools.zip_longest, overall_scale: float) -> None:
+        if self.__screen is None:
+            return
+
         for w, b in pieces_zipped:
             if w is not None:
                 self.__blit_piece(w, overall_scale, *self.__screen.get_size())
@@ -297,9 +289,16 @@ class ChessVisualizer:
             self.__reset_game()
             return
 
-        should_resize_images = self.__chess_board.make_move(new_move)
-        if should_resize_images:
-            self.__resize_images()
+        self.__chess_board.make_move(new_move)
+
+    def __simulate_previous_move(self) -> None:
+        # stepping back within the simulated game, moves index is advanced by black moves only
+        if not self.__chess_board.made_moves_count:
+            return
+
+        self.__chess_board.undo_move()
+        if not self.__chess_board.is_white_moving:
+            self.__simulated_move_idx -= 1
 
     def __log_game_number(self) -> None:
         simulated_game_percentage = int(self.__simulated_game_idx / (len(self.__opening_names) - 1) * 1000)
@@ -319,5 +318,3 @@ class ChessVisualizer:
         if self.__simulated_game_idx >= len(self.__opening_names):
             self.__simulated_game_idx = 0
             self.__simulated_games_database_loop_counter += 1
-
-        self.__resize_images()
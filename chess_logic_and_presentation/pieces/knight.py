@@ -1,52 +1,28 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from chess_logic_and_presentation.pieces.piece import Piece
+from chess_logic_and_presentation.square_tables import KNIGHT_TARGETS
+
+if TYPE_CHECKING:
+    from chess_logic_and_presentation.chess_board import Board
 
 
 class Knight(Piece):
-    def __init__(self, position_notation: str, is_white: bool) -> None:
+    __slots__ = ()
+    width_offset_px = 6
+
+    def __init__(self, square: int | str, is_white: bool) -> None:
         __name = "KNIGHT_WHITE" if is_white else "KNIGHT_BLACK"
-        super().__init__(position_notation, __name)
-        self.width_offset_px = 6
+        super().__init__(square, __name)
 
     @staticmethod
-    def find_possible_move(
-        pieces_arr: list[Knight],
-        move_to: str,
-        ambiguity_help: str | None,
-        pieces_white: list[list],
-        pieces_black: list[list],
-    ) -> str | None:
-        for p in pieces_arr:
-            row = p.position_notation[1]
-            column = p.position_notation[0]
-
-            up_left = chr(ord(column) - 1) + chr(ord(row) + 2)
-            up_right = chr(ord(column) + 1) + chr(ord(row) + 2)
-
-            down_left = chr(ord(column) - 1) + chr(ord(row) - 2)
-            down_right = chr(ord(column) + 1) + chr(ord(row) - 2)
-
-            left_up = chr(ord(column) - 2) + chr(ord(row) + 1)
-            left_down = chr(ord(column) - 2) + chr(ord(row) - 1)
-
-            right_up = chr(ord(column) + 2) + chr(ord(row) + 1)
-            right_down = chr(ord(column) + 2) + chr(ord(row) - 1)
-
-            if move_to not in [up_left, up_right, down_right, down_left, left_down, left_up, right_down, right_up]:
-                continue
-
-            if (
-                ambiguity_help is not None
-                and p.position_notation[0] != ambiguity_help
-                and p.position_notation[1] != ambiguity_help
-                and p.position_notation != ambiguity_help
-            ):
-                continue
-
-            if p.is_being_pinned_and_move_forbidden(pieces_white, pieces_black, move_to):
-                continue
-
-            return p.position_notation
-
-        return None
+    def find_possible_move(move_to: int, ambiguity_help: str | None, board: Board) -> int | None:
+        candidates = [board.squares[square_index] for square_index in KNIGHT_TARGETS[move_to]]
+        return Piece.choose_move_origin(
+            [piece for piece in candidates if isinstance(piece, Knight) and piece.is_white == board.is_white_moving],
+            move_to,
+            ambiguity_help,
+            board,
+        )
@@ -1,68 +1,54 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from chess_logic_and_presentation.pieces.piece import Piece
+from chess_logic_and_presentation.square_tables import BOARD_SIZE, SQUARES_COUNT
+
+if TYPE_CHECKING:
+    from chess_logic_and_presentation.chess_board import Board
 
 
 class Pawn(Piece):
-    def __init__(self, position_notation: str, is_white: bool) -> None:
+    __slots__ = ()
+    width_offset_px = 10
+
+    def __init__(self, square: int | str, is_white: bool) -> None:
         __name = "PAWN_WHITE" if is_white else "PAWN_BLACK"
-        super().__init__(position_notation, __name)
-        self.width_offset_px = 10
+        super().__init__(square, __name)
 
     @staticmethod
-    def find_possible_move(
-        pieces_arr: list[Pawn], is_taking: bool, move_to: str, ambiguity_help: str | None, is_white_moving: bool
-    ) -> str | None:
-        # easy, but not efficient way to avoid edge cases like pawn jumping over other pawn
-        # eg 2 white pawns at E2 and E3, if E4 is played pawn from E2 or E3 could go there
-        # for this reason we check first 1 cell moves, then 2 cells
-
-        for p in pieces_arr:
-            notation = p.position_notation
-            notation2 = p.position_notation
-            diff = 1 if is_white_moving else -1
-
-            if is_taking:
-                row = chr(ord(notation[1]) + diff)
-                column_right = chr(ord(notation[0]) + diff)
-                column_left = chr(ord(notation[0]) - diff)
-                notation = column_right + row
-                notation2 = column_left + row
-            else:
-                row = chr(ord(notation[1]) + diff)
-                notation = notation[:-1] + row
-                notation2 = "00"
-
-            if notation == move_to or notation2 == move_to:
-                if ambiguity_help is not None:
-                    if (
-                        p.position_notation[0] != ambiguity_help
-                        and p.position_notation[1] != ambiguity_help
-                        and p.position_notation != ambiguity_help
-                    ):
-                        continue
-                return p.position_notation
-
-        if not is_taking:
-            for p in pieces_arr:
-                notation = p.position_notation
-                diff = 1 if is_white_moving else -1
-                diff2 = diff * 2 if (notation[1] == "2" and diff == 1) or (notation[1] == "7" and diff == -1) else diff
-
-                if diff2 == diff:
-                    continue
-
-                row = chr(ord(notation[1]) + diff2)
-                notation = notation[:-1] + row
-
-                if notation == move_to:
-                    if ambiguity_help is not None:
-                        if (
-                            p.position_notation[0] != ambiguity_help
-                            and p.position_notation[1] != ambiguity_help
-                            and p.position_notation != ambiguity_help
-                        ):
-                            continue
-                    return p.position_notation
+    def find_possible_move(move_to: int, is_taking: bool, ambiguity_help: str | None, board: Board) -> int | None:
+        # pawns move forward only, so the origin is one square back (one of two diagonal squares when taking),
+        # or two squares back for the first move, if the square between is empty
+        step = BOARD_SIZE if board.is_white_moving else -BOARD_SIZE
+        one_back = move_to - step
+        if not 0 <= one_back < SQUARES_COUNT:
+            return None
+
+        if is_taking:
+            column = move_to % BOARD_SIZE
+            candidates: list[Piece] = []
+            for column_step in (-1, 1):
+                piece = board.squares[one_back + column_step] if 0 <= column + column_step < BOARD_SIZE else None
+                if isinstance(piece, Pawn) and piece.is_white == board.is_white_moving:
+                    candidates.append(piece)
+            return Piece.choose_move_origin(candidates, move_to, ambiguity_help, board)
+
+        if Pawn.__is_moving_pawn(board.squares[one_back], board):
+            return one_back
+
+        two_back = one_back - step
+        starting_row = 1 if board.is_white_moving else BOARD_SIZE - 2
+        if (
+            board.squares[one_back] is None
+            and two_back // BOARD_SIZE == starting_row
+            and Pawn.__is_moving_pawn(board.squares[two_back], board)
+        ):
+            return two_back
 
         return None
+
+    @staticmethod
+    def __is_moving_pawn(piece: Piece | None, board: Board) -> bool:
+        return isinstance(piece, Pawn) and piece.is_white == board.is_white_moving
@@ -0,0 +1,45 @@
+BOARD_SIZE = 8
+SQUARES_COUNT = BOARD_SIZE * BOARD_SIZE
+
+# (column step, row step)
+ROOK_DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+BISHOP_DIRECTIONS = ((1, 1), (-1, 1), (1, -1), (-1, -1))
+QUEEN_DIRECTIONS = ROOK_DIRECTIONS + BISHOP_DIRECTIONS
+KNIGHT_OFFSETS = ((1, 2), (-1, 2), (1, -2), (-1, -2), (2, 1), (2, -1), (-2, 1), (-2, -1))
+KING_OFFSETS = QUEEN_DIRECTIONS
+
+
+def get_square_index(notation: str) -> int:
+    # a1 -> 0, h1 -> 7, a2 -> 8, ..., h8 -> 63
+    return (ord(notation[1]) - ord("1")) * BOARD_SIZE + ord(notation[0]) - ord("a")
+
+
+def get_square_notation(square_index: int) -> str:
+    row, column = divmod(square_index, BOARD_SIZE)
+    return chr(ord("a") + column) + chr(ord("1") + row)
+
+
+def _get_ray(square_index: int, direction: tuple[int, int], max_length: int = BOARD_SIZE) -> tuple[int, ...]:
+    # squares from square_index (exclusive) to the edge of the board
+    row, column = divmod(square_index, BOARD_SIZE)
+    column_step, row_step = direction
+    ray = []
+    for _ in range(max_length):
+        row, column = row + row_step, column + column_step
+        if not (0 <= row < BOARD_SIZE and 0 <= column < BOARD_SIZE):
+            break
+        ray.append(row * BOARD_SIZE + column)
+    return tuple(ray)
+
+
+def _get_targets(square_index: int, offsets: tuple[tuple[int, int], ...]) -> tuple[int, ...]:
+    return tuple(target for offset in offsets for target in _get_ray(square_index, offset, max_length=1))
+
+
+# RAYS[square][direction] - squares seen from the square in the direction, nearest first
+RAYS = tuple(
+    {direction: _get_ray(square_index, direction) for direction in QUEEN_DIRECTIONS}
+    for square_index in range(SQUARES_COUNT)
+)
+KNIGHT_TARGETS = tuple(_get_targets(square_index, KNIGHT_OFFSETS) for square_index in range(SQUARES_COUNT))
+KING_TARGETS = tuple(_get_targets(square_index, KING_OFFSETS) for square_index in range(SQUARES_COUNT))
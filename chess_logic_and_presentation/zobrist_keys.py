@@ -0,0 +1,40 @@
+from random import Random
+
+from chess_logic_and_presentation.square_tables import (
+    BOARD_SIZE,
+    SQUARES_COUNT,
+    get_square_index,
+)
+
+# fixed seed, keys are the same in every process, so they can be stored with cached positions
+ZOBRIST_SEED = 20240229
+PIECES_NAMES = ("PAWN", "KNIGHT", "BISHOP", "ROOK", "QUEEN", "KING")
+
+# castling rights bits
+CASTLING_WHITE_KINGSIDE, CASTLING_WHITE_QUEENSIDE, CASTLING_BLACK_KINGSIDE, CASTLING_BLACK_QUEENSIDE = 1, 2, 4, 8
+ALL_CASTLING_RIGHTS = 15
+# CASTLING_RIGHTS_KEPT[square] - rights left after a king or a rook moves from (or is taken on) the square
+CASTLING_RIGHTS_KEPT = tuple(
+    {
+        get_square_index("e1"): ALL_CASTLING_RIGHTS & ~(CASTLING_WHITE_KINGSIDE | CASTLING_WHITE_QUEENSIDE),
+        get_square_index("h1"): ALL_CASTLING_RIGHTS & ~CASTLING_WHITE_KINGSIDE,
+        get_square_index("a1"): ALL_CASTLING_RIGHTS & ~CASTLING_WHITE_QUEENSIDE,
+        get_square_index("e8"): ALL_CASTLING_RIGHTS & ~(CASTLING_BLACK_KINGSIDE | CASTLING_BLACK_QUEENSIDE),
+        get_square_index("h8"): ALL_CASTLING_RIGHTS & ~CASTLING_BLACK_KINGSIDE,
+        get_square_index("a8"): ALL_CASTLING_RIGHTS & ~CASTLING_BLACK_QUEENSIDE,
+    }.get(square_index, ALL_CASTLING_RIGHTS)
+    for square_index in range(SQUARES_COUNT)
+)
+
+_random = Random(ZOBRIST_SEED)
+# PIECES_SQUARES_KEYS[piece name][square], piece names as Piece.piece_name, e.g. "PAWN_WHITE"
+PIECES_SQUARES_KEYS = {
+    f"{piece_name}_{color}": tuple(_random.getrandbits(64) for _ in range(SQUARES_COUNT))
+    for color in ("WHITE", "BLACK")
+    for piece_name in PIECES_NAMES
+}
+# CASTLING_RIGHTS_KEYS[castling rights bits]
+CASTLING_RIGHTS_KEYS = tuple(_random.getrandbits(64) for _ in range(ALL_CASTLING_RIGHTS + 1))
+# ENPASSANT_COLUMNS_KEYS[column of the en passant square]
+ENPASSANT_COLUMNS_KEYS = tuple(_random.getrandbits(64) for _ in range(BOARD_SIZE))
+BLACK_MOVING_KEY = _random.getrandbits(64)
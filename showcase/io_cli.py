@@ -1,9 +1,17 @@
-from typing import Optional
-
+from collections.abc import Sequence
+from typing import Optional, Union
+
+from chess_io.game_records import (
+    GameRecordsReader,
+    GameRecordsWriter,
+    is_game_records_file,
+)
 from chess_io.pgn_reader import PGNReader
 from chess_io.position_reader import PositionReader
+from chess_io.position_shards import MANIFEST_FILE_EXTENSION, ShardedPositionReader
 from chess_io.position_writer import PositionWriter
 from chess_keras import opening_encoder
+from chess_keras.label_vocabulary import LabelVocabulary
 from chess_keras.opening_guesser import Guesser
 from chess_logic_and_presentation.chess_visualizer import ChessVisualizer
 
@@ -20,12 +28,13 @@ class InputOutputCLI:
         self.__is_running = False
         self.__guesser: Optional[Guesser] = None
         self.__pgn_reader: Optional[PGNReader] = None
-        self.__position_reader: Optional[PositionReader] = None
+        self.__position_reader: Optional[Union[PositionReader, ShardedPositionReader]] = None
         self.__visualizer: Optional[ChessVisualizer] = None
-        self.__opening_names: list[str] = []
-        self.__opening_names_encoded: list = []
-        self.__white_moves: list[list[str]] = []
-        self.__black_moves: list[list[str]] = []
+        self.__game_records_reader: Optional[GameRecordsReader] = None
+        self.__opening_names: Sequence[str] = []
+        self.__opening_names_encoded: Optional[LabelVocabulary] = None
+        self.__white_moves: Sequence[list[str]] = []
+        self.__black_moves: Sequence[list[str]] = []
 
         self.__commands = {
             "help": self.__print_help,
@@ -98,14 +107,13 @@ class InputOutputCLI:
             f"Provide name for encoded unique opening names file: (file saved at {self.__UNIQUE_OPENINGS_PATH}):"
         )
         openings_names = self.__pgn_reader.get_openings_names()
-        openings_names_encoded = opening_encoder.get_label_encoded_unique_openings_names(openings_names)
-        opening_encoder.dump_to_file(f"{self.__UNIQUE_OPENINGS_PATH}{filename}", openings_names_encoded)
+        LabelVocabulary.from_labels(openings_names).save_to_file(f"{self.__UNIQUE_OPENINGS_PATH}{filename}")
 
     def __load_encoded_unique_opening_names_from_file(self) -> None:
         filename = input(
             "Provide name for encoded unique opening names file: (file store at " f"{self.__UNIQUE_OPENINGS_PATH}):"
         )
-        self.__opening_names_encoded = opening_encoder.load_from_file(f"{self.__UNIQUE_OPENINGS_PATH}{filename}")
+        self.__opening_names_encoded = LabelVocabulary.load_from_file(f"{self.__UNIQUE_OPENINGS_PATH}{filename}")
 
     def __encode_opening_names_and_moves_and_save_them_to_file(self) -> None:
         if self.__pgn_reader is None:
@@ -127,10 +135,12 @@ class InputOutputCLI:
             "Provide name for encoded opening names and moves file:"
             f" (file saved at {self.__OPENINGS_AND_MOVES_PATH})"
         )
+        # games are saved as records, each one can be decoded separately
         encoded = opening_encoder.get_encoded_openings_names_and_moves(
             *self.__pgn_reader.get_openings_names_and_moves()
         )
-        opening_encoder.dump_to_file(f"{self.__OPENINGS_AND_MOVES_PATH}{filename}", encoded)
+        with GameRecordsWriter(f"{self.__OPENINGS_AND_MOVES_PATH}{filename}") as game_records_writer:
+            game_records_writer.write_games(encoded)
 
     def __load_encoded_opening_names_and_moves_from_file(self) -> None:
         filename = input(
@@ -138,18 +148,32 @@ class InputOutputCLI:
             f"{self.__OPENINGS_AND_MOVES_PATH}):"
         )
 
-        openings_and_moves_encoded = opening_encoder.load_from_file(f"{self.__OPENINGS_AND_MOVES_PATH}{filename}")
-        o, w, b = opening_encoder.get_decoded_openings_names_and_moves(openings_and_moves_encoded)
-        self.__opening_names = o
-        self.__white_moves = w
-        self.__black_moves = b
+        filepath = f"{self.__OPENINGS_AND_MOVES_PATH}{filename}"
+        if self.__game_records_reader is not None:
+            self.__game_records_reader.close()
+            self.__game_records_reader = None
+
+        if is_game_records_file(filepath):
+            # nothing is decoded until the game is visualized or rolled out
+            self.__game_records_reader = GameRecordsReader(filepath)
+            games_columns = self.__game_records_reader.get_openings_names_and_moves()
+            self.__opening_names, self.__white_moves, self.__black_moves = games_columns
+        else:
+            openings_and_moves_encoded = opening_encoder.load_from_file(filepath)
+            o, w, b = opening_encoder.get_decoded_openings_names_and_moves(openings_and_moves_encoded)
+            self.__opening_names = o
+            self.__white_moves = w
+            self.__black_moves = b
 
     def __visualize_based_on_opening_names_and_moves(self) -> None:
         if not self.__opening_names or not self.__white_moves or not self.__black_moves:
             print("Error, games not provided. Load opening names and moves from file first.\n")
             return
 
-        print("\nVisualization starting...\nRight arrow - next move, Down arrow - auto next move")
+        print(
+            "\nVisualization starting...\nRight arrow - next move, Left arrow - undo move, "
+            "Down arrow - auto next move"
+        )
         self.__visualizer = ChessVisualizer()
         self.__visualizer.set_visualization_games_database(
             self.__opening_names, self.__white_moves, self.__black_moves
@@ -163,13 +187,16 @@ class InputOutputCLI:
 
         filename = input("Provide name for random positions file:" f" (file saved at {self.__RANDOM_POSITION_PATH}):")
 
-        print("\nVisualization starting...\nRight arrow - next move, Down arrow - auto next move")
+        print(
+            "\nVisualization starting...\nRight arrow - next move, Left arrow - undo move, "
+            "Down arrow - auto next move"
+        )
         self.__visualizer = ChessVisualizer()
         self.__visualizer.set_visualization_games_database(
             self.__opening_names, self.__white_moves, self.__black_moves
         )
         self.__visualizer.toggle_saving_positions_to_file(
-            PositionWriter(f"{self.__RANDOM_POSITION_PATH}{filename}"), self.__SAVE_POSITION_EVERY_N
+            PositionWriter(f"{self.__RANDOM_POSITION_PATH}{filename}", is_appending=True), self.__SAVE_POSITION_EVERY_N
         )
         self.__visualizer.run_auto_simulate_no_visualization()
 
@@ -189,7 +216,7 @@ class InputOutputCLI:
             f" (file saved at {self.__MODEL_CHECKPOINT_PATH} and {self.__MODEL_PATH}):"
         )
 
-        self.__position_reader = PositionReader(f"{self.__RANDOM_POSITION_PATH}{positions_filename}")
+        self.__position_reader = self.__get_position_reader(f"{self.__RANDOM_POSITION_PATH}{positions_filename}")
         # self.__opening_names_encoded = opening_encoder.get_label_encoded_unique_openings_names(self.__opening_names)
         guesser = Guesser()
         guesser.set_database_for_model(self.__position_reader.read_from_file(), self.__opening_names_encoded)
@@ -198,6 +225,13 @@ class InputOutputCLI:
         guesser.evaluate()
         guesser.save_model(f"{self.__MODEL_PATH}{model_filename}")
 
+    @staticmethod
+    def __get_position_reader(filepath: str) -> Union[PositionReader, ShardedPositionReader]:
+        # positions of many rollouts can be given as a manifest of shards
+        if filepath.endswith(MANIFEST_FILE_EXTENSION):
+            return ShardedPositionReader(filepath)
+        return PositionReader(filepath)
+
     def __load_and_evaluate_model_based_on_saved_positions(self) -> None:
         positions_filename = input(
             "Provide name for random positions file:" f" (file saved at {self.__RANDOM_POSITION_PATH}):"
@@ -207,8 +241,8 @@ class InputOutputCLI:
         )
 
         self.__guesser = Guesser()
-        openings_names_encoded = opening_encoder.get_label_encoded_unique_openings_names(self.__opening_names)
-        self.__position_reader = PositionReader(f"{self.__RANDOM_POSITION_PATH}{positions_filename}")
+        openings_names_encoded = LabelVocabulary.from_labels(self.__opening_names)
+        self.__position_reader = self.__get_position_reader(f"{self.__RANDOM_POSITION_PATH}{positions_filename}")
         self.__guesser.set_database_for_model(self.__position_reader.read_from_file(), openings_names_encoded)
         self.__guesser.create_model()
         self.__guesser.load_model(f"{self.__MODEL_PATH}{model_filename}")
@@ -222,13 +256,13 @@ class InputOutputCLI:
         filename = input(f"Please provide filename for model (file stored at {self.__MODEL_PATH}):")
 
         self.__guesser = Guesser()
-        openings_names_encoded = opening_encoder.get_label_encoded_unique_openings_names(self.__opening_names)
+        openings_names_encoded = LabelVocabulary.from_labels(self.__opening_names)
         self.__guesser.set_answers_for_model_output(openings_names_encoded)
         self.__guesser.load_model(f"{self.__MODEL_PATH}{filename}")
 
         print(
-            "\nVisualization starting...\nRight arrow - next move, Down arrow - auto next move, "
-            "Up arrow - predict opening"
+            "\nVisualization starting...\nRight arrow - next move, Left arrow - undo move, "
+            "Down arrow - auto next move, Up arrow - predict opening"
         )
         self.__visualizer = ChessVisualizer()
         self.__visualizer.add_guesser_init_writer(self.__guesser)
@@ -0,0 +1,83 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from chess_io.columnar_game_store import ColumnarGameStore
+from chess_io.pgn_reader import PGNGame
+
+GAMES = [
+    PGNGame("Italian Game", ["e4", "Nf3", "Bc4", "1-0"], ["e5", "Nc6", "Bc5"]),
+    PGNGame("Caro-Kann Defense", ["e4", "d4", "e5"], ["c6", "d5", "0-1"]),
+    PGNGame("Italian Game", ["e4", "Nf3", "Bc4"], ["e5", "Nc6", "1/2-1/2"]),
+]
+
+
+@pytest.fixture
+def store():
+    store = ColumnarGameStore()
+    store.add_games(GAMES)
+    return store
+
+
+def test_store_columns(store):
+    assert len(store) == 3
+    assert store.moves.dtype == np.uint16
+    assert store.games_offsets.tolist() == [0, 7, 13, 19]
+    assert store.openings_ids.tolist() == [0, 1, 0]
+    assert store.openings_vocabulary == ["Italian Game", "Caro-Kann Defense"]
+    assert len(store.moves_vocabulary) == 12
+
+
+def test_store_decodes_games(store):
+    assert [store.get_game(idx) for idx in range(len(store))] == GAMES
+    openings_names, white_moves, black_moves = store.get_openings_names_and_moves()
+
+    assert list(openings_names) == [game.opening_name for game in GAMES]
+    assert white_moves[-1] == GAMES[-1].white_moves
+    assert black_moves[1:] == [GAMES[1].black_moves, GAMES[2].black_moves]
+    with pytest.raises(IndexError):
+        white_moves[3]
+
+
+def test_games_column_decodes_repeated_index_once(store, monkeypatch):
+    decoded_games_idx = []
+    get_plies = store.get_plies
+    monkeypatch.setattr(store, "get_plies", lambda idx: decoded_games_idx.append(idx) or get_plies(idx))
+    white_moves = store.white_moves
+
+    # one game read move after move, as the visualizer does
+    for move_idx in range(4):
+        assert white_moves[0][move_idx] == GAMES[0].white_moves[move_idx]
+    assert white_moves[-3] == GAMES[0].white_moves
+    assert white_moves[1] == GAMES[1].white_moves
+
+    assert decoded_games_idx == [0, 1]
+
+
+def test_store_round_trip_from_lists(store):
+    openings_names, white_moves, black_moves = zip(*GAMES)
+    converted_store = ColumnarGameStore.from_openings_names_and_moves(openings_names, white_moves, black_moves)
+
+    assert converted_store.get_game(2) == store.get_game(2)
+
+
+def test_store_rejects_not_alternating_moves(store):
+    with pytest.raises(ValueError):
+        store.add_game("Italian Game", ["e4", "Nf3"], [])
+
+
+def get_decoded_games_in_other_process(handle):
+    shared_store = ColumnarGameStore.from_shared_memory(handle)
+    games = [shared_store.get_game(idx) for idx in range(len(shared_store))]
+    shared_store.release_shared_memory()
+    return games
+
+
+def test_store_shared_with_other_process(store):
+    handle = store.to_shared_memory()
+    try:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(get_decoded_games_in_other_process, handle).result() == GAMES
+    finally:
+        store.release_shared_memory(unlink=True)
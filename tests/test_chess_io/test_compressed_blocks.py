@@ -0,0 +1,51 @@
+import pytest
+
+from chess_io.compressed_blocks import CompressedBlocksReader, CompressedBlocksWriter
+
+
+@pytest.fixture
+def sample_data():
+    return bytes(range(256)) * 40
+
+
+@pytest.mark.parametrize("compression", ["zlib", "lzma"])
+def test_write_and_read_blocks(tmp_path, sample_data, compression):
+    filepath = str(tmp_path / "data.blocks")
+    with open(filepath, "wb") as f:
+        f.write(b"HEAD")
+        blocks_writer = CompressedBlocksWriter(f, compression, block_size=1000)
+        blocks_writer.write(sample_data[:1500])
+        blocks_writer.write(sample_data[1500:])
+        assert blocks_writer.tell() == len(sample_data)
+        blocks_writer.close()
+        end_position = f.tell()
+
+    blocks_reader = CompressedBlocksReader(filepath, 4)
+    assert blocks_reader.get_end_position() == end_position
+    assert blocks_reader.read(0, len(sample_data)) == sample_data
+    blocks_reader.close()
+
+
+def test_read_decompresses_only_needed_blocks(tmp_path, sample_data):
+    filepath = str(tmp_path / "data.blocks")
+    with open(filepath, "wb") as f:
+        blocks_writer = CompressedBlocksWriter(f, "zlib", block_size=1000)
+        blocks_writer.write(sample_data)
+        blocks_writer.close()
+
+    blocks_reader = CompressedBlocksReader(filepath, 0)
+    assert blocks_reader.read(4990, 20) == sample_data[4990:5010]
+    assert blocks_reader.decompressed_blocks_count == 2
+    assert blocks_reader.read(5000, 10) == sample_data[5000:5010]
+    assert blocks_reader.decompressed_blocks_count == 2  # cached
+    assert blocks_reader.read(10, 0) == b""
+
+    with pytest.raises(ValueError):
+        blocks_reader.read(len(sample_data) - 5, 10)
+    blocks_reader.close()
+
+
+def test_unknown_compression(tmp_path):
+    with open(tmp_path / "data.blocks", "wb") as f:
+        with pytest.raises(ValueError):
+            CompressedBlocksWriter(f, "zip")
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from chess_io.deduplicated_position_store import DeduplicatedPositionStore
+from chess_io.position_dataset import PositionDataset
+
+
+def make_position(king_row: int) -> list[list[str]]:
+    position = [[" " for _ in range(8)] for _ in range(8)]
+    position[king_row][7] = "♔"
+    position[4][0] = "♚"
+    return position
+
+
+@pytest.fixture
+def sample_database():
+    return [
+        ("Italian Game", make_position(4)),
+        ("Italian Game", make_position(4)),
+        ("Caro-Kann Defense", make_position(4)),
+        ("Caro-Kann Defense", make_position(1)),
+        ("Italian Game", make_position(4)),
+    ]
+
+
+@pytest.fixture
+def store(sample_database):
+    store = DeduplicatedPositionStore()
+    store.add_database(sample_database)
+    return store
+
+
+def test_add_database_deduplicates_positions(store):
+    assert len(store) == 2
+    assert store.occurrences_count == 5
+    assert store.labels_vocabulary == ["Italian Game", "Caro-Kann Defense"]
+    assert store.get_position(1) == make_position(1)
+    assert store.get_labels_counts(0) == {"Italian Game": 3, "Caro-Kann Defense": 1}
+    assert store.get_counts().tolist() == [[3, 1], [0, 1]]
+
+
+def test_get_position_and_labels_counts_by_id(store):
+    store.add_position("English Opening", make_position(2))
+
+    assert store.get_position(-1) == make_position(2)
+    assert store.get_position(0) == make_position(4)
+    assert store.get_labels_counts(1) == {"Caro-Kann Defense": 1}
+    assert store.get_labels_counts(-1) == {"English Opening": 1}
+    with pytest.raises(IndexError):
+        store.get_position(3)
+    with pytest.raises(IndexError):
+        store.get_labels_counts(-4)
+
+
+def test_add_position_and_dataset_share_keys(store, sample_database):
+    store.add_position("English Opening", make_position(1), count=2)
+    store.add_dataset(PositionDataset.from_database(sample_database[:1]))
+
+    assert len(store) == 2
+    assert store.occurrences_count == 8
+    assert store.get_counts().tolist() == [[4, 1, 0], [0, 1, 2]]
+
+
+def test_get_weighted_samples(store):
+    dataset, weights = store.get_weighted_samples()
+
+    assert dataset.to_database() == [
+        ("Italian Game", make_position(4)),
+        ("Caro-Kann Defense", make_position(4)),
+        ("Caro-Kann Defense", make_position(1)),
+    ]
+    assert weights.tolist() == [3.0, 1.0, 1.0]
+    assert weights.sum() == store.occurrences_count
+
+
+def test_save_and_load_from_file(store, tmp_path):
+    filepath = str(tmp_path / "positions.npz")
+    store.save_to_file(filepath)
+
+    loaded_store = DeduplicatedPositionStore.load_from_file(filepath)
+
+    assert len(loaded_store) == len(store)
+    assert loaded_store.occurrences_count == store.occurrences_count
+    assert loaded_store.labels_vocabulary == store.labels_vocabulary
+    assert np.array_equal(loaded_store.get_squares(), store.get_squares())
+    assert np.array_equal(loaded_store.get_counts(), store.get_counts())
+
+    # positions added after loading are deduplicated against the loaded ones
+    loaded_store.add_position("Italian Game", make_position(1))
+    assert len(loaded_store) == 2
+
+
+def test_empty_store(tmp_path):
+    store = DeduplicatedPositionStore()
+    filepath = str(tmp_path / "positions.npz")
+    store.save_to_file(filepath)
+
+    dataset, weights = DeduplicatedPositionStore.load_from_file(filepath).get_weighted_samples()
+
+    assert len(dataset) == 0
+    assert len(weights) == 0
@@ -0,0 +1,110 @@
+import pytest
+
+from chess_io.game_records import (
+    GAME_RECORDS_FILE_HEADER,
+    GAME_RECORDS_FILE_MAGIC,
+    GameRecordsReader,
+    GameRecordsWriter,
+    decode_game_record,
+    encode_game_record,
+    is_game_records_file,
+)
+from chess_io.pgn_reader import PGNGame
+
+
+@pytest.fixture
+def sample_games():
+    return [
+        PGNGame("Old Benoni Defense", ["d4", "e3", "exd4", "0-1"], ["c5", "cxd4", "d5"]),
+        PGNGame("Sicilian Defense: Old Sicilian", ["e4", "Nf3"], ["c5", "Nc6", "1/2-1/2"]),
+        PGNGame("Italian Game", ["e4"], []),
+    ]
+
+
+@pytest.fixture
+def game_records_filepath(tmp_path, sample_games):
+    filepath = str(tmp_path / "games.rec")
+    with GameRecordsWriter(filepath) as game_records_writer:
+        game_records_writer.write_games(sample_games)
+    return filepath
+
+
+def test_encode_and_decode_game_record(sample_games):
+    for game in sample_games:
+        assert decode_game_record(encode_game_record(*game)) == game
+
+
+def test_iter_games_streams_records(game_records_filepath, sample_games):
+    with GameRecordsReader(game_records_filepath) as game_records_reader:
+        assert is_game_records_file(game_records_filepath)
+        assert len(game_records_reader) == 3
+        assert list(game_records_reader.iter_games()) == sample_games
+
+
+def test_get_game_random_access(game_records_filepath, sample_games):
+    with GameRecordsReader(game_records_filepath) as game_records_reader:
+        assert game_records_reader.get_game(2) == sample_games[2]
+        assert game_records_reader.get_game(0) == sample_games[0]
+        assert game_records_reader.get_game(-1) == sample_games[2]
+        with pytest.raises(IndexError):
+            game_records_reader.get_game(3)
+
+
+def test_get_openings_names_and_moves_lazy_columns(game_records_filepath, sample_games):
+    with GameRecordsReader(game_records_filepath) as game_records_reader:
+        openings_names, white_moves, black_moves = game_records_reader.get_openings_names_and_moves()
+
+        assert len(openings_names) == 3
+        assert white_moves[1] == ["e4", "Nf3"]
+        assert black_moves[1][2] == "1/2-1/2"
+        assert list(openings_names) == [game.opening_name for game in sample_games]
+        assert black_moves[:] == [game.black_moves for game in sample_games]
+
+
+def test_empty_game_records_file(tmp_path):
+    filepath = str(tmp_path / "games.rec")
+    GameRecordsWriter(filepath).close()
+
+    game_records_reader = GameRecordsReader(filepath)
+
+    assert len(game_records_reader) == 0
+    assert list(game_records_reader.iter_games()) == []
+
+
+def test_not_closed_game_records_file(tmp_path):
+    filepath = tmp_path / "games.rec"
+    filepath.write_bytes(GAME_RECORDS_FILE_MAGIC + GAME_RECORDS_FILE_HEADER.pack(0, 0))
+
+    with pytest.raises(ValueError):
+        GameRecordsReader(str(filepath))
+
+
+def test_not_game_records_file(tmp_path):
+    filepath = tmp_path / "games.pickle"
+    filepath.write_bytes(b"\x80\x04]\x94.")
+
+    assert not is_game_records_file(str(filepath))
+    with pytest.raises(ValueError):
+        GameRecordsReader(str(filepath))
+
+
+@pytest.mark.parametrize("compression", ["zlib", "lzma"])
+def test_compressed_game_records_file(tmp_path, sample_games, compression):
+    filepath = str(tmp_path / "games.rec")
+    with GameRecordsWriter(filepath, compression=compression, block_size=64) as game_records_writer:
+        game_records_writer.write_games(sample_games * 10)
+
+    assert is_game_records_file(filepath)
+    with GameRecordsReader(filepath) as game_records_reader:
+        assert len(game_records_reader) == 30
+        assert game_records_reader.get_game(-1) == sample_games[2]
+        assert game_records_reader.get_game(4) == sample_games[1]
+        assert list(game_records_reader.iter_games()) == sample_games * 10
+
+
+def test_unknown_compression_keeps_existing_file(game_records_filepath, sample_games):
+    with pytest.raises(ValueError):
+        GameRecordsWriter(game_records_filepath, compression="zip")
+
+    with GameRecordsReader(game_records_filepath) as game_records_reader:
+        assert list(game_records_reader.iter_games()) == sample_games
@@ -0,0 +1,67 @@
+import pickle
+
+import pytest
+
+from chess_io.headers_predicates import HeaderPredicate, get_speed, min_elo, parse_header_line, played_between
+
+HEADERS = {
+    "Event": "Rated Blitz game",
+    "UTCDate": "2017.01.15",
+    "WhiteElo": "1850",
+    "BlackElo": "?",
+    "TimeControl": "180+2",
+    "Termination": "Normal",
+}
+
+
+@pytest.mark.parametrize(
+    "predicate, expected",
+    [
+        (HeaderPredicate("WhiteElo", ">=", 1800), True),
+        (HeaderPredicate("WhiteElo", "<", 1800), False),
+        (HeaderPredicate("BlackElo", ">=", 0), False),  # unknown elo
+        (HeaderPredicate("WhiteRatingDiff", "!=", 0), False),  # missing header
+        (HeaderPredicate("Termination", "==", "Normal"), True),
+        (HeaderPredicate("Termination", "in", ["Time forfeit", "Abandoned"]), False),
+        (HeaderPredicate("Event", "contains", "Blitz"), True),
+        (HeaderPredicate("Speed", "==", "blitz"), True),
+        (HeaderPredicate("Speed", "not in", ["bullet", "blitz"]), False),
+    ],
+)
+def test_is_satisfied(predicate, expected):
+    assert predicate.is_satisfied(HEADERS) == expected
+
+
+def test_predicate_helpers():
+    assert all(predicate.is_satisfied(HEADERS) for predicate in played_between("2017.01.01", "2017.01.31"))
+    assert not all(predicate.is_satisfied(HEADERS) for predicate in min_elo(1500))
+
+
+@pytest.mark.parametrize(
+    "time_control, expected",
+    [
+        ("15+0", "ultraBullet"),
+        ("60+0", "bullet"),
+        ("180+2", "blitz"),
+        ("600+5", "rapid"),
+        ("1800+0", "classical"),
+        ("-", None),
+    ],
+)
+def test_get_speed(time_control, expected):
+    assert get_speed(time_control) == expected
+
+
+def test_predicate_is_picklable_and_validated():
+    predicate = pickle.loads(pickle.dumps(HeaderPredicate("WhiteElo", ">=", 1800)))
+    assert predicate.is_satisfied(HEADERS)
+
+    with pytest.raises(ValueError):
+        HeaderPredicate("WhiteElo", "=>", 1800)
+
+
+def test_parse_header_line():
+    assert parse_header_line('[Opening "Sicilian Defense: Old Sicilian"]\n') == (
+        "Opening",
+        "Sicilian Defense: Old Sicilian",
+    )
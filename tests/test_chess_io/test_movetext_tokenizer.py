@@ -0,0 +1,48 @@
+import pytest
+
+from chess_io.movetext_tokenizer import GAME_RESULTS, has_moves, strip_annotations, tokenize_movetext
+
+
+@pytest.mark.parametrize(
+    "movetext, expected_white_moves, expected_black_moves",
+    [
+        ("1. e4 e5 2. Nf3 Nc6 1-0\n", ["e4", "Nf3", "1-0"], ["e5", "Nc6"]),
+        ("1. e4 e5 2. Qh5 Nc6 3. Bc4 Nf6 4. Qxf7# 1-0\n", ["e4", "Qh5", "Bc4", "Qxf7#"], ["e5", "Nc6", "Nf6", "1-0"]),
+        ("1. d4 d5 2. c4\n2... e6 3. Nc3\n1/2-1/2\n", ["d4", "c4", "Nc3"], ["d5", "e6", "1/2-1/2"]),
+        ("1.e4 c5 2.Nf3 *", ["e4", "Nf3"], ["c5"]),
+        ("1. e4 $1 c5 $2 2. Nf3!? d6?! 0-1", ["e4", "Nf3", "0-1"], ["c5", "d6"]),
+        (
+            "1. e4 (1. d4 d5 (1... Nf6)) 1... e5 ; comment\n2. O-O-O exd8=Q+ 1-0",
+            ["e4", "O-O-O", "1-0"],
+            ["e5", "exd8=Q+"],
+        ),
+    ],
+)
+def test_tokenize_movetext(movetext, expected_white_moves, expected_black_moves):
+    assert tokenize_movetext(movetext) == (expected_white_moves, expected_black_moves)
+
+
+def test_tokenize_movetext_without_moves():
+    assert tokenize_movetext("0-1\n") == (["0-1"], [])
+
+
+@pytest.mark.parametrize(
+    "movetext, expected",
+    [
+        ("1. e4 { [%clk 0:00:30] } 1... c5 0-1", True),
+        ("{ e4 was planned } 1.e4 *", True),
+        ("1.{ glued comment }e4 *", True),
+        ("0-1\n", False),
+        ("{ Game abandoned } 1-0", False),
+        ("(1. d4) $1 ; e4\n1/2-1/2", False),
+        ("", False),
+    ],
+)
+def test_has_moves_same_as_tokenized_moves(movetext, expected):
+    white_moves, _ = tokenize_movetext(movetext)
+    assert has_moves(movetext) == expected == (bool(white_moves) and white_moves[0] not in GAME_RESULTS)
+
+
+def test_strip_annotations():
+    movetext = "1. e4 { [%eval 0.17] [%clk 0:00:30] } 1... c5 $14 (1... e5 (1... e6)) 2. Nf3 ; end"
+    assert strip_annotations(movetext).split() == ["1.", "e4", "1...", "c5", "2.", "Nf3"]
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from chess_io.openings_names_filter import OpeningsNamesFilter
+
+
+def linear_scan_match(openings_names, is_substring, opening):
+    # behaviour of the filter before it was compiled
+    if is_substring:
+        for opening_filter in openings_names:
+            if opening_filter in opening:
+                return True, opening_filter
+        return False, ""
+    return opening in openings_names, ""
+
+
+@pytest.mark.parametrize("is_substring", [True, False])
+def test_match_same_as_linear_scan(is_substring):
+    rng = random.Random(0)
+    openings_names = ["".join(rng.choice("abc ") for _ in range(rng.randint(1, 5))) for _ in range(300)]
+    openings_filter = OpeningsNamesFilter(openings_names, is_substring)
+
+    for _ in range(2000):
+        opening = "".join(rng.choice("abcd ") for _ in range(rng.randint(0, 20)))
+        expected = linear_scan_match(openings_names, is_substring, opening)
+        assert openings_filter.match(opening) == expected
+        assert openings_filter.match(opening) == expected  # cached
+
+
+@pytest.mark.parametrize(
+    "openings_names, opening, expected",
+    [
+        (
+            ["Italian Game", "Caro-Kann Defense", "English Opening"],
+            "Italian Game: Two Knights",
+            (True, "Italian Game"),
+        ),
+        (["Game: Two", "Italian Game"], "Italian Game: Two Knights", (True, "Game: Two")),
+        (["Italian Game: Two", "Game"], "Italian Game: Two Knights", (True, "Italian Game: Two")),
+        (["Sicilian", "Italian"], "English Opening", (False, "")),
+        (["Sicilian", ""], "English Opening", (True, "")),
+    ],
+)
+def test_match_returns_first_filter_from_list(openings_names, opening, expected):
+    assert OpeningsNamesFilter(openings_names, True).match(opening) == expected
+
+
+def test_empty_filter_is_falsy():
+    assert not OpeningsNamesFilter([], True)
+    assert OpeningsNamesFilter(["Italian Game"], False)
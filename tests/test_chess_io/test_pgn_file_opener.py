@@ -0,0 +1,48 @@
+import bz2
+import gzip
+import lzma
+
+import pytest
+
+from chess_io.pgn_file_opener import is_compressed, open_pgn_file
+from chess_io.pgn_reader import PGNReader
+
+PGN_DATA = """[Event "Rated Bullet game"]
+[Opening "Old Benoni Defense"]
+
+1. d4 c5 2. e3 cxd4 0-1
+
+"""
+
+
+@pytest.mark.parametrize(
+    "extension, compress",
+    [
+        ("", lambda data: data),
+        (".gz", gzip.compress),
+        (".bz2", bz2.compress),
+        (".xz", lzma.compress),
+    ],
+)
+def test_open_pgn_file_reads_compressed_files(tmp_path, extension, compress):
+    filepath = tmp_path / f"games.pgn{extension}"
+    filepath.write_bytes(compress(PGN_DATA.encode("utf-8")))
+
+    assert is_compressed(str(filepath)) == bool(extension)
+    with open_pgn_file(str(filepath)) as f:
+        assert f.read() == PGN_DATA
+
+
+def test_pgn_reader_reads_zstd_file(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    filepath = tmp_path / "games.pgn.zst"
+    filepath.write_bytes(zstandard.ZstdCompressor().compress(PGN_DATA.encode("utf-8")))
+
+    pgn_reader = PGNReader()
+    pgn_reader.load_pngs_from_file(str(filepath))
+
+    assert pgn_reader.get_openings_names_and_moves() == (
+        ["Old Benoni Defense"],
+        [["d4", "e3", "0-1"]],
+        [["c5", "cxd4"]],
+    )
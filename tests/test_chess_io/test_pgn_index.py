@@ -0,0 +1,108 @@
+import os
+
+import pytest
+
+from chess_io.pgn_index import PGNIndex
+from chess_io.pgn_reader import PGNReader
+
+GAME_TEMPLATE = """[Event "Rated Blitz game"]
+[Site "https://lichess.org/{idx}"]
+[Opening "{opening}"]
+
+1. e4 e5 2. Nf3 {move} 1-0
+
+"""
+
+
+@pytest.fixture
+def pgn_filepath(tmp_path):
+    openings = ["Italian Game", "Caro-Kann Defense", "Italian Game", "English Opening", "Italian Game"]
+    games = [
+        GAME_TEMPLATE.format(idx=idx, opening=opening, move=f"a{idx + 2}") for idx, opening in enumerate(openings)
+    ]
+    filepath = tmp_path / "games.pgn"
+    filepath.write_text("".join(games))
+    return str(filepath)
+
+
+def test_build_index_and_get_game(pgn_filepath):
+    index = PGNIndex(pgn_filepath)
+    index.build()
+
+    assert len(index) == 5
+    assert index.get_opening_name(3) == "English Opening"
+    assert index.get_game_text(1).startswith('[Event "Rated Blitz game"]\n[Site "https://lichess.org/1"]')
+    assert index.get_game(4) == ("Italian Game", ["e4", "Nf3", "1-0"], ["e5", "a6"])
+
+
+def test_index_saved_and_loaded_from_sidecar_file(pgn_filepath):
+    index = PGNIndex(pgn_filepath)
+    index.load_or_build()
+    loaded_index = PGNIndex(pgn_filepath)
+    loaded_index.load_from_file()
+
+    assert len(loaded_index) == 5
+    assert loaded_index.openings_names == index.openings_names
+    assert [loaded_index.get_game(idx) for idx in range(5)] == list(PGNReader().iter_games(pgn_filepath))
+
+
+def test_stale_index_rebuilt_after_pgn_file_changed(pgn_filepath):
+    PGNIndex(pgn_filepath).load_or_build()
+    # game inserted before the others, offsets of the saved index point to wrong games
+    with open(pgn_filepath, encoding="utf-8") as f:
+        data = f.read()
+    with open(pgn_filepath, "w", encoding="utf-8") as f:
+        f.write(GAME_TEMPLATE.format(idx=9, opening="Sicilian Defense", move="h3") + data)
+
+    with pytest.raises(ValueError):
+        PGNIndex(pgn_filepath).load_from_file()
+
+    index = PGNIndex(pgn_filepath)
+    index.load_or_build()
+    assert len(index) == 6
+    assert [index.get_game(idx) for idx in range(6)] == list(PGNReader().iter_games(pgn_filepath))
+    PGNIndex(pgn_filepath).load_from_file()
+
+
+def test_stale_index_of_pgn_file_replaced_with_same_size(pgn_filepath):
+    PGNIndex(pgn_filepath).load_or_build()
+    with open(pgn_filepath, encoding="utf-8") as f:
+        data = f.read()
+    with open(pgn_filepath, "w", encoding="utf-8") as f:
+        f.write(data.replace("a6", "h6"))
+    stat = os.stat(pgn_filepath)
+    os.utime(pgn_filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    index = PGNIndex(pgn_filepath)
+    with pytest.raises(ValueError):
+        index.load_from_file()
+    index.load_or_build()
+    assert index.get_game(4) == ("Italian Game", ["e4", "Nf3", "1-0"], ["e5", "h6"])
+
+
+def test_iter_games_by_opening(pgn_filepath):
+    index = PGNIndex(pgn_filepath)
+    index.build()
+
+    assert index.get_games_indices_by_opening("Italian Game") == [0, 2, 4]
+    assert index.get_games_indices_by_opening("Sicilian Defense") == []
+    assert [game.black_moves[-1] for game in index.iter_games_by_opening("Italian Game")] == ["a2", "a4", "a6"]
+
+
+def test_compressed_file_can_not_be_indexed():
+    with pytest.raises(ValueError):
+        PGNIndex("games.pgn.zst")
+
+
+def test_index_of_crlf_pgn_file(tmp_path):
+    filepath = tmp_path / "games_crlf.pgn"
+    games = [GAME_TEMPLATE.format(idx=idx, opening=opening, move="a3") for idx, opening in enumerate(["A", "B", "A"])]
+    filepath.write_bytes("".join(games).replace("\n", "\r\n").encode("utf-8"))
+    expected_games = list(PGNReader().iter_games(str(filepath)))
+
+    index = PGNIndex(str(filepath))
+    index.build()
+
+    assert [game.opening_name for game in expected_games] == ["A", "B", "A"]
+    assert [index.get_game(idx) for idx in range(3)] == expected_games
+    assert list(index.iter_games_by_opening("A")) == [expected_games[0], expected_games[2]]
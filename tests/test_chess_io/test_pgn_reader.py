@@ -3,6 +3,8 @@ from unittest.mock import Mock, mock_open, patch
 
 import pytest
 
+from chess_io.headers_predicates import HeaderPredicate
+from chess_io.movetext_tokenizer import tokenize_movetext
 from chess_io.pgn_reader import PGNReader
 
 
@@ -105,16 +107,27 @@ def test_load_pngs_from_file_and_process_data_eval_get_openings_names(pgn_reader
     with patch("builtins.open", mock_open(read_data=example_pgn_data_eval)):
         pgn_reader.load_pngs_from_file("dummy_file.pgn")
 
-    # skip reading evaluated games
-    assert pgn_reader.get_openings_names() == []
+    assert pgn_reader.get_openings_names() == ["Sicilian Defense: Old Sicilian"]
 
 
 def test_load_pngs_from_file_and_process_data_eval_get_openings_names_and_moves(pgn_reader, example_pgn_data_eval):
     with patch("builtins.open", mock_open(read_data=example_pgn_data_eval)):
         pgn_reader.load_pngs_from_file("dummy_file.pgn")
 
-    # skip reading evaluated games
-    assert pgn_reader.get_openings_names_and_moves() == ([], [], [])
+    # comments with evaluation and clock, move numbers and glyphs are dropped
+    assert pgn_reader.get_openings_names_and_moves() == (
+        ["Sicilian Defense: Old Sicilian"],
+        [["e4", "Nf3", "Bc4", "c3", "Bb3", "Bc2", "d4", "Qxd3", "e5", "Bg5", "Nbd2", "Bh4", "b3", "0-1"]],
+        [["c5", "Nc6", "e6", "b5", "c4", "a5", "cxd3", "Nf6", "Nd5", "Qc7", "h6", "Ba6", "Nf4"]],
+    )
+
+
+def test_load_pngs_from_file_skipping_evaluated_games(pgn_reader, example_pgn_data_no_eval, example_pgn_data_eval):
+    pgn_reader.set_is_skipping_evaluated_games(True)
+    with patch("builtins.open", mock_open(read_data=example_pgn_data_eval + example_pgn_data_no_eval)):
+        pgn_reader.load_pngs_from_file("dummy_file.pgn")
+
+    assert pgn_reader.get_openings_names() == ["Old Benoni Defense"]
 
 
 def test_filter_games_by_openings_names(pgn_reader):
@@ -157,3 +170,171 @@ def test_filter_games_by_openings_names_empty_pgn_reader(pgn_reader):
 def test_filter_games_by_top_n_openings(pgn_reader_with_openings_names, n, expected_openings):
     pgn_reader_with_openings_names.filter_games_by_top_n_openings(n)
     assert pgn_reader_with_openings_names.get_openings_names() == expected_openings
+
+
+def test_iter_games_yields_games_lazily(pgn_reader, example_pgn_data_no_eval):
+    data = example_pgn_data_no_eval + example_pgn_data_no_eval
+    with patch("builtins.open", mock_open(read_data=data)):
+        games = pgn_reader.iter_games("dummy_file.pgn")
+        first_game = next(games)
+
+        assert first_game.opening_name == "Old Benoni Defense"
+        assert first_game.white_moves == ["d4", "e3", "exd4", "c3", "f4", "Nf3", "Ne5", "Kb3", "0-1"]
+        assert first_game.black_moves == ["c5", "cxd4", "d5", "Nc6", "e5", "e4", "f6", "e3"]
+        assert len(list(games)) == 1
+
+    # nothing is accumulated by the generator itself
+    assert pgn_reader.get_openings_names_and_moves() == ([], [], [])
+
+
+def test_iter_games_uses_loading_filter(pgn_reader, example_pgn_data_no_eval):
+    pgn_reader.set_openings_names_loading_filter(["Benoni"])
+    pgn_reader.set_is_opening_name_a_substring(True)
+
+    games = list(pgn_reader.iter_games_from_lines(example_pgn_data_no_eval.splitlines(keepends=True)))
+
+    assert [game.opening_name for game in games] == ["Benoni"]
+
+
+@pytest.fixture
+def example_pgn_file(tmp_path, example_pgn_data_no_eval, example_pgn_data_eval):
+    filepath = tmp_path / "example.pgn"
+    games = [example_pgn_data_no_eval.replace("Old Benoni Defense", f"Opening {idx}") for idx in range(20)]
+    games.insert(5, example_pgn_data_eval)
+    filepath.write_text("".join(games))
+    return str(filepath)
+
+
+def test_split_file_into_byte_ranges_aligned_on_event(example_pgn_file):
+    ranges = PGNReader.split_file_into_byte_ranges(example_pgn_file, 4)
+
+    with open(example_pgn_file, "rb") as f:
+        data = f.read()
+
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[start:].startswith(b"[Event")
+
+
+def test_load_pngs_from_file_parallel_same_as_sequential(example_pgn_file):
+    sequential_reader = PGNReader()
+    sequential_reader.load_pngs_from_file(example_pgn_file)
+    parallel_reader = PGNReader()
+    parallel_reader.load_pngs_from_file_parallel(example_pgn_file, 3)
+
+    assert len(parallel_reader.get_openings_names()) == 21
+    assert parallel_reader.get_openings_names_and_moves() == sequential_reader.get_openings_names_and_moves()
+
+
+def test_load_pngs_from_files_parallel_keeps_files_order_and_filter(example_pgn_file):
+    pgn_reader = PGNReader()
+    pgn_reader.set_openings_names_loading_filter(["Opening 1"])
+    pgn_reader.set_is_opening_name_a_substring(True)
+    pgn_reader.load_pngs_from_files_parallel([example_pgn_file, example_pgn_file], 2)
+
+    # "Opening 1" and "Opening 10" to "Opening 19" from each file
+    assert pgn_reader.get_openings_names() == ["Opening 1"] * 22
+
+
+def test_iter_games_multiline_movetext(pgn_reader, example_pgn_data_no_eval):
+    data = example_pgn_data_no_eval.replace("4. c3", "\n4. c3").replace("8. Kb3", "\n8. Kb3")
+    games = list(pgn_reader.iter_games_from_lines(data.splitlines(keepends=True)))
+
+    assert games[0].white_moves == ["d4", "e3", "exd4", "c3", "f4", "Nf3", "Ne5", "Kb3", "0-1"]
+    assert games[0].black_moves == ["c5", "cxd4", "d5", "Nc6", "e5", "e4", "f6", "e3"]
+
+
+def test_count_openings_in_file(example_pgn_file):
+    pgn_reader = PGNReader()
+    pgn_reader.set_openings_names_loading_filter(["Opening 1", "Opening 2"])
+    pgn_reader.set_is_opening_name_a_substring(True)
+
+    assert pgn_reader.count_openings_in_file(example_pgn_file) == {"Opening 1": 11, "Opening 2": 1}
+
+
+@pytest.mark.parametrize("movetext", ["0-1", "{ Game abandoned } 1-0", "1. { no move } *", "*"])
+def test_games_without_moves_neither_counted_nor_loaded(tmp_path, example_pgn_data_no_eval, movetext):
+    # "Opening 2" games have no moves, so it must not win the top-1 over "Opening 1"
+    movetext_line = next(line for line in example_pgn_data_no_eval.splitlines() if line.startswith("1. "))
+    games = [example_pgn_data_no_eval.replace("Old Benoni Defense", "Opening 1")]
+    games += [example_pgn_data_no_eval.replace("Old Benoni Defense", "Opening 2").replace(movetext_line, movetext)] * 2
+    filepath = tmp_path / "example.pgn"
+    filepath.write_text("".join(games))
+
+    pgn_reader = PGNReader()
+    assert pgn_reader.count_openings_in_file(str(filepath)) == {"Opening 1": 1}
+    assert [game.opening_name for game in pgn_reader.iter_games(str(filepath))] == ["Opening 1"]
+
+    pgn_reader.load_pngs_from_file_with_top_n_openings(str(filepath), 1)
+    assert pgn_reader.get_openings_names() == ["Opening 1"]
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, sys.maxsize, -1])
+def test_load_pngs_from_file_with_top_n_openings_same_as_filtering_after_loading(example_pgn_file, n):
+    expected_reader = PGNReader()
+    expected_reader.set_openings_names_loading_filter(["Opening 1", "Opening 2", "Opening 3"])
+    expected_reader.set_is_opening_name_a_substring(True)
+    expected_reader.load_pngs_from_file(example_pgn_file)
+    expected_reader.filter_games_by_top_n_openings(n)
+
+    pgn_reader = PGNReader()
+    pgn_reader.set_openings_names_loading_filter(["Opening 1", "Opening 2", "Opening 3"])
+    pgn_reader.set_is_opening_name_a_substring(True)
+    pgn_reader.load_pngs_from_file_with_top_n_openings(example_pgn_file, n)
+
+    assert pgn_reader.get_openings_names_and_moves() == expected_reader.get_openings_names_and_moves()
+
+
+def test_headers_predicates_checked_before_movetext(pgn_reader, example_pgn_data_no_eval):
+    data = example_pgn_data_no_eval + example_pgn_data_no_eval.replace('[WhiteElo "1711"]', '[WhiteElo "1911"]')
+    pgn_reader.set_headers_predicates(
+        [HeaderPredicate("WhiteElo", ">", 1800), HeaderPredicate("Speed", "==", "bullet")]
+    )
+
+    with patch("chess_io.pgn_reader.tokenize_movetext", wraps=tokenize_movetext) as tokenize_mock:
+        games = list(pgn_reader.iter_games_from_lines(data.splitlines(keepends=True)))
+
+    assert len(games) == 1
+    assert tokenize_mock.call_count == 1
+
+
+def test_load_pngs_from_file_resumable_after_failure(example_pgn_file, tmp_path):
+    expected_reader = PGNReader()
+    expected_reader.load_pngs_from_file(example_pgn_file)
+    checkpoint_filepath = str(tmp_path / "checkpoint.json")
+
+    tokenized_games = []
+
+    def failing_tokenize_movetext(movetext):
+        tokenized_games.append(movetext)
+        if len(tokenized_games) == 12:
+            raise KeyboardInterrupt
+        return tokenize_movetext(movetext)
+
+    interrupted_reader = PGNReader()
+    with patch("chess_io.pgn_reader.tokenize_movetext", failing_tokenize_movetext):
+        with pytest.raises(KeyboardInterrupt):
+            interrupted_reader.load_pngs_from_file_resumable(example_pgn_file, checkpoint_filepath, 5)
+
+    resumed_reader = PGNReader()
+    with patch("chess_io.pgn_reader.tokenize_movetext", wraps=tokenize_movetext) as tokenize_mock:
+        resumed_reader.load_pngs_from_file_resumable(example_pgn_file, checkpoint_filepath, 5)
+
+    # 10 games were saved in checkpoints, the remaining 11 were parsed again
+    assert tokenize_mock.call_count == 11
+    assert resumed_reader.get_openings_names_and_moves() == expected_reader.get_openings_names_and_moves()
+    assert list(tmp_path.iterdir()) == [tmp_path / "example.pgn"]
+
+
+def test_load_pngs_from_file_resumable_rejects_checkpoint_of_other_settings(example_pgn_file, tmp_path):
+    checkpoint_filepath = str(tmp_path / "checkpoint.json")
+    with patch("chess_io.pgn_reader.tokenize_movetext", side_effect=[*[(["e4"], ["e5"])] * 5, KeyboardInterrupt]):
+        with pytest.raises(KeyboardInterrupt):
+            PGNReader().load_pngs_from_file_resumable(example_pgn_file, checkpoint_filepath, 5)
+
+    pgn_reader = PGNReader()
+    pgn_reader.set_openings_names_loading_filter(["Opening 1"])
+    with pytest.raises(ValueError):
+        pgn_reader.load_pngs_from_file_resumable(example_pgn_file, checkpoint_filepath, 5)
@@ -0,0 +1,141 @@
+import pickle
+import re
+
+import numpy as np
+import pytest
+
+from chess_io.position_dataset import (
+    PositionDataset,
+    convert_pickle_file_to_dataset_file,
+    decode_position,
+    encode_positions,
+    is_position_dataset_file,
+)
+
+
+def make_position(squares: dict[tuple[int, int], str]) -> list[list[str]]:
+    position = [[" " for _ in range(8)] for _ in range(8)]
+    for (row, column), character in squares.items():
+        position[row][column] = character
+    return position
+
+
+@pytest.fixture
+def sample_database():
+    return [
+        ("Caro-Kann Defense", make_position({(4, 7): "♔", (4, 0): "♚", (6, 2): "♙"})),
+        ("Italian Game", make_position({(4, 7): "♔", (3, 0): "♚", (1, 1): "♟", (0, 0): "♖"})),
+        ("Caro-Kann Defense", make_position({(5, 6): "♔", (4, 0): "♚", (2, 2): "♛", (7, 7): "♜"})),
+    ]
+
+
+def test_encode_and_decode_position(sample_database):
+    squares = encode_positions(position for _, position in sample_database)
+
+    assert squares.shape == (3, 8, 8)
+    assert squares.dtype == np.uint8
+    assert squares[0][6][2] != 0 and squares[0][0][0] == 0
+    assert [decode_position(position_squares) for position_squares in squares] == [p for _, p in sample_database]
+
+
+@pytest.mark.parametrize("character", ["K", "\x05", "♤"])
+def test_encode_positions_unknown_character(sample_database, character):
+    # "\x05" would pass as a square code, "♤" can't be encoded as latin-1
+    positions = [position for _, position in sample_database] + [make_position({(0, 0): character})]
+    with pytest.raises(ValueError, match=re.escape(repr(character))):
+        encode_positions(positions)
+
+
+def test_from_database_interns_labels(sample_database):
+    dataset = PositionDataset.from_database(sample_database)
+
+    assert len(dataset) == 3
+    assert dataset.labels_vocabulary == ["Caro-Kann Defense", "Italian Game"]
+    assert dataset.labels_ids.tolist() == [0, 1, 0]
+    assert dataset.get_label(1) == "Italian Game"
+    assert dataset.to_database() == sample_database
+
+
+def test_save_and_load_from_file_memory_mapped(sample_database, tmp_path):
+    filepath = str(tmp_path / "positions.npos")
+    PositionDataset.from_database(sample_database).save_to_file(filepath)
+
+    dataset = PositionDataset.load_from_file(filepath)
+
+    assert is_position_dataset_file(filepath)
+    assert isinstance(dataset.squares, np.memmap)
+    assert isinstance(dataset.labels_ids, np.memmap)
+    assert dataset.get_position(2) == sample_database[2][1]
+    assert dataset.labels_ids[1:].tolist() == [1, 0]
+    assert dataset.to_database() == sample_database
+
+
+def test_save_and_load_empty_dataset(tmp_path):
+    filepath = str(tmp_path / "positions.npos")
+    PositionDataset.from_database([]).save_to_file(filepath)
+
+    dataset = PositionDataset.load_from_file(filepath)
+
+    assert len(dataset) == 0
+    assert dataset.squares.shape == (0, 8, 8)
+    assert dataset.to_database() == []
+
+
+def test_load_from_file_not_dataset(tmp_path):
+    filepath = tmp_path / "positions.chess"
+    filepath.write_bytes(pickle.dumps([]))
+
+    assert not is_position_dataset_file(str(filepath))
+    with pytest.raises(ValueError):
+        PositionDataset.load_from_file(str(filepath))
+
+
+def test_convert_pickle_file_to_dataset_file(sample_database, tmp_path):
+    pickle_filepath = tmp_path / "positions.chess"
+    pickle_filepath.write_bytes(pickle.dumps(sample_database))
+
+    dataset_filepath = convert_pickle_file_to_dataset_file(str(pickle_filepath))
+
+    assert dataset_filepath == str(pickle_filepath) + ".npos"
+    assert PositionDataset.load_from_file(dataset_filepath).to_database() == sample_database
+
+
+@pytest.mark.parametrize("compression", ["zlib", "lzma"])
+def test_save_and_load_compressed_dataset(sample_database, tmp_path, compression):
+    filepath = str(tmp_path / "positions.npos")
+    PositionDataset.from_database(sample_database * 20).save_to_file(filepath, compression=compression, block_size=100)
+
+    dataset = PositionDataset.load_from_file(filepath)
+
+    assert is_position_dataset_file(filepath)
+    assert dataset.to_database() == sample_database * 20
+
+
+def test_load_slice_from_file(sample_database, tmp_path):
+    plain_filepath = str(tmp_path / "positions.npos")
+    compressed_filepath = str(tmp_path / "positions.z.npos")
+    dataset = PositionDataset.from_database(sample_database * 20)
+    dataset.save_to_file(plain_filepath)
+    dataset.save_to_file(compressed_filepath, compression="zlib", block_size=100)
+
+    for filepath in (plain_filepath, compressed_filepath):
+        assert PositionDataset.load_slice_from_file(filepath, 31, 35).to_database() == dataset.to_database()[31:35]
+        assert PositionDataset.load_slice_from_file(filepath, 58, 100).to_database() == dataset.to_database()[58:]
+        assert len(PositionDataset.load_slice_from_file(filepath, 10, 5)) == 0
+
+
+def test_save_and_load_empty_compressed_dataset(tmp_path):
+    filepath = str(tmp_path / "positions.npos")
+    PositionDataset.from_database([]).save_to_file(filepath, compression="zlib")
+
+    assert len(PositionDataset.load_from_file(filepath)) == 0
+
+
+def test_save_to_file_unknown_compression_keeps_existing_file(sample_database, tmp_path):
+    filepath = str(tmp_path / "positions.npos")
+    dataset = PositionDataset.from_database(sample_database)
+    dataset.save_to_file(filepath)
+
+    with pytest.raises(ValueError):
+        dataset.save_to_file(filepath, compression="zip")
+    assert PositionDataset.load_from_file(filepath).to_database() == sample_database
@@ -0,0 +1,37 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from chess_io.position_dataset import PositionDataset
+from chess_io.position_reader import PositionReader
+
+
+@pytest.fixture
+def sample_database():
+    position = [[" " for _ in range(8)] for _ in range(8)]
+    position[4][7] = "♔"
+    position[4][0] = "♚"
+    return [("Test Opening", position), ("Other Opening", position)]
+
+
+def test_read_from_file_pickle_and_dataset_files(sample_database, tmp_path):
+    pickle_filepath = tmp_path / "positions.chess"
+    pickle_filepath.write_bytes(pickle.dumps(sample_database))
+    dataset_filepath = str(tmp_path / "positions.npos")
+    PositionDataset.from_database(sample_database).save_to_file(dataset_filepath)
+
+    assert PositionReader(str(pickle_filepath)).read_from_file() == sample_database
+    assert PositionReader(dataset_filepath).read_from_file() == sample_database
+
+
+def test_read_dataset_from_file(sample_database, tmp_path):
+    pickle_filepath = tmp_path / "positions.chess"
+    pickle_filepath.write_bytes(pickle.dumps(sample_database))
+    dataset_filepath = str(tmp_path / "positions.npos")
+    PositionDataset.from_database(sample_database).save_to_file(dataset_filepath)
+
+    dataset = PositionReader(dataset_filepath).read_dataset_from_file()
+
+    assert isinstance(dataset.squares, np.memmap)
+    assert dataset.to_database() == PositionReader(str(pickle_filepath)).read_dataset_from_file().to_database()
@@ -0,0 +1,90 @@
+import pickle
+
+import pytest
+
+from chess_io.position_dataset import PositionDataset, get_labels_vocabulary_hash
+from chess_io.position_shards import PositionShardsManifest, ShardedPositionReader
+
+
+def make_position(king_row: int) -> list[list[str]]:
+    position = [[" " for _ in range(8)] for _ in range(8)]
+    position[king_row][7] = "♔"
+    position[4][0] = "♚"
+    return position
+
+
+@pytest.fixture
+def shards_databases():
+    return [
+        [("Italian Game", make_position(0)), ("Caro-Kann Defense", make_position(1))],
+        [("Caro-Kann Defense", make_position(2)), ("English Opening", make_position(3))],
+        [("Italian Game", make_position(4)), ("Italian Game", make_position(5))],
+    ]
+
+
+@pytest.fixture
+def manifest_filepath(tmp_path, shards_databases):
+    manifest_filepath = str(tmp_path / "positions.manifest.json")
+    manifest = PositionShardsManifest(manifest_filepath)
+    for idx, database in enumerate(shards_databases):
+        if idx == 1:
+            shard_filepath = tmp_path / "shards" / f"{idx}.chess"  # pickled shard
+            shard_filepath.parent.mkdir()
+            shard_filepath.write_bytes(pickle.dumps(database))
+            manifest.add_shard(str(shard_filepath))
+        else:
+            shard_filepath = tmp_path / f"{idx}.npos"
+            PositionDataset.from_database(database).save_to_file(str(shard_filepath))
+            manifest.add_shard(str(shard_filepath))
+    manifest.save_to_file()
+    return manifest_filepath
+
+
+def test_manifest_describes_shards(manifest_filepath):
+    manifest = PositionShardsManifest(manifest_filepath)
+    manifest.load_from_file()
+
+    assert len(manifest) == 3
+    assert [shard.filepath for shard in manifest.shards] == ["0.npos", "shards/1.chess", "2.npos"]
+    assert [shard.positions_count for shard in manifest.shards] == [2, 2, 2]
+    assert manifest.shards[2].labels_histogram == {"Italian Game": 2}
+    assert manifest.shards[2].labels_vocabulary_hash == get_labels_vocabulary_hash(["Italian Game"])
+    assert manifest.positions_count == 6
+    assert manifest.labels_histogram == {"Italian Game": 3, "Caro-Kann Defense": 2, "English Opening": 1}
+    assert not manifest.is_labels_vocabulary_shared()
+
+
+def test_manifest_unsupported_version(tmp_path):
+    manifest_filepath = tmp_path / "positions.manifest.json"
+    manifest_filepath.write_text('{"version": 0, "shards": []}')
+
+    with pytest.raises(ValueError):
+        PositionShardsManifest(str(manifest_filepath)).load_from_file()
+
+
+@pytest.mark.parametrize("threads", [None, 1, 3])
+def test_sharded_reader_keeps_manifest_order(manifest_filepath, shards_databases, threads):
+    reader = ShardedPositionReader(manifest_filepath)
+
+    assert len(reader) == 6
+    assert [dataset.to_database() for dataset in reader.iter_datasets(threads)] == shards_databases
+    assert reader.read_from_file(threads) == sum(shards_databases, [])
+
+
+def test_sharded_reader_read_dataset_remaps_labels(manifest_filepath, shards_databases):
+    dataset = ShardedPositionReader(manifest_filepath).read_dataset(threads=2)
+
+    assert dataset.labels_vocabulary == ["Italian Game", "Caro-Kann Defense", "English Opening"]
+    assert dataset.labels_ids.tolist() == [0, 1, 1, 2, 0, 0]
+    assert dataset.to_database() == sum(shards_databases, [])
+
+
+def test_sharded_reader_empty_manifest(tmp_path):
+    manifest = PositionShardsManifest(str(tmp_path / "positions.manifest.json"))
+    manifest.save_to_file()
+
+    reader = ShardedPositionReader(manifest.manifest_filepath)
+
+    assert len(reader) == 0
+    assert len(reader.read_dataset()) == 0
+    assert reader.read_from_file() == []
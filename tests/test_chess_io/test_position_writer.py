@@ -2,6 +2,7 @@ import os
 
 import pytest
 
+from chess_io.position_reader import PositionReader
 from chess_io.position_writer import PositionWriter
 from chess_logic_and_presentation.pieces.king import King
 
@@ -42,3 +43,38 @@ def test_get_position_after_ord(position_writer, sample_pieces):
 
     assert position[4][7] == ord(pieces_white[0][0].character_representation)
     assert position[4][0] == ord(pieces_black[0][0].character_representation)
+
+
+def test_save_to_file_appending_writes_only_new_positions(tmp_path, sample_opening_name, sample_pieces):
+    pieces_white, pieces_black = sample_pieces
+    filepath = tmp_path / "positions.chess"
+    filepath.write_bytes(b"previous run")
+    position_writer = PositionWriter(str(filepath), is_appending=True)
+
+    position_writer.save_position(sample_opening_name, pieces_white, pieces_black)
+    position_writer.save_to_file()
+    first_chunk_size = filepath.stat().st_size
+
+    assert position_writer.database == []
+    position_writer.save_to_file()  # nothing new to save
+    assert filepath.stat().st_size == first_chunk_size
+
+    position_writer.save_position("Other Opening", pieces_white, pieces_black)
+    position_writer.save_position(sample_opening_name, pieces_white, pieces_black)
+    position_writer.save_to_file()
+
+    database = PositionReader(str(filepath)).read_from_file()
+    assert position_writer.saved_positions_count == 3
+    assert [opening_name for opening_name, _ in database] == [
+        sample_opening_name,
+        "Other Opening",
+        sample_opening_name,
+    ]
+    assert database[0][1] == PositionWriter("").get_position_string(pieces_white, pieces_black)
+
+
+def test_save_to_file_appending_creates_empty_file(tmp_path):
+    filepath = tmp_path / "positions.chess"
+    PositionWriter(str(filepath), is_appending=True).save_to_file()
+
+    assert PositionReader(str(filepath)).read_from_file() == []
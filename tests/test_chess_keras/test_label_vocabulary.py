@@ -0,0 +1,96 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from chess_io.position_dataset import PositionDataset, get_labels_vocabulary_hash
+from chess_keras.label_vocabulary import LabelVocabulary
+from chess_keras.opening_encoder import get_label_encoded_unique_openings_names
+
+
+@pytest.fixture
+def openings_names():
+    return ["Italian Game", "Caro-Kann Defense", "Italian Game", "English Opening", "Caro-Kann Defense"]
+
+
+def test_from_labels_sorted_unique(openings_names):
+    vocabulary = LabelVocabulary.from_labels(openings_names)
+
+    assert vocabulary.labels == ["Caro-Kann Defense", "English Opening", "Italian Game"]
+    assert vocabulary.encode("Italian Game") == 2
+    assert vocabulary.decode(1) == "English Opening"
+    assert "English Opening" in vocabulary
+    assert "Sicilian Defense" not in vocabulary
+    assert get_label_encoded_unique_openings_names(openings_names) == [
+        ("Caro-Kann Defense", 0),
+        ("English Opening", 1),
+        ("Italian Game", 2),
+    ]
+
+
+def test_encode_unknown_label(openings_names):
+    vocabulary = LabelVocabulary.from_labels(openings_names)
+
+    with pytest.raises(ValueError):
+        vocabulary.encode("Sicilian Defense")
+    with pytest.raises(ValueError, match="Sicilian Defense"):
+        vocabulary.encode_many(["Italian Game", "Sicilian Defense"])
+
+
+def test_encode_and_decode_many(openings_names):
+    vocabulary = LabelVocabulary.from_labels(openings_names)
+
+    labels_ids = vocabulary.encode_many(openings_names)
+
+    assert labels_ids.dtype == np.int32
+    assert labels_ids.tolist() == [2, 0, 2, 1, 0]
+    assert vocabulary.decode_many(labels_ids) == openings_names
+    assert vocabulary.encode_many([]).tolist() == []
+    assert vocabulary.encode_many(np.array(openings_names)).tolist() == [2, 0, 2, 1, 0]
+
+
+def test_encode_dataset_labels(openings_names):
+    position = [[" " for _ in range(8)] for _ in range(8)]
+    dataset = PositionDataset.from_database([(name, position) for name in openings_names])
+    vocabulary = LabelVocabulary.from_labels(openings_names)
+
+    assert dataset.labels_vocabulary != vocabulary.labels
+    assert vocabulary.encode_dataset_labels(dataset).tolist() == [2, 0, 2, 1, 0]
+
+
+def test_add_keeps_ids():
+    vocabulary = LabelVocabulary(["B", "A"])
+
+    assert vocabulary.add("A") == 1
+    assert vocabulary.add("C") == 2
+    assert vocabulary.to_encoded_pairs() == [("B", 0), ("A", 1), ("C", 2)]
+    assert vocabulary.get_hash() == get_labels_vocabulary_hash(["B", "A", "C"])
+
+
+def test_from_encoded_pairs():
+    assert LabelVocabulary.from_encoded_pairs([("A", 1), ("B", 0)]).labels == ["B", "A"]
+    with pytest.raises(ValueError):
+        LabelVocabulary.from_encoded_pairs([("A", 0), ("B", 2)])
+
+
+def test_save_and_load_from_file(openings_names, tmp_path):
+    filepath = str(tmp_path / "openings.json")
+    vocabulary = LabelVocabulary(["Sicilian Defense: Old Sicilian", "Caro-Kann Defense"])
+    vocabulary.save_to_file(filepath)
+
+    assert LabelVocabulary.load_from_file(filepath) == vocabulary
+
+
+def test_load_from_file_pickled_encoded_pairs(openings_names, tmp_path):
+    filepath = tmp_path / "openings.o"
+    filepath.write_bytes(pickle.dumps(get_label_encoded_unique_openings_names(openings_names)))
+
+    assert LabelVocabulary.load_from_file(str(filepath)) == LabelVocabulary.from_labels(openings_names)
+
+
+def test_load_from_file_corrupted(tmp_path):
+    filepath = tmp_path / "openings.json"
+    filepath.write_text('{"version": 1, "hash": "0", "labels": ["A"]}')
+
+    with pytest.raises(ValueError):
+        LabelVocabulary.load_from_file(str(filepath))
@@ -44,3 +44,15 @@ def test_split_to_train_and_test_content(split_data_mixin, monkeypatch, sample_x
     assert np.array_equal(y_train, y_train_expected)
     assert np.array_equal(x_test, x_test_expected)
     assert np.array_equal(y_test, y_test_expected)
+
+
+def test_split_weights_to_train_and_test_same_split(split_data_mixin, monkeypatch, sample_x_y):
+    x, y = sample_x_y
+    weights = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    monkeypatch.setattr(np.random, "uniform", lambda a, b: 0.5)
+
+    x_train, _, x_test, _ = split_data_mixin.split_to_train_and_test(x, y, len(x))
+    weights_train, weights_test = split_data_mixin.split_weights_to_train_and_test(weights, len(x))
+
+    assert np.array_equal(weights_train, np.array(x_train, dtype=float))
+    assert np.array_equal(weights_test, np.array(x_test, dtype=float))
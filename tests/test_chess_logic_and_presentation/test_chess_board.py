@@ -0,0 +1,220 @@
+import subprocess
+import sys
+
+import pytest
+
+from chess_logic_and_presentation.chess_board import Board
+from chess_logic_and_presentation.square_tables import get_square_index
+
+
+@pytest.fixture
+def board():
+    return Board()
+
+
+def get_pieces_notations(pieces: list[list]) -> set[str]:
+    return {str(piece) + piece.position_notation for pieces_arr in pieces for piece in pieces_arr}
+
+
+def test_board_does_not_import_pygame():
+    code = "import sys, chess_logic_and_presentation.chess_board; print('pygame' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_make_moves_and_reset_game(board):
+    for move in ["e4", "e5", "Nf3", "Nc6", "Bb5", "a6", "Bxc6", "dxc6", "O-O"]:
+        board.make_move(move)
+
+    assert not board.is_white_moving
+    assert board.last_move_from_to == ("e1", "h1")
+    assert get_pieces_notations([board.king_white, board.rooks_white]) == {"♔g1", "♖f1", "♖a1"}
+    assert "♗c6" not in get_pieces_notations(board.pieces_white)
+    assert len(board.bishops_white) == 1 and len(board.pawns_black) == 8
+
+    board.reset_game()
+
+    assert board.is_white_moving
+    assert board.last_move_from_to is None
+    assert get_pieces_notations(board.pieces_white) == get_pieces_notations(Board().pieces_white)
+
+
+def test_illegal_move(board):
+    with pytest.raises(ValueError):
+        board.make_move("Nc4")
+
+
+def test_squares_follow_captures_en_passant_and_promotion(board):
+    for move in ["e4", "d5", "e5", "f5", "exf6", "Nc6", "fxg7", "Bf5", "gxh8=Q", "Qd7"]:
+        board.make_move(move)
+
+    occupied_squares = {piece.position_notation: piece for piece in board.squares if piece is not None}
+    assert occupied_squares == {
+        piece.position_notation: piece
+        for pieces_arr in board.pieces_white + board.pieces_black
+        for piece in pieces_arr
+    }
+    assert len(occupied_squares) == 29
+    assert str(board.get_piece_at("h8")) == "♕" and board.get_piece_at("h8") in board.queen_white
+    assert board.get_piece_at("f5") in board.bishops_black
+    assert board.get_piece_at("e5") is None and board.get_piece_at("f6") is None and board.get_piece_at("g7") is None
+    assert len(board.pawns_white) == 7 and len(board.rooks_black) == 1
+
+
+def test_is_collision_found(board):
+    assert board.is_collision_found("a1", "a3")
+    assert not board.is_collision_found("a2", "a6")
+    assert board.is_collision_found("c1", "e3")
+    assert not board.is_collision_found("c1", "d2")
+
+
+def test_make_move_skips_pinned_piece(board):
+    # knight on c3 is pinned by the bishop on b4, so "Ne2" is played by the knight from g1
+    for move in ["d4", "e5", "e4", "Bb4+", "Nc3", "Nf6", "Ne2"]:
+        board.make_move(move)
+
+    assert board.last_move_from_to == ("g1", "e2")
+    assert str(board.get_piece_at("c3")) == "♘"
+
+
+def test_make_move_with_ambiguity_help(board):
+    for move in ["Nf3", "d5", "d4", "Nf6", "Nbd2"]:
+        board.make_move(move)
+
+    assert board.last_move_from_to == ("b1", "d2")
+
+
+def test_get_pinned_pieces_cleared_after_move(board):
+    for move in ["d4", "e5", "e4", "Bb4+", "Nc3", "Nf6"]:
+        board.make_move(move)
+
+    assert board.get_pinned_pieces(True) == {get_square_index("c3"): (-1, 1)}
+    assert board.get_pinned_pieces(False) == {}
+    knight = board.get_piece_at("c3")
+    assert knight.is_being_pinned_and_move_forbidden(board, get_square_index("e2"))
+
+    board.make_move("Bd2")
+
+    assert board.get_pinned_pieces(True) == {}
+    assert not knight.is_being_pinned_and_move_forbidden(board, get_square_index("e2"))
+
+
+def test_pinned_piece_moves_along_pin_line(board):
+    for move in ["e4", "e5", "d4", "Bb4+", "Bd2"]:
+        board.make_move(move)
+
+    bishop = board.get_piece_at("d2")
+    assert board.get_pinned_pieces(True) == {get_square_index("d2"): (-1, 1)}
+    assert not bishop.is_being_pinned_and_move_forbidden(board, get_square_index("c3"))
+    assert not bishop.is_being_pinned_and_move_forbidden(board, get_square_index("b4"))
+    assert bishop.is_being_pinned_and_move_forbidden(board, get_square_index("e3"))
+
+
+def get_board_state(board: Board) -> tuple:
+    squares = tuple(None if piece is None else str(piece) + piece.position_notation for piece in board.squares)
+    pieces = get_pieces_notations(board.pieces_white + board.pieces_black)
+    return squares, pieces, board.is_white_moving, board.last_move_from_to
+
+
+def test_undo_moves_back_to_start(board):
+    # captures, castle, en passant and promotion undone one by one
+    moves = ["e4", "d5", "exd5", "Nf6", "Nf3", "e5", "dxe6", "Bd6", "exf7+", "Ke7", "Be2", "Rg8", "O-O", "Kd7"]
+    moves += ["fxg8=N", "Bxh2+"]
+    states = [get_board_state(board)]
+    for move in moves:
+        board.make_move(move)
+        states.append(get_board_state(board))
+
+    assert board.made_moves_count == len(moves)
+    assert len(board.knights_white) == 3 and str(board.get_piece_at("g8")) == "♘"
+
+    for state in reversed(states[:-1]):
+        board.undo_move()
+        assert get_board_state(board) == state
+
+    assert board.made_moves_count == 0
+    with pytest.raises(ValueError):
+        board.undo_move()
+
+
+def test_undo_restores_en_passant(board):
+    for move in ["e4", "a6", "e5", "d5"]:
+        board.make_move(move)
+    board.make_move("exd6")
+    board.undo_move()
+    board.make_move("exd6")
+
+    assert board.get_piece_at("d5") is None and str(board.get_piece_at("d6")) == "♙"
+
+
+def test_snapshot_and_restore(board):
+    for move in ["e4", "e5", "Nf3", "Nc6"]:
+        board.make_move(move)
+    snapshot = board.snapshot()
+    state = get_board_state(board)
+
+    for move in ["Bb5", "a6", "Bxc6", "dxc6", "O-O"]:
+        board.make_move(move)
+    board.restore(snapshot)
+
+    assert get_board_state(board) == state
+    assert board.made_moves_count == 4
+
+    # other branch from the same position, the restored board can still undo to the start
+    for move in ["Bc4", "Bc5", "O-O"]:
+        board.make_move(move)
+    assert board.last_move_from_to == ("e1", "h1")
+    board.restore(snapshot)
+    for _ in range(4):
+        board.undo_move()
+    assert get_board_state(board) == get_board_state(Board())
+
+
+def get_zobrist_key(moves: list[str]) -> int:
+    board = Board()
+    for move in moves:
+        board.make_move(move)
+    return board.zobrist_key
+
+
+def test_zobrist_key_of_transpositions():
+    assert get_zobrist_key(["Nf3", "Nf6", "Nc3", "Nc6"]) == get_zobrist_key(["Nc3", "Nc6", "Nf3", "Nf6"])
+    assert get_zobrist_key(["Nf3", "Nf6", "Ng1", "Ng8"]) == Board().zobrist_key
+    # same pieces, other side to move after the white queen went round a triangle
+    assert get_zobrist_key(["e4", "e5", "Qf3", "Qe7", "Qe2", "Qd8", "Qd1"]) != get_zobrist_key(
+        ["e4", "e5", "Qe2", "Qe7", "Qd1", "Qd8"]
+    )
+
+
+def test_zobrist_key_of_castling_rights():
+    # rooks are back on their squares, castling is no longer possible
+    assert get_zobrist_key(["Nf3", "Nf6", "Rg1", "Rg8", "Rh1", "Rh8"]) != get_zobrist_key(["Nf3", "Nf6"])
+    assert get_zobrist_key(["e4", "e5", "Ke2", "Ke7", "Ke1", "Ke8"]) != get_zobrist_key(["e4", "e5"])
+    assert get_zobrist_key(["e4", "e5", "Ke2", "Ke7", "Ke1", "Ke8"]) == get_zobrist_key(
+        ["e4", "e5", "Ke2", "Ke7", "Ke1", "Ke8", "Nf3", "Nf6", "Ng1", "Ng8"]
+    )
+
+
+def test_zobrist_key_of_en_passant():
+    # en passant on d6 is possible only right after d5
+    assert get_zobrist_key(["e4", "a6", "e5", "d5"]) != get_zobrist_key(["e4", "d5", "e5", "a6"])
+    # no pawn can take en passant, the square doesn't count
+    assert get_zobrist_key(["e4", "e5"]) == get_zobrist_key(["e3", "e6", "e4", "e5"])
+
+
+def test_zobrist_key_of_promotion_and_undo(board):
+    moves = ["e4", "d5", "exd5", "Nf6", "Nf3", "e5", "dxe6", "Bd6", "exf7+", "Ke7", "Be2", "Rg8", "O-O", "Kd7"]
+    keys = [board.zobrist_key]
+    for move in moves + ["fxg8=N"]:
+        board.make_move(move)
+        keys.append(board.zobrist_key)
+    snapshot = board.snapshot()
+
+    assert len(set(keys)) == len(keys)
+    assert get_zobrist_key(moves + ["fxg8=Q"]) != keys[-1]
+
+    for key in reversed(keys[:-1]):
+        board.undo_move()
+        assert board.zobrist_key == key
+    board.restore(snapshot)
+    assert board.zobrist_key == keys[-1]
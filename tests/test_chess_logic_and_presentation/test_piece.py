@@ -0,0 +1,35 @@
+import pytest
+
+from chess_logic_and_presentation.pieces.king import King
+from chess_logic_and_presentation.pieces.knight import Knight
+from chess_logic_and_presentation.square_tables import get_square_index
+
+
+def test_piece_square_index_and_notation():
+    knight = Knight("g1", True)
+
+    assert knight.square_index == get_square_index("g1") == Knight(6, True).square_index
+    assert knight.position_notation == "g1"
+    assert knight.convert_position_notation_to_image_position_indices() == (7, 6)
+    assert str(knight) == knight.character_representation == "♘"
+
+    knight.position_notation = "f3"
+
+    assert knight.square_index == get_square_index("f3")
+
+
+def test_piece_is_slotted():
+    king = King("e8", False)
+
+    assert not king.is_white
+    assert not hasattr(king, "__dict__")
+    with pytest.raises(AttributeError):
+        king.image = None
+
+
+@pytest.mark.parametrize(
+    "ambiguity_help, is_matching",
+    [(None, True), ("b", True), ("d", False), ("1", True), ("8", False), ("b1", True), ("b8", False)],
+)
+def test_is_matching_ambiguity_help(ambiguity_help, is_matching):
+    assert Knight("b1", True).is_matching_ambiguity_help(ambiguity_help) == is_matching
@@ -0,0 +1,32 @@
+from chess_logic_and_presentation.square_tables import (
+    KING_TARGETS,
+    KNIGHT_TARGETS,
+    RAYS,
+    SQUARES_COUNT,
+    get_square_index,
+    get_square_notation,
+)
+
+
+def get_notations(squares_indices: tuple[int, ...]) -> set[str]:
+    return {get_square_notation(square_index) for square_index in squares_indices}
+
+
+def test_square_index_and_notation():
+    assert get_square_index("a1") == 0 and get_square_index("h1") == 7 and get_square_index("h8") == 63
+    assert all(get_square_index(get_square_notation(idx)) == idx for idx in range(SQUARES_COUNT))
+
+
+def test_knight_and_king_targets():
+    assert get_notations(KNIGHT_TARGETS[get_square_index("a1")]) == {"b3", "c2"}
+    assert len(KNIGHT_TARGETS[get_square_index("e4")]) == 8
+    assert get_notations(KING_TARGETS[get_square_index("h8")]) == {"g8", "g7", "h7"}
+    assert len(KING_TARGETS[get_square_index("d5")]) == 8
+
+
+def test_rays_nearest_first_until_edge():
+    rays = RAYS[get_square_index("c3")]
+    assert [get_square_notation(idx) for idx in rays[(1, 1)]] == ["d4", "e5", "f6", "g7", "h8"]
+    assert [get_square_notation(idx) for idx in rays[(-1, 0)]] == ["b3", "a3"]
+    assert rays[(-1, -1)] == (get_square_index("b2"), get_square_index("a1"))
+    assert RAYS[get_square_index("h8")][(0, 1)] == ()
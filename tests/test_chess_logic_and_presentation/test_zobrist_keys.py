@@ -0,0 +1,28 @@
+from chess_logic_and_presentation.square_tables import get_square_index
+from chess_logic_and_presentation.zobrist_keys import (
+    ALL_CASTLING_RIGHTS,
+    BLACK_MOVING_KEY,
+    CASTLING_BLACK_QUEENSIDE,
+    CASTLING_RIGHTS_KEPT,
+    CASTLING_RIGHTS_KEYS,
+    CASTLING_WHITE_KINGSIDE,
+    CASTLING_WHITE_QUEENSIDE,
+    ENPASSANT_COLUMNS_KEYS,
+    PIECES_SQUARES_KEYS,
+)
+
+
+def test_keys_are_unique_64_bit_numbers():
+    keys = [key for squares_keys in PIECES_SQUARES_KEYS.values() for key in squares_keys]
+    keys += list(CASTLING_RIGHTS_KEYS) + list(ENPASSANT_COLUMNS_KEYS) + [BLACK_MOVING_KEY]
+    assert len(keys) == 12 * 64 + 16 + 8 + 1
+    assert len(set(keys)) == len(keys)
+    assert all(0 <= key < 2**64 for key in keys)
+    assert "PAWN_WHITE" in PIECES_SQUARES_KEYS and "KING_BLACK" in PIECES_SQUARES_KEYS
+
+
+def test_castling_rights_kept():
+    assert CASTLING_RIGHTS_KEPT[get_square_index("h1")] == ALL_CASTLING_RIGHTS & ~CASTLING_WHITE_KINGSIDE
+    assert CASTLING_RIGHTS_KEPT[get_square_index("a8")] == ALL_CASTLING_RIGHTS & ~CASTLING_BLACK_QUEENSIDE
+    assert CASTLING_RIGHTS_KEPT[get_square_index("e8")] == CASTLING_WHITE_KINGSIDE | CASTLING_WHITE_QUEENSIDE
+    assert CASTLING_RIGHTS_KEPT[get_square_index("e4")] == ALL_CASTLING_RIGHTS